@@ -1,17 +1,43 @@
+from __future__ import annotations
+
+import argparse
+import collections
+import concurrent.futures
+import contextlib
 import datetime as dt
+import importlib
 import logging
+import os
 import random
+import sys
+import uuid
 from collections import defaultdict
-from typing import Any, Union, List, Dict, Optional, Tuple
+from typing import Any, Union, List, Dict, Iterator, Optional, Tuple
 
-import dateparser
 import numpy as np
-import pandas as pd
-from faker import Faker
 
 import config_init
-
-fake = Faker()
+from date_parsing import parse_date
+from distributions import sample_categories, sample_truncated
+from keyed_random import (STREAM_ACTIVITY_ATTRIBUTES, STREAM_ACTIVITY_DURATIONS, STREAM_CASE_ATTRIBUTES,
+                          STREAM_CASE_DATES, STREAM_CASE_VARIANTS, STREAM_EVENT_ATTRIBUTES, STREAM_EVENT_DURATIONS,
+                          STREAM_EVENT_OBJECTS, STREAM_OBJECT_ATTRIBUTES, STREAM_OBJECT_RELATIONS, case_random)
+from lazy_modules import lazy_import
+from value_pools import POOL_PROVIDERS, configure_value_pools, get_value_pool, sample_value_pool
+from working_calendar import (NS_PER_DAY, NS_PER_HOUR, NS_PER_MILLISECOND, NS_PER_MINUTE, NS_PER_SECOND,
+                              WorkingCalendar, convert_working_schedule_days, get_working_calendar)
+
+# pandas is loaded by the first generation stage that uses it
+pd = lazy_import('pandas')
+
+# Length of each duration unit of measure in nanoseconds
+DURATION_UOM_NS = {'days': NS_PER_DAY, 'hours': NS_PER_HOUR, 'minutes': NS_PER_MINUTE, 'seconds': NS_PER_SECOND}
+# Step and number of steps of the random start offset within each duration unit of measure
+START_OFFSET_UOM_NS = {'days': (NS_PER_HOUR, 24), 'hours': (NS_PER_MINUTE, 60), 'minutes': (NS_PER_SECOND, 60),
+                       'seconds': (NS_PER_MILLISECOND, 1000)}
+# Maximum relative change of numeric values and probability of redrawing categorical values per adjustment type
+ADJUSTMENT_CHANGE = {'slight_change': 0.10, 'moderate_change': 0.30, 'significant_change': 1.00}
+ADJUSTMENT_PROBABILITY = {'slight_change': 0.20, 'moderate_change': 0.50, 'significant_change': 1.00}
 
 
 def initial_capitals(name: str) -> str:
@@ -42,12 +68,11 @@ def generate_timestamp(start: Union[dt.date, dt.datetime], end: Union[dt.date, d
         datetime: A randomly generated timestamp within the specified range.
     """
     try:
-        if isinstance(start, str) and not isinstance(start, dt.datetime):
-            start = dateparser.parse(start)
+        start, end = parse_date(start), parse_date(end)
+        if not isinstance(start, dt.datetime):
             start = dt.datetime.combine(start, dt.time.min)
-        if isinstance(end, str) and not isinstance(end, dt.datetime):
-            end = dateparser.parse(end)
-            end = dt.datetime.combine(end, dt.time.max).replace(microsecond=999999)
+        if not isinstance(end, dt.datetime):
+            end = dt.datetime.combine(end, dt.time.max)
 
         delta = (end - start).total_seconds()
 
@@ -69,36 +94,6 @@ def generate_timestamp(start: Union[dt.date, dt.datetime], end: Union[dt.date, d
         raise
 
 
-# Sample utility function to convert working schedule days from string to datetime format
-def convert_working_schedule_days(days: List[str]) -> List[int]:
-    """
-    Convert a list of working days from string format to datetime weekday format.
-
-    Args:
-        days (list): List of working days in string format.
-
-    Returns:
-        list: List of working days in datetime weekday format.
-    """
-    days_map = {
-        'Monday': 0, 'Tuesday': 1, 'Wednesday': 2, 'Thursday': 3, 'Friday': 4,
-        'Saturday': 5, 'Sunday': 6, 'workdays': [0, 1, 2, 3, 4], 'weekend': [5, 6],
-        'Mon': 0, 'Tue': 1, 'Wed': 2, 'Thu': 3, 'Fri': 4, 'Sat': 5, 'Sun': 6
-    }
-    if not days:
-        return []
-    if isinstance(days, list):
-        try:
-            converted_days = [days_map[day] if isinstance(days_map[day], int) else days_map[day] for day in days]
-            flattened_days = [item for sublist in converted_days for item in
-                              (sublist if isinstance(sublist, list) else [sublist])]
-            return list(set(flattened_days))  # Remove duplicates
-        except KeyError as e:
-            logging.error(f"Unrecognized day in working schedule: {e}")
-            return []
-    return []
-
-
 def is_working_time(start_time: dt.datetime, working_days: List[int], working_hours: List[int]) -> bool:
     """
     Check if the given time is within the working schedule.
@@ -118,7 +113,7 @@ def is_working_time(start_time: dt.datetime, working_days: List[int], working_ho
 
 
 def adjust_to_working_schedule(start_date: dt.datetime, end_date: dt.datetime, working_days: List[str],
-                               working_hours: List[int]) -> Tuple[dt.datetime, dt.datetime]:
+                               working_hours: List[int], **calendar_options) -> Tuple[dt.datetime, dt.datetime]:
     """
     Adjust the start and end time to fit within the working schedule.
 
@@ -126,55 +121,75 @@ def adjust_to_working_schedule(start_date: dt.datetime, end_date: dt.datetime, w
         start_date (datetime): Original start date.
         end_date (datetime): Original end date.
         working_days (list): List of working days.
-        working_hours (list): Start and end working hours.
+        working_hours (list): Start and end working hours, or a list of such ranges for multiple shifts.
+        **calendar_options: Holidays, timezone and horizon of the schedule, see get_calendar_options.
 
     Returns:
         tuple: Adjusted start and end time within the working schedule.
     """
     try:
-        working_days = convert_working_schedule_days(working_days)
-        if not working_days or not working_hours:
+        calendar = get_working_calendar(working_days, working_hours, **calendar_options)
+        if calendar is None:
             return start_date, end_date
 
-        working_hours = sorted(working_hours)  # Ensure working hours are in order
-        if len(working_hours) == 1:
-            working_hours = [working_hours[0], 24]  # Assume end of the day if only start is given
+        start_dates, end_dates = calendar.adjust(np.array([to_datetime64(start_date)]),
+                                                 np.array([to_datetime64(end_date)]))
+        return pd.Timestamp(start_dates[0]).to_pydatetime(), pd.Timestamp(end_dates[0]).to_pydatetime()
 
-        duration_seconds = (end_date - start_date).total_seconds()
-        working_hours_per_day = (working_hours[1] - working_hours[0]) * 3600
-        if working_hours_per_day <= 0:
-            logging.error("Invalid working hours range")
-            return start_date, end_date
+    except Exception as e:
+        logging.error(f"Error adjusting to working schedule: {e}")
+        raise
 
-        def next_valid_start_time(current_time: dt.datetime) -> dt.datetime:
-            if current_time.hour >= working_hours[1] or current_time.hour < working_hours[0]:
-                current_time = current_time.replace(hour=working_hours[0])
-                current_time += dt.timedelta(days=1)
-            while current_time.weekday() not in working_days:
-                current_time += dt.timedelta(days=1)
-            return current_time
-
-        def add_working_duration(start_time: dt.datetime, duration: float) -> dt.datetime:
-            end_time = start_time
-            while duration > 0:
-                if is_working_time(end_time, working_days, working_hours):
-                    available_time = min((end_time.replace(hour=working_hours[1]) - end_time).total_seconds(), duration)
-                    end_time += dt.timedelta(seconds=available_time)
-                    duration -= available_time
-                else:
-                    end_time = next_valid_start_time(end_time)
-            return end_time
 
-        start_date = next_valid_start_time(start_date)
-        end_date = add_working_duration(start_date, duration_seconds)
+def adjust_to_working_schedule_array(start_dates: np.ndarray, end_dates: np.ndarray, working_days: List[str],
+                                     working_hours: List[int], **calendar_options) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Adjust arrays of start and end times to fit within the working schedule.
+
+    Args:
+        start_dates (np.ndarray): Original start dates as datetime64[ns].
+        end_dates (np.ndarray): Original end dates as datetime64[ns].
+        working_days (list): List of working days.
+        working_hours (list): Start and end working hours, or a list of such ranges for multiple shifts.
+        **calendar_options: Holidays, timezone and horizon of the schedule, see get_calendar_options.
 
-        return start_date, end_date
+    Returns:
+        tuple: Adjusted start and end dates as datetime64[ns] arrays.
+    """
+    try:
+        calendar = get_working_calendar(working_days, working_hours, **calendar_options)
+        if calendar is None:
+            return np.asarray(start_dates, dtype='datetime64[ns]'), np.asarray(end_dates, dtype='datetime64[ns]')
+        return calendar.adjust(start_dates, end_dates)
 
     except Exception as e:
         logging.error(f"Error adjusting to working schedule: {e}")
         raise
 
 
+def get_calendar_options(process_config_data: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+    """
+    Collect the process level working calendar options (holidays, timezone, horizon, cache) per process ID.
+
+    Args:
+        process_config_data (dict): Dictionary containing process configuration.
+
+    Returns:
+        dict: Keyword arguments for get_working_calendar keyed by process ID.
+    """
+    return {
+        process['process_id']: {
+            'holidays': process.get('holidays', []),
+            'timezone': process.get('timezone'),
+            'start_date': process.get('start_date'),
+            'end_date': process.get('end_date'),
+            'cache_dir': process_config_data.get('calendar_cache_dir')
+        }
+        for process in process_config_data['processes'].values()
+        if isinstance(process, dict) and 'process_id' in process
+    }
+
+
 def generate_random_start_time_within_uom(start_date: dt.datetime, duration_uom: str) -> dt.datetime:
     """
     Generate a random start time within the duration unit of measure.
@@ -214,31 +229,94 @@ def generate_timestamps(start: Union[str, dt.datetime], end: Union[str, dt.datet
         list: A list of randomly generated timestamps within the specified range, ordered as specified.
     """
     try:
-        if isinstance(start, str):
-            start = dateparser.parse(start)
-            start = dt.datetime.combine(start, dt.time.min)
-        if isinstance(end, str):
-            end = dateparser.parse(end)
-            end = dt.datetime.combine(end, dt.time.max).replace(microsecond=999999)
+        timestamps = generate_timestamp_array(start, end, distribution, amount, orders)
+        return list(pd.DatetimeIndex(timestamps).to_pydatetime())
+
+    except Exception as e:
+        logging.error(f"Error generating timestamps: {str(e)}")
+        raise
+
+
+def to_datetime64(value: Any, end_of_day: bool = False) -> Union[np.datetime64, np.ndarray]:
+    """
+    Convert a date, datetime, string or array of those to nanosecond precision NumPy datetimes.
+
+    Args:
+        value (Any): The value to convert. Strings are parsed with parse_date.
+        end_of_day (bool): Whether a date without a time should point to the last instant of that day.
+
+    Returns:
+        Union[np.datetime64, np.ndarray]: The converted datetime64[ns] scalar or array.
+    """
+    value = parse_date(value)
+    if isinstance(value, dt.date) and not isinstance(value, dt.datetime):
+        value = dt.datetime.combine(value, dt.time.max if end_of_day else dt.time.min)
+    if isinstance(value, (np.ndarray, pd.Series, pd.Index, list)):
+        return np.asarray(pd.to_datetime(value), dtype='datetime64[ns]')
+    return np.datetime64(pd.Timestamp(value).to_datetime64(), 'ns')
+
+
+def generate_timestamp_array(start: Any, end: Any, distribution: str = 'uniform', amount: int = 1,
+                             orders: Optional[List[int]] = None, sort: bool = True, rng: Any = None) -> np.ndarray:
+    """
+    Generate many timestamps in one batch within a given date range based on a specified distribution.
+
+    All offsets are drawn with a single NumPy call and clipped in place to the range, so the cost per
+    timestamp is a few array operations instead of a Python call.
+
+    Args:
+        start (Any): The start of the date range. A scalar or an array with one start per timestamp.
+        end (Any): The end of the date range. A scalar or an array with one end per timestamp.
+        distribution (str): The type of distribution to use. Options are 'uniform', 'normal', 'exponential', 'pareto'.
+        amount (int): Number of timestamps to generate.
+        orders (list): Optional list of orders; the timestamp at position i gets rank orders[i] in time.
+        sort (bool): Whether to return the timestamps sorted. Must stay False when start or end are arrays
+            whose positions have to line up with the result.
+        rng (Any, optional): Random source with the np.random interface, e.g. a CaseRandom. Defaults to np.random.
 
-        timestamps = [generate_timestamp(start, end, distribution) for _ in range(amount)]
+    Returns:
+        np.ndarray: A datetime64[ns] array of generated timestamps.
+    """
+    try:
+        start = to_datetime64(start)
+        end = to_datetime64(end, end_of_day=True)
+        delta = (end - start).astype('int64').astype('float64')
+        rng = np.random if rng is None else rng
+
+        if distribution == 'uniform':
+            offsets = rng.uniform(0, 1, amount) * delta
+        elif distribution == 'normal':
+            offsets = rng.normal(0, 1, amount) * (delta / 6) + delta / 2
+        elif distribution == 'exponential':
+            offsets = rng.exponential(1, amount) * (delta / 2)
+        elif distribution == 'pareto':
+            offsets = (rng.pareto(3, amount) + 1) * (delta / 4)
+        else:
+            raise ValueError("Unsupported distribution type")
+
+        np.clip(offsets, 0, delta, out=offsets)  # Ensure offsets are within the range
+        timestamps = start + offsets.astype('int64').astype('timedelta64[ns]')
 
-        if orders:
+        if orders is not None:
             if len(orders) != amount:
                 raise ValueError("Length of orders must match the amount of timestamps to generate.")
-            ordered_timestamps = sorted(zip(orders, timestamps))
-            return [timestamp for _, timestamp in ordered_timestamps]
+            timestamps.sort()
+            ranks = np.empty(amount, dtype=np.int64)
+            ranks[np.argsort(np.asarray(orders), kind='stable')] = np.arange(amount)
+            return timestamps[ranks]
 
-        return sorted(timestamps)
+        if sort:
+            timestamps.sort()
+        return timestamps
 
     except Exception as e:
-        logging.error(f"Error generating timestamps: {str(e)}")
+        logging.error(f"Error generating timestamp array: {str(e)}")
         raise
 
 
 def generate_resource_data(resource_type: str, range_min=1, range_max=10) -> list:
     """
-    Generate random resource data using the Faker library.
+    Generate resource data from the pooled resources of a resource type.
 
      Args:
         resource_type (str): The type of resource (e.g., 'machine', 'human').
@@ -249,22 +327,15 @@ def generate_resource_data(resource_type: str, range_min=1, range_max=10) -> lis
         list: List of generated resources.
     """
     try:
-        resources = []
-        for _ in range(range_min, range_max + 1):
-            if resource_type == 'machine':
-                resources.append(fake.bothify(text='Machine-####'))
-            elif resource_type == 'human':
-                resources.append(fake.unique.name())
-            else:
-                raise ValueError(f"Unknown resource type: {resource_type}")
-        return resources
+        return get_value_pool('Resource', resource_type, range_max - range_min + 1).tolist()
     except Exception as e:
         logging.error(f"Error generating resource data: {str(e)}")
         raise
 
 
 def generate_attribute_value(attribute_type: str, distribution='uniform', categories=None, range_min=0, range_max=100,
-                             prev_value=None) -> Union[int, float, str]:
+                             prev_value=None, resource_type='human', resource_count=10,
+                             datetime_range=None) -> Union[int, float, str]:
     """
     Generate a value for a given attribute based on its type and distribution.
 
@@ -275,59 +346,89 @@ def generate_attribute_value(attribute_type: str, distribution='uniform', catego
         range_min (int): Minimum value for range-based attributes.
         range_max (int): Maximum value for range-based attributes.
         prev_value (Union[int, float, str]): The previous attribute value to consider in some distributions.
+        resource_type (str): The type of resource ('human', 'machine') of Resource attributes without categories.
+        resource_count (int): The number of distinct resources of Resource attributes without categories.
+        datetime_range (List, optional): The first and last date of DateTime attributes.
 
     Returns:
         Union[int, str]: The generated attribute value.
     """
-    try:
-        if attribute_type in ['Categorical', 'Resource']:
-            if categories:
-                return np.random.choice(categories)
-            else:
-                raise ValueError("Categories must be provided for Categorical attribute type")
-        elif attribute_type == 'Numeric':
-            if distribution == 'uniform':
-                if prev_value is not None:
-                    return np.random.uniform(prev_value, range_max)
-                return np.random.uniform(range_min, range_max)
-            elif distribution == 'normal':
-                mu = (range_max + range_min) / 2
-                sigma = (range_max - range_min) / 6
-                if prev_value is not None:
-                    mu = (range_max + prev_value) / 2
-                    sigma = (range_max - prev_value) / 6
-                return np.random.normal(mu, sigma)
-            elif distribution == 'exponential':
-                scale = (range_max - range_min) / 2
-                if prev_value is not None:
-                    scale = (range_max - prev_value) / 2
-                return np.random.exponential(scale)
-            elif distribution == 'pareto':
-                shape = 2.62
-                return np.random.pareto(shape)
-            else:
-                raise ValueError(f"Unknown distribution: {distribution}")
-        elif attribute_type == 'Character':
-            return fake.word()
-        elif attribute_type == 'Geo':
-            return fake.geo()
-        elif attribute_type == 'Company':
-            return fake.company()
-        elif attribute_type == 'PhoneNumber':
-            return fake.phone_number()
-        elif attribute_type == 'Email':
-            return fake.email()
-        elif attribute_type == 'Address':
-            return fake.address()
-        elif attribute_type == 'UUID':
-            return fake.uuid4()
-        elif attribute_type == 'DateTime':
-            return fake.date_time()
-        else:
-            raise ValueError(f"Unknown attribute type: {attribute_type}")
-    except Exception as e:
-        logging.error(f"Error generating attribute value: {str(e)}")
-        raise
+    return generate_attribute_values(attribute_type, distribution, categories, range_min, range_max, num_values=1,
+                                     resource_type=resource_type, resource_count=resource_count,
+                                     prev_value=prev_value, datetime_range=datetime_range)[0]
+
+
+def normalize_adjustment_type(adjustment_type: Any) -> str:
+    """Normalize an adjustment type such as 'slight change' or 'slight_change' to 'slight_change'."""
+    if not isinstance(adjustment_type, str) or not adjustment_type.strip():
+        return 'no_change'
+    return adjustment_type.strip().lower().replace(' ', '_')
+
+
+def adjust_attribute_values(values: Any, adjustment_type: str, range_min, range_max, categories=None,
+                            rng: Any = None) -> list:
+    """
+    Adjust many attribute values based on the adjustment type in one pass.
+
+    Numeric values change by up to 10% (slight), 30% (moderate, at least 30% away) or 100% (significant) and are
+    clipped to the range and rounded. Categorical values are redrawn with a probability of 20%, 50% or 100% from
+    the other categories: a draw r among the k - 1 other categories maps to category code r + (r >= current code),
+    which skips the current value without building a list per value.
+
+    Args:
+        values (Any): The current attribute values.
+        adjustment_type (str): The adjustment type (no_change, slight_change, moderate_change, significant_change),
+            with underscores or spaces.
+        range_min (int): Minimum value for numeric adjustments.
+        range_max (int): Maximum value for numeric adjustments.
+        categories (List[str]): List of categories for categorical attributes.
+        rng (Any, optional): Random source with the np.random interface. Defaults to np.random.
+
+    Returns:
+        list: The adjusted attribute values.
+    """
+    adjustment_type = normalize_adjustment_type(adjustment_type)
+    rng = np.random if rng is None else rng
+    num_values = len(values)
+    # Draw for every value, so keyed random sources stay aligned with their rows
+    uniforms = rng.uniform(0.0, 1.0, num_values)
+
+    numeric_values = np.asarray(values)
+    if numeric_values.dtype.kind in 'iuf':
+        # Purely numeric values skip the per-value type checks
+        values = numeric_values.astype(object)
+        numeric = np.ones(num_values, dtype=bool)
+    else:
+        values = np.array(list(values) + [None], dtype=object)[:-1]
+        numeric = np.fromiter((isinstance(value, (int, float)) and not isinstance(value, bool) for value in values),
+                              dtype=bool, count=num_values)
+    if numeric.any():
+        current = numeric_values.astype(np.float64) if numeric.all() else values[numeric].astype(np.float64)
+        change = current * ADJUSTMENT_CHANGE.get(adjustment_type, 0)
+        adjusted = np.clip(current + (2.0 * uniforms[numeric] - 1.0) * change, range_min, range_max)
+        if adjustment_type == 'moderate_change':
+            too_close = adjusted - current < 0.30 * current
+            adjusted[too_close] = np.where(current < adjusted, current * 1.3, current * 0.7)[too_close]
+        rounded = np.round(adjusted).astype(np.int64)
+        if numeric.all():
+            return rounded.tolist()
+        values[numeric] = rounded.tolist()
+
+    categorical = ~numeric & np.fromiter((isinstance(value, str) for value in values), dtype=bool, count=num_values)
+    if categories and categorical.any() and adjustment_type in ADJUSTMENT_PROBABILITY:
+        category_values = np.array(list(categories) + [None], dtype=object)[:-1]
+        category_codes = {}
+        for code, category in enumerate(category_values):
+            category_codes.setdefault(category, code)
+        rows = np.flatnonzero(categorical)
+        codes = np.array([category_codes.get(value, -1) for value in values[rows]], dtype=np.int64)
+        redraw = rng.uniform(0.0, 1.0, num_values)[rows] < ADJUSTMENT_PROBABILITY[adjustment_type]
+        other_counts = len(category_values) - (codes >= 0)
+        redraw &= other_counts > 0
+        draws = np.minimum(np.floor(uniforms[rows] * other_counts), other_counts - 1).astype(np.int64)
+        new_codes = draws + ((codes >= 0) & (draws >= codes))
+        values[rows[redraw]] = category_values[new_codes[redraw]]
+    return values.tolist()
 
 
 def adjust_attribute_value(value, adjustment_type, range_min, range_max, categories=None):
@@ -344,60 +445,72 @@ def adjust_attribute_value(value, adjustment_type, range_min, range_max, categor
     Returns:
         Union[int, float, str]: The adjusted attribute value.
     """
-    if isinstance(value, (int, float)):
-        change_percent = {
-            'slight_change': 0.10,
-            'moderate_change': 0.30,
-            'significant_change': 1.00
-        }.get(adjustment_type, 0)
-
-        change = value * change_percent
-        new_value = value + random.uniform(-change, change)
-
-        if adjustment_type == 'significant_change':
-            new_value = max(range_min, min(new_value, range_max))
-        else:
-            new_value = max(range_min, min(new_value, range_max))
-            if adjustment_type == 'moderate_change':
-                if new_value - value < 0.30 * value:
-                    new_value = value * 1.3 if value < new_value else value * 0.7
-
-        return round(new_value)
-
-    elif isinstance(value, str) and categories:
-        change_probability = {
-            'slight_change': 0.20,
-            'moderate_change': 0.50,
-            'significant_change': 1.00
-        }.get(adjustment_type, 0)
-
-        if random.random() < change_probability:
-            return random.choice([cat for cat in categories if cat != value])
-
-        return value
-
-    return value
+    return adjust_attribute_values([value], adjustment_type, range_min, range_max, categories)[0]
 
 
 def generate_attribute_values(attribute_type: str, distribution='uniform', categories=None, range_min=0, range_max=100,
-                              num_values=10, order: list = None) -> list:
+                              num_values=10, order: list = None, resource_type='human', resource_count=10,
+                              prev_value=None, monotone=False, weights=None, rng=None, datetime_range=None) -> list:
     """
     Generate an array of values for a given attribute based on its type and distribution.
 
+    All values are drawn in one batch. Numeric values follow the distribution truncated to the range by
+    inverse-CDF sampling, see distributions.sample_truncated.
+
     Args:
         attribute_type (str): The type of the attribute ('Character', 'Numeric', 'Categorical', etc.).
         distribution (str): The distribution type for generating the value (uniform, normal, exponential, pareto).
-        categories (List[str]): List of categories for categorical attributes.
+        categories (Union[List[str], Dict[str, float]]): List of categories for categorical attributes, or a
+            mapping of every category to its weight.
         range_min (int): Minimum value for range-based attributes.
         range_max (int): Maximum value for range-based attributes.
         num_values (int): Number of values to generate.
         order (List[int], optional): A list of indices specifying the order in which to sort the generated values. Defaults to None.
+        resource_type (str): The type of resource ('human', 'machine') of Resource attributes without categories.
+        resource_count (int): The number of distinct resources of Resource attributes without categories.
+        prev_value (float, optional): Numeric values are drawn between prev_value and range_max.
+        monotone (bool): Whether every numeric value is drawn between the previous value and range_max.
+        weights (List[float], optional): Relative weight of every category.
+        rng (Any, optional): Random source with the np.random interface. Defaults to np.random.
+        datetime_range (List, optional): The first and last date of DateTime attributes. Defaults to
+            config_init.DEFAULT_DATETIME_RANGE, a fixed range so seeded logs do not depend on the current time.
 
     Returns:
         list: The generated attribute values, sorted based on the `order` argument if provided.
     """
-    values = [generate_attribute_value(attribute_type, distribution, categories, range_min, range_max) for _ in
-              range(num_values)]
+    try:
+        if isinstance(categories, dict):
+            categories, weights = list(categories), list(categories.values())
+
+        if attribute_type == 'Resource' and not categories:
+            # Pooled values cost a single index gather per batch
+            values = sample_value_pool(attribute_type, num_values, rng, resource_type, resource_count)
+        elif attribute_type in ['Categorical', 'Resource']:
+            if not categories:
+                raise ValueError("Categories must be provided for Categorical attribute type")
+            values = sample_categories(categories, num_values, weights, rng)
+        elif attribute_type == 'Numeric':
+            values = sample_truncated(distribution, range_min, range_max, num_values, prev_value, monotone, rng)
+        elif attribute_type in POOL_PROVIDERS:
+            values = sample_value_pool(attribute_type, num_values, rng)
+        elif attribute_type == 'UUID':
+            # Random version 4 UUIDs from 128 random bits each
+            words = np.stack([(np.random if rng is None else rng).randint(0, 2 ** 32, size=num_values)
+                              for _ in range(4)], axis=1).astype('>u4')
+            uuid_bytes = np.frombuffer(words.tobytes(), dtype=np.uint8).reshape(-1, 16).copy()
+            uuid_bytes[:, 6] = (uuid_bytes[:, 6] & 0x0F) | 0x40
+            uuid_bytes[:, 8] = (uuid_bytes[:, 8] & 0x3F) | 0x80
+            values = [str(uuid.UUID(bytes=row.tobytes())) for row in uuid_bytes]
+        elif attribute_type == 'DateTime':
+            first, last = config_init.DEFAULT_DATETIME_RANGE if datetime_range is None else datetime_range
+            timestamps = generate_timestamp_array(first, last, amount=num_values, sort=False, rng=rng)
+            values = pd.DatetimeIndex(timestamps).to_pydatetime()
+        else:
+            raise ValueError(f"Unknown attribute type: {attribute_type}")
+        values = list(values.tolist() if isinstance(values, np.ndarray) else values)
+    except Exception as e:
+        logging.error(f"Error generating attribute value: {str(e)}")
+        raise
 
     if order is not None:
         # Ensure that `order` is a list of integers and has the same length as `num_values`
@@ -437,6 +550,234 @@ def add_duration(start_date: Union[dt.date, dt.datetime], duration: float, durat
         raise ValueError(f"Unsupported duration_uom: {duration_uom}")
 
 
+def compile_durations(duration_ranges: np.ndarray, duration_uoms: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Resolve the duration ranges and units of many activities or transactions into nanosecond parameters.
+
+    Args:
+        duration_ranges (np.ndarray): An (n, 2) array of minimum and maximum durations.
+        duration_uoms (np.ndarray): The duration unit of measure of each row ('days', 'hours', 'minutes', 'seconds').
+
+    Returns:
+        dict: Arrays 'low', 'high' and 'unit_ns' of the durations and 'offset_step' and 'offset_count' of the start
+        offsets, one value per row.
+    """
+    uoms, uom_index = np.unique(np.asarray(duration_uoms, dtype=object).astype(str), return_inverse=True)
+    unsupported = set(uoms) - DURATION_UOM_NS.keys()
+    if unsupported:
+        raise ValueError(f"Unsupported duration_uom: {', '.join(sorted(unsupported))}")
+
+    duration_ranges = np.asarray(duration_ranges, dtype=np.int64).reshape(-1, 2)
+    return {
+        'low': duration_ranges[:, 0],
+        'high': duration_ranges[:, 1],
+        'unit_ns': np.array([DURATION_UOM_NS[uom] for uom in uoms], dtype=np.int64)[uom_index],
+        'offset_step': np.array([START_OFFSET_UOM_NS[uom][0] for uom in uoms], dtype=np.int64)[uom_index],
+        'offset_count': np.array([START_OFFSET_UOM_NS[uom][1] for uom in uoms], dtype=np.int64)[uom_index]
+    }
+
+
+def draw_durations(compiled: Dict[str, np.ndarray], rng: Any = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Draw random start offsets and durations from parameters compiled by compile_durations.
+
+    Args:
+        compiled (dict): The duration parameters of each row.
+        rng (Any, optional): Random source with the np.random interface, e.g. a CaseRandom. Defaults to np.random.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Start offsets and durations as int64 nanoseconds.
+    """
+    rng = np.random if rng is None else rng
+    durations = rng.randint(compiled['low'], compiled['high'] + 1) * compiled['unit_ns']
+    offsets = rng.randint(0, compiled['offset_count']) * compiled['offset_step']
+    return offsets.astype(np.int64), durations.astype(np.int64)
+
+
+def sample_durations(duration_ranges: np.ndarray, duration_uoms: np.ndarray,
+                     rng: Any = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Draw random start offsets and durations for many activities or transactions in one batch.
+
+    This is the array counterpart of generate_random_start_time_within_uom followed by add_duration.
+
+    Args:
+        duration_ranges (np.ndarray): An (n, 2) array of minimum and maximum durations.
+        duration_uoms (np.ndarray): The duration unit of measure of each row ('days', 'hours', 'minutes', 'seconds').
+        rng (Any, optional): Random source with the np.random interface, e.g. a CaseRandom. Defaults to np.random.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Start offsets and durations as int64 nanoseconds.
+    """
+    return draw_durations(compile_durations(duration_ranges, duration_uoms), rng)
+
+
+def get_calendar_codes(process_ids: np.ndarray, working_days: np.ndarray, working_hours: np.ndarray,
+                       calendar_options: Dict[int, Dict[str, Any]]) -> Tuple[np.ndarray, List[WorkingCalendar]]:
+    """
+    Resolve the working calendar of many rows, compiling each distinct schedule once.
+
+    Args:
+        process_ids (np.ndarray): The process ID of each row.
+        working_days (np.ndarray): The working days of each row.
+        working_hours (np.ndarray): The working hours of each row.
+        calendar_options (dict): Calendar options per process ID, see get_calendar_options.
+
+    Returns:
+        Tuple[np.ndarray, List[WorkingCalendar]]: The index of each row's calendar in the returned list, -1 for rows
+        without a working schedule, and the list of calendars.
+    """
+    calendars = []
+    calendar_codes = {}
+    schedule_codes = {}
+    codes = np.empty(len(process_ids), dtype=np.int64)
+    for row, (process_id, days, hours) in enumerate(zip(process_ids, working_days, working_hours)):
+        schedule = (process_id, repr(days), repr(hours))
+        if schedule not in schedule_codes:
+            calendar = get_working_calendar(days, hours, **calendar_options.get(process_id, {}))
+            if calendar is None:
+                schedule_codes[schedule] = -1
+            else:
+                if id(calendar) not in calendar_codes:
+                    calendar_codes[id(calendar)] = len(calendars)
+                    calendars.append(calendar)
+                schedule_codes[schedule] = calendar_codes[id(calendar)]
+        codes[row] = schedule_codes[schedule]
+    return codes, calendars
+
+
+def chain_timestamps(origins: np.ndarray, group_index: np.ndarray, steps: np.ndarray, offsets: np.ndarray,
+                     durations: np.ndarray, calendar_codes: np.ndarray,
+                     calendars: List[WorkingCalendar]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Chain the start and end times of consecutive steps within many groups, e.g. the activities of each case.
+
+    Each step starts its offset after the end of the previous step of its group (the first one after the group
+    origin) and lasts its duration. Without working calendars this is a segmented cumulative sum. Steps with a
+    calendar depend on the adjusted end of the previous step, so they are chained one step position at a time,
+    each position being a vectorized operation over all groups.
+
+    Args:
+        origins (np.ndarray): The origin of each group as int64 nanoseconds.
+        group_index (np.ndarray): The group of each row. Rows must be sorted by group and step.
+        steps (np.ndarray): The position of each row within its group, starting at 0.
+        offsets (np.ndarray): Start offset of each row in nanoseconds.
+        durations (np.ndarray): Duration of each row in nanoseconds.
+        calendar_codes (np.ndarray): Index of each row's calendar in calendars, -1 for none.
+        calendars (List[WorkingCalendar]): The working calendars referenced by calendar_codes.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Start and end times as int64 nanoseconds.
+    """
+    if len(steps) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    if not (calendar_codes >= 0).any():
+        totals = offsets + durations
+        cumulative = np.cumsum(totals)
+        first_rows = np.flatnonzero(steps == 0)
+        group_base = np.zeros(len(origins), dtype=np.int64)
+        group_base[group_index[first_rows]] = cumulative[first_rows] - totals[first_rows]
+        ends = origins[group_index] + cumulative - group_base[group_index]
+        return ends - durations, ends
+
+    starts = np.empty(len(steps), dtype=np.int64)
+    ends = np.empty(len(steps), dtype=np.int64)
+    current = np.asarray(origins, dtype=np.int64).copy()
+    by_step = np.argsort(steps, kind='stable')
+    step_bounds = np.searchsorted(steps[by_step], np.arange(steps.max() + 2))
+    for step in range(len(step_bounds) - 1):
+        rows = by_step[step_bounds[step]:step_bounds[step + 1]]
+        groups = group_index[rows]
+        step_starts = current[groups] + offsets[rows]
+        step_ends = step_starts + durations[rows]
+        codes = calendar_codes[rows]
+        for code in np.unique(codes[codes >= 0]):
+            mask = codes == code
+            step_starts[mask] = calendars[code].next_working_time(step_starts[mask])
+            step_ends[mask] = calendars[code].add_working_time(step_starts[mask], durations[rows][mask])
+        starts[rows] = step_starts
+        ends[rows] = step_ends
+        current[groups] = step_ends
+    return starts, ends
+
+
+def chain_template_timestamps(origins: np.ndarray, offsets: np.ndarray, durations: np.ndarray,
+                              calendar_codes: np.ndarray, calendars: List[WorkingCalendar]) -> Tuple[np.ndarray,
+                                                                                                    np.ndarray]:
+    """
+    Chain the start and end times of cases that share a variant template.
+
+    All cases of a template have the same steps, so the steps form the columns of (cases, steps) arrays and every
+    column has a single calendar. Without calendars the chain is a cumulative sum along the steps, otherwise the
+    columns are chained one at a time, each a vectorized operation over all cases.
+
+    Args:
+        origins (np.ndarray): The origin of each case as int64 nanoseconds.
+        offsets (np.ndarray): A (cases, steps) array of start offsets in nanoseconds.
+        durations (np.ndarray): A (cases, steps) array of durations in nanoseconds.
+        calendar_codes (np.ndarray): Index of each step's calendar in calendars, -1 for none.
+        calendars (List[WorkingCalendar]): The working calendars referenced by calendar_codes.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (cases, steps) arrays of start and end times as int64 nanoseconds.
+    """
+    origins = np.asarray(origins, dtype=np.int64)
+    if not (calendar_codes >= 0).any():
+        ends = origins[:, None] + np.cumsum(offsets + durations, axis=1)
+        return ends - durations, ends
+
+    starts = np.empty_like(offsets)
+    ends = np.empty_like(offsets)
+    current = origins.copy()
+    for step, code in enumerate(calendar_codes):
+        step_starts = current + offsets[:, step]
+        if code >= 0:
+            step_starts = calendars[code].next_working_time(step_starts)
+            current = calendars[code].add_working_time(step_starts, durations[:, step])
+        else:
+            current = step_starts + durations[:, step]
+        starts[:, step] = step_starts
+        ends[:, step] = current
+    return starts, ends
+
+
+def compile_variant_templates(templates: List[Tuple[int, str]], activities_df: pd.DataFrame,
+                              calendar_options: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Compile every variant, a (process_id, trace pattern) pair, into the arrays its cases are generated from.
+
+    Args:
+        templates (list): The distinct (process_id, trace pattern) pairs.
+        activities_df (pd.DataFrame): DataFrame representing activities.
+        calendar_options (dict): Calendar options per process ID, see get_calendar_options.
+
+    Returns:
+        list: Per template, the activity 'rows' and trace 'positions' of its steps, their compiled 'durations'
+        (see compile_durations), the 'calendar_codes' of the steps and the shared list of 'calendars'.
+    """
+    activity_rows = activities_df.groupby(['process_id', 'trace'], sort=False).indices
+    no_rows = np.empty(0, dtype=np.int64)
+    activity_codes, calendars = get_calendar_codes(activities_df['process_id'].to_numpy(),
+                                                   activities_df['working_days'].to_numpy(),
+                                                   activities_df['working_hours'].to_numpy(), calendar_options)
+    activity_durations = compile_durations(np.array(activities_df['duration_range'].tolist()),
+                                           activities_df['duration_uom'].to_numpy())
+
+    compiled = []
+    for process_id, pattern in templates:
+        step_rows = [activity_rows.get((process_id, trace), no_rows) for trace in pattern.split(',')]
+        rows = np.concatenate(step_rows).astype(np.int64)
+        compiled.append({
+            'rows': rows,
+            'positions': np.repeat(np.arange(len(step_rows)), [len(r) for r in step_rows]),
+            'durations': {name: values[rows] for name, values in activity_durations.items()},
+            'calendar_codes': activity_codes[rows],
+            'calendars': calendars
+        })
+    return compiled
+
+
 def generate_process_data(process_config_data: Dict[str, Any]) -> pd.DataFrame:
     """
     Generate process data from YAML configuration and update 'process_id' back to the input configuration.
@@ -498,13 +839,14 @@ def generate_activity_data(process_config_data: Dict[str, Any]) -> pd.DataFrame:
                         'duration_range': activity['duration_range'],
                         'duration_uom': activity['duration_uom'],
                         'working_days': activity['working_days'],
-                        'working_hours': activity['working_hours']
+                        'working_hours': activity['working_hours'],
+                        'transaction_types': activity.get('transaction_types', [])
                     })
                     activity_id += 1
         activities_df = pd.DataFrame(activity_rows, columns=['activity_id', 'activity_name', 'process_id', 'trace',
                                                              'order', 'min_weight', 'max_weight', 'distribution',
                                                              'duration_range', 'duration_uom', 'working_days',
-                                                             'working_hours'])
+                                                             'working_hours', 'transaction_types'])
         return activities_df
     except Exception as e:
         logging.error(f"Error generating activity data: {e}")
@@ -542,6 +884,7 @@ def create_attribute_definitions(process_config_data: Dict[str, Any]) -> pd.Data
                     'categories': attribute['categories'],
                     'resource_type': attribute['resource_type'],
                     'resource_count': attribute['resource_count'],
+                    'datetime_range': attribute['datetime_range'],
                     'as_attribute': attribute['as_attribute'],
                     'adjustment_type': attribute['adjustment_type'],
                     'generation_level': attribute['generation_level']
@@ -561,6 +904,7 @@ def create_attribute_definitions(process_config_data: Dict[str, Any]) -> pd.Data
                     'categories': attribute['categories'],
                     'resource_type': attribute['resource_type'],
                     'resource_count': attribute['resource_count'],
+                    'datetime_range': attribute['datetime_range'],
                     'as_attribute': attribute['as_attribute'],
                     'adjustment_type': attribute['adjustment_type'],
                     'generation_level': attribute['generation_level']
@@ -580,6 +924,7 @@ def create_attribute_definitions(process_config_data: Dict[str, Any]) -> pd.Data
                     'categories': attribute['categories'],
                     'resource_type': attribute['resource_type'],
                     'resource_count': attribute['resource_count'],
+                    'datetime_range': attribute['datetime_range'],
                     'as_attribute': attribute['as_attribute'],
                     'adjustment_type': attribute['adjustment_type'],
                     'generation_level': attribute['generation_level']
@@ -599,6 +944,7 @@ def create_attribute_definitions(process_config_data: Dict[str, Any]) -> pd.Data
                     'categories': attribute['categories'],
                     'resource_type': attribute['resource_type'],
                     'resource_count': attribute['resource_count'],
+                    'datetime_range': attribute['datetime_range'],
                     'as_attribute': attribute['as_attribute'],
                     'adjustment_type': attribute['adjustment_type'],
                     'generation_level': attribute['generation_level']
@@ -610,75 +956,144 @@ def create_attribute_definitions(process_config_data: Dict[str, Any]) -> pd.Data
                                                                          'attribute_name', 'attribute_value_type',
                                                                          'distribution', 'range', 'categories',
                                                                          'resource_type', 'resource_count',
-                                                                         'as_attribute', 'adjustment_type',
-                                                                         'generation_level'])
+                                                                         'datetime_range', 'as_attribute',
+                                                                         'adjustment_type', 'generation_level'])
         return attribute_definitions_df
     except Exception as e:
         logging.error(f"Error creating attribute definitions: {str(e)}")
         raise
 
 
-def generate_case_data(process_config_data: Dict[str, Any]) -> pd.DataFrame:
+CASE_COLUMNS = ['case_id', 'process_id', 'case_name', 'start_date', 'end_date', 'variant_id', 'trace_pattern',
+                'working_days', 'working_hours']
+
+
+def assign_case_variants(process: Dict[str, Any], seed: Optional[int] = None) -> np.ndarray:
     """
-    Generate case data for each process.
+    Assign a variant to every case of a process.
+
+    The variant IDs are the 1-based positions of the trace patterns in 'trace_counts'. Every ID is repeated by its
+    count and the sequence is shuffled once, from a generator keyed by (seed, process_id) when a seed is given. A
+    process planned into shards carries the variants of its cases in 'case_variants', which are returned as is.
 
     Args:
-        process_config_data (dict): Dictionary containing process configuration.
+        process (dict): The configuration of one process.
+        seed (int, optional): The seed of the whole log. The global NumPy generator is used if not given.
 
     Returns:
-        pd.DataFrame: DataFrame representing case data.
+        np.ndarray: The variant ID of every case, at most 'num_cases' of them.
+    """
+    if 'case_variants' in process:
+        return np.asarray(process['case_variants'], dtype=np.int32)
+    counts = np.fromiter(process['trace_counts'].values(), dtype=np.int64, count=len(process['trace_counts']))
+    variants = np.repeat(np.arange(1, len(counts) + 1, dtype=np.int32), np.maximum(counts, 0))
+    if seed is None:
+        np.random.shuffle(variants)
+    else:
+        entropy = [int(seed), int(process['process_id']), STREAM_CASE_VARIANTS]
+        np.random.default_rng(np.random.SeedSequence(entropy)).shuffle(variants)
+    return variants[:process['num_cases']]
+
+
+def iter_case_data(process_config_data: Dict[str, Any], chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+    """
+    Generate case data for each process in chunks of a fixed number of cases.
+
+    Case IDs continue across chunks. Variants are assigned to all cases of a process at once by
+    assign_case_variants, and start and end dates are drawn per block of chunk_size cases, so only one block is
+    held in memory at a time. With a 'seed' in the configuration, the dates of every case are drawn from its own
+    keyed stream and are not sorted across cases. The configuration is not modified.
+
+    Args:
+        process_config_data (dict): Dictionary containing process configuration.
+        chunk_size (int, optional): Number of cases per chunk. All cases form a single chunk if not given.
+
+    Yields:
+        pd.DataFrame: DataFrame representing the case data of one chunk.
     """
     try:
-        case_rows = []
+        case_frames, pending_cases = [], 0
         case_id = process_config_data['case_id']
+        seed = process_config_data.get('seed')
+        calendar_options = get_calendar_options(process_config_data)
         for process_key, process in process_config_data['processes'].items():
             if isinstance(process, dict) and 'process_id' in process:
                 process_id = process['process_id']
-                num_cases = process['num_cases']
-                process_start_date = pd.to_datetime(process['start_date'])
-                process_end_date = pd.to_datetime(process['end_date'])
+                case_variants = assign_case_variants(process, seed)
+                trace_patterns = np.array(list(process['trace_counts'].keys()) + [None], dtype=object)[:-1]
+                num_cases = len(case_variants)
+                process_start_date = to_datetime64(process['start_date'])
+                process_end_date = to_datetime64(process['end_date'])
                 working_hours = process['working_hours']
                 working_days = process['working_days']
-
-                for i in range(num_cases):
-                    start_date = generate_timestamp(process_start_date, process_end_date)
-                    end_date = generate_timestamp(start_date, process_end_date)
-                    start_date, end_date = adjust_to_working_schedule(start_date, end_date, working_days, working_hours)
-
-                    for key, value in process['trace_counts'].items():
-                        case_trace_patterns = []
-                        if value <= 0:
-                            break
-                        else:
-                            case_trace_patterns.append(key)
-                            process['trace_counts'][key] -= 1
-
-                            case_rows.append({
-                                'case_id': case_id,
-                                'process_id': process_id,
-                                'case_name': f"Case_{case_id}",
-                                'start_date': start_date,
-                                'end_date': end_date,
-                                'trace_pattern': case_trace_patterns,
-                                'working_days': working_days,
-                                'working_hours': working_hours,
-                            })
-                            case_id += 1
-
-        cases_df = pd.DataFrame(case_rows, columns=['case_id', 'process_id', 'case_name',
-                                                    'start_date', 'end_date', 'trace_pattern', 'working_days',
-                                                    'working_hours'])
-        return cases_df
+                block_size = chunk_size or max(num_cases, 1)
+
+                for block_start in range(0, num_cases, block_size):
+                    block_cases = min(block_size, num_cases - block_start)
+                    case_ids = case_id + np.arange(block_cases)
+
+                    # Draw the start and end dates of all cases of the block in one batch
+                    rng = case_random(seed, STREAM_CASE_DATES, process_id, case_ids)
+                    case_start_dates = generate_timestamp_array(process_start_date, process_end_date,
+                                                                amount=block_cases, sort=seed is None, rng=rng)
+                    case_end_dates = generate_timestamp_array(case_start_dates, process_end_date, amount=block_cases,
+                                                              sort=False, rng=rng)
+                    case_start_dates, case_end_dates = adjust_to_working_schedule_array(
+                        case_start_dates, case_end_dates, working_days, working_hours,
+                        **calendar_options[process_id])
+
+                    variants = case_variants[block_start:block_start + block_cases]
+                    case_frames.append(pd.DataFrame({
+                        'case_id': case_ids,
+                        'process_id': process_id,
+                        'case_name': [f"Case_{i}" for i in case_ids.tolist()],
+                        'start_date': pd.DatetimeIndex(case_start_dates).to_pydatetime(),
+                        'end_date': pd.DatetimeIndex(case_end_dates).to_pydatetime(),
+                        'variant_id': variants,
+                        'trace_pattern': trace_patterns[variants - 1],
+                        'working_days': [working_days] * block_cases,
+                        'working_hours': [working_hours] * block_cases,
+                    }, columns=CASE_COLUMNS))
+                    case_id += block_cases
+                    pending_cases += block_cases
+
+                    while chunk_size and pending_cases >= chunk_size:
+                        pending = pd.concat(case_frames, ignore_index=True)
+                        yield pending.iloc[:chunk_size].reset_index(drop=True)
+                        case_frames = [pending.iloc[chunk_size:].reset_index(drop=True)]
+                        pending_cases -= chunk_size
+
+        if pending_cases or not chunk_size:
+            case_frames = [frame for frame in case_frames if len(frame)]
+            yield (pd.concat(case_frames, ignore_index=True) if case_frames
+                   else pd.DataFrame(columns=CASE_COLUMNS))
     except Exception as e:
         logging.error(f"Error generating case data: {str(e)}")
         raise
 
 
+def generate_case_data(process_config_data: Dict[str, Any]) -> pd.DataFrame:
+    """
+    Generate case data for each process.
+
+    Args:
+        process_config_data (dict): Dictionary containing process configuration.
+
+    Returns:
+        pd.DataFrame: DataFrame representing case data.
+    """
+    return next(iter_case_data(process_config_data))
+
+
 def generate_activity_instance_data(process_config_data: Dict[str, Any], cases_df: pd.DataFrame,
                                     activities_df: pd.DataFrame) -> pd.DataFrame:
     """
     Generate activity instance data for each case in the process.
 
+    Each variant of the cases is compiled once by compile_variant_templates. All cases of a variant are then
+    generated as one (cases, steps) batch: their durations are drawn together and their start/end times chained
+    with chain_template_timestamps, so the Python work depends on the number of variants, not cases.
+
     Args:
         process_config_data (dict): Dictionary containing process configuration.
         cases_df (pd.DataFrame): DataFrame representing cases.
@@ -687,62 +1102,117 @@ def generate_activity_instance_data(process_config_data: Dict[str, Any], cases_d
     Returns:
         pd.DataFrame: DataFrame representing activity instance data.
     """
+    columns = ['activity_instance_id', 'case_id', 'activity_id', 'start_date', 'end_date', 'activity_name',
+               'position_in_trace', 'trace', 'order', 'working_days', 'working_hours']
     try:
-        activity_instance_rows = []
-        activity_instance_id = process_config_data['activity_instance_id']
-
-        for _, case in cases_df.iterrows():
-            trace_patterns = case['trace_pattern'][0].split(',')  # Assuming trace_pattern is a list of strings
-            current_time = case['start_date']
-
-            for position, trace in enumerate(trace_patterns):
-                filtered_activities = activities_df[(activities_df['process_id'] == case['process_id'])
-                                                    & (activities_df['trace'] == trace)]
-                for _, activity in filtered_activities.iterrows():
-                    start_date = current_time
-                    duration_range = activity['duration_range']
-                    duration_uom = activity['duration_uom']
-
-                    start_date = generate_random_start_time_within_uom(start_date, duration_uom)
-                    end_date = add_duration(start_date, random.randint(duration_range[0], duration_range[1]),
-                                            duration_uom)
-
-                    start_date, end_date = adjust_to_working_schedule(start_date, end_date, activity['working_days'],
-                                                                      activity['working_hours'])
-
-                    activity_instance_rows.append({
-                        'activity_instance_id': activity_instance_id,
-                        'case_id': case['case_id'],
-                        'activity_id': activity['activity_id'],
-                        'start_date': start_date,
-                        'end_date': end_date,
-                        'activity_name': activity['activity_name'],
-                        'position_in_trace': position,
-                        'trace': activity['trace'],
-                        'order': activity['order'],
-                        'working_days': activity['working_days'],
-                        'working_hours': activity['working_hours']
-                    })
+        if cases_df.empty or activities_df.empty:
+            return pd.DataFrame(columns=columns)
 
-                    activity_instance_id += 1
-                    current_time = end_date  # Update current time to the end of the activity for the next one
-
-        activity_instances_df = pd.DataFrame(activity_instance_rows, columns=['activity_instance_id', 'case_id',
-                                                                              'activity_id', 'start_date', 'end_date',
-                                                                              'activity_name', 'position_in_trace',
-                                                                              'trace', 'order', 'working_days',
-                                                                              'working_hours'])
+        activity_instance_id = process_config_data['activity_instance_id']
+        seed = process_config_data.get('seed')
+        process_ids = cases_df['process_id'].to_numpy()
+        case_ids = cases_df['case_id'].to_numpy()
+        patterns = cases_df['trace_pattern'].to_numpy()
+        variant_ids = (cases_df['variant_id'].to_numpy() if 'variant_id' in cases_df
+                       else pd.factorize(patterns)[0])
+        template_codes = pd.factorize(process_ids.astype(np.int64) << 32 | variant_ids)[0]
+        first_cases = np.unique(template_codes, return_index=True)[1]
+        templates = list(zip(process_ids[first_cases], patterns[first_cases]))
+        compiled = compile_variant_templates(templates, activities_df, get_calendar_options(process_config_data))
+        template_cases = np.argsort(template_codes, kind='stable')
+        template_bounds = np.searchsorted(template_codes[template_cases], np.arange(len(compiled) + 1))
+
+        # Activity instances of a case are consecutive, each case starts after the instances of the cases before it
+        case_lengths = np.array([len(template['rows']) for template in compiled], dtype=np.int64)[template_codes]
+        case_starts = np.cumsum(case_lengths) - case_lengths
+        total = int(case_lengths.sum())
+        rows = np.empty(total, dtype=np.int64)
+        positions = np.empty(total, dtype=np.int64)
+        start_dates = np.empty(total, dtype=np.int64)
+        end_dates = np.empty(total, dtype=np.int64)
+
+        origins = to_datetime64(cases_df['start_date']).astype(np.int64)
+        for code, template in enumerate(compiled):
+            cases = template_cases[template_bounds[code]:template_bounds[code + 1]]
+            num_steps = len(template['rows'])
+            if num_steps == 0:
+                continue
+            shape = (len(cases), num_steps)
+            rng = case_random(seed, STREAM_ACTIVITY_DURATIONS, np.repeat(process_ids[cases], num_steps),
+                              np.repeat(case_ids[cases], num_steps), np.tile(np.arange(num_steps), len(cases)))
+            parameters = {name: np.broadcast_to(values, shape).ravel()
+                          for name, values in template['durations'].items()}
+            offsets, durations = draw_durations(parameters, rng)
+            starts, ends = chain_template_timestamps(origins[cases], offsets.reshape(shape),
+                                                     durations.reshape(shape), template['calendar_codes'],
+                                                     template['calendars'])
+            targets = (case_starts[cases][:, None] + np.arange(num_steps)).ravel()
+            rows[targets] = np.broadcast_to(template['rows'], shape).ravel()
+            positions[targets] = np.broadcast_to(template['positions'], shape).ravel()
+            start_dates[targets] = starts.ravel()
+            end_dates[targets] = ends.ravel()
+
+        activity_instances_df = pd.DataFrame({
+            'activity_instance_id': activity_instance_id + np.arange(total),
+            'case_id': np.repeat(case_ids, case_lengths),
+            'activity_id': activities_df['activity_id'].to_numpy()[rows],
+            'start_date': start_dates.astype('datetime64[ns]'),
+            'end_date': end_dates.astype('datetime64[ns]'),
+            'activity_name': activities_df['activity_name'].to_numpy()[rows],
+            'position_in_trace': positions,
+            'trace': activities_df['trace'].to_numpy()[rows],
+            'order': activities_df['order'].to_numpy()[rows],
+            'working_days': activities_df['working_days'].to_numpy()[rows],
+            'working_hours': activities_df['working_hours'].to_numpy()[rows]
+        }, columns=columns)
         return activity_instances_df
     except Exception as e:
         logging.error(f"Error generating activity instance data: {e}")
         raise
 
 
+def compile_transaction_types(activities_df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Compile the transaction types of all activities into flat arrays.
+
+    The transaction types of activity row i are the flat entries tt_start[i] to tt_start[i] + tt_count[i].
+
+    Args:
+        activities_df (pd.DataFrame): DataFrame representing activities, including the 'transaction_types' column.
+
+    Returns:
+        dict: Arrays 'tt_start' and 'tt_count' per activity row, and 'name', 'order', 'duration_range',
+        'duration_uom', 'process_id', 'working_days' and 'working_hours' per transaction type.
+    """
+    if 'transaction_types' in activities_df:
+        transaction_types = [tts if isinstance(tts, list) else [] for tts in activities_df['transaction_types']]
+    else:
+        transaction_types = [[] for _ in range(len(activities_df))]
+    tt_count = np.array([len(tts) for tts in transaction_types], dtype=np.int64)
+    flat = [tt for tts in transaction_types for tt in tts]
+
+    return {
+        'tt_start': np.cumsum(tt_count) - tt_count,
+        'tt_count': tt_count,
+        'name': np.array([tt['name'] for tt in flat], dtype=object),
+        'order': np.array([tt['order'] for tt in flat], dtype=object),
+        'duration_range': np.array([tt['duration_range'] for tt in flat], dtype=np.int64).reshape(-1, 2),
+        'duration_uom': np.array([tt['duration_uom'] for tt in flat], dtype=object),
+        'process_id': np.repeat(activities_df['process_id'].to_numpy(), tt_count),
+        'working_days': np.array([tt.get('working_days', []) for tt in flat] + [None], dtype=object)[:-1],
+        'working_hours': np.array([tt.get('working_hours', []) for tt in flat] + [None], dtype=object)[:-1]
+    }
+
+
 def generate_event_data(process_config_data: Dict[str, Any], activity_instances_df: pd.DataFrame,
                         activities_df: pd.DataFrame) -> pd.DataFrame:
     """
     Generate event data for each activity instance according to transaction types.
 
+    Activity instances are repeated by the number of transaction types of their activity, all durations are drawn
+    in one batch and the events of each instance are chained with chain_timestamps. Instances of activities without
+    transaction types get a single event spanning the instance.
+
     Args:
         process_config_data (dict): Dictionary containing process configuration.
         activity_instances_df (pd.DataFrame): DataFrame representing activity instance data.
@@ -751,423 +1221,293 @@ def generate_event_data(process_config_data: Dict[str, Any], activity_instances_
     Returns:
         pd.DataFrame: DataFrame representing event data.
     """
+    columns = ['event_id', 'activity_instance_id', 'case_id', 'activity_id', 'start_date', 'end_date',
+               'transaction_name', 'transaction_order']
     try:
-        event_rows = []
-        event_id = process_config_data['event_id']
-
-        for _, instance in activity_instances_df.iterrows():
-            activity = activities_df[activities_df['activity_id'] == instance['activity_id']].iloc[0]
-            transaction_types = activity.get('transaction_types', [])
-            start_date = instance['start_date']
-            end_date = instance['end_date']
-            if transaction_types:
-                for tt in transaction_types:
-                    # Check if working_schedule_days and working_schedule_time are specified
-                    duration_range = tt['duration_range']
-                    duration_uom = tt['duration_uom']
-                    event_start_time = generate_random_start_time_within_uom(start_date, tt['duration_uom'])
-                    event_end_time = add_duration(event_start_time,
-                                                  random.randint(duration_range[0], duration_range[1]),
-                                                  duration_uom)
-
-                    event_start_time, event_end_time = adjust_to_working_schedule(event_start_time, event_end_time,
-                                                                                  tt['working_days'],
-                                                                                  tt['working_hours'])
-
-                    event_rows.append({
-                        'event_id': event_id,
-                        'activity_instance_id': instance['activity_instance_id'],
-                        'case_id': instance['case_id'],
-                        'activity_id': instance['activity_id'],
-                        'start_date': event_start_time,
-                        'end_date': event_end_time,
-                        'transaction_name': tt['name'],
-                        'transaction_order': tt['order']
-                    })
-
-                    start_date = event_end_time
-                    event_id += 1
-            else:
-                event_rows.append({
-                    'event_id': event_id,
-                    'activity_instance_id': instance['activity_instance_id'],
-                    'case_id': instance['case_id'],
-                    'activity_id': instance['activity_id'],
-                    'start_date': start_date,
-                    'end_date': end_date,
-                    'transaction_name': '',
-                    'transaction_order': ''
-                })
-                event_id += 1
+        if activity_instances_df.empty:
+            return pd.DataFrame(columns=columns)
 
-        events_df = pd.DataFrame(event_rows, columns=['event_id', 'activity_instance_id', 'case_id', 'activity_id',
-                                                      'start_date', 'end_date', 'transaction_name',
-                                                      'transaction_order'])
+        event_id = process_config_data['event_id']
+        transaction_types = compile_transaction_types(activities_df)
+        activity_rows = pd.Index(activities_df['activity_id']).get_indexer(activity_instances_df['activity_id'])
+        if (activity_rows < 0).any():
+            raise ValueError("Activity instances reference activities that are not in activities_df.")
+
+        # Repeat every instance by its number of transaction types, at least once
+        tt_counts = transaction_types['tt_count'][activity_rows]
+        event_counts = np.maximum(tt_counts, 1)
+        instance_index = np.repeat(np.arange(len(activity_instances_df)), event_counts)
+        steps = np.arange(event_counts.sum()) - np.repeat(np.cumsum(event_counts) - event_counts, event_counts)
+        has_tt = tt_counts[instance_index] > 0
+        tt_index = (transaction_types['tt_start'][activity_rows][instance_index] + steps)[has_tt]
+
+        instance_starts = to_datetime64(activity_instances_df['start_date']).astype(np.int64)
+        instance_ends = to_datetime64(activity_instances_df['end_date']).astype(np.int64)
+        start_dates = instance_starts[instance_index]
+        end_dates = instance_ends[instance_index]
+
+        # Events of a case are consecutive, their position within the case numbers their keyed draws
+        case_ids = activity_instances_df['case_id'].to_numpy()[instance_index]
+        case_starts = np.flatnonzero(np.r_[True, case_ids[1:] != case_ids[:-1]])
+        case_positions = np.arange(len(case_ids)) - np.repeat(case_starts, np.diff(np.r_[case_starts, len(case_ids)]))
+        rng = case_random(process_config_data.get('seed'), STREAM_EVENT_DURATIONS,
+                          transaction_types['process_id'][tt_index], case_ids[has_tt], case_positions[has_tt])
+        offsets, durations = sample_durations(transaction_types['duration_range'][tt_index],
+                                              transaction_types['duration_uom'][tt_index], rng)
+        tt_codes, calendars = get_calendar_codes(transaction_types['process_id'],
+                                                 transaction_types['working_days'],
+                                                 transaction_types['working_hours'],
+                                                 get_calendar_options(process_config_data))
+        start_dates[has_tt], end_dates[has_tt] = chain_timestamps(instance_starts, instance_index[has_tt],
+                                                                  steps[has_tt], offsets, durations,
+                                                                  tt_codes[tt_index], calendars)
+
+        transaction_names = np.full(len(instance_index), '', dtype=object)
+        transaction_names[has_tt] = transaction_types['name'][tt_index]
+        transaction_orders = np.full(len(instance_index), '', dtype=object)
+        transaction_orders[has_tt] = transaction_types['order'][tt_index]
+
+        events_df = pd.DataFrame({
+            'event_id': event_id + np.arange(len(instance_index)),
+            'activity_instance_id': activity_instances_df['activity_instance_id'].to_numpy()[instance_index],
+            'case_id': case_ids,
+            'activity_id': activity_instances_df['activity_id'].to_numpy()[instance_index],
+            'start_date': start_dates.astype('datetime64[ns]'),
+            'end_date': end_dates.astype('datetime64[ns]'),
+            'transaction_name': transaction_names,
+            'transaction_order': transaction_orders
+        }, columns=columns)
         return events_df
     except Exception as e:
         logging.error(f"Error generating event data: {e}")
         raise
 
 
-def generate_activity_attribute_data(attribute_definitions: pd.DataFrame, activities: pd.DataFrame) -> pd.DataFrame:
+def resolve_as_attributes(attribute_df: pd.DataFrame, alias_df: pd.DataFrame, entity_column: str,
+                          definitions: pd.DataFrame) -> pd.DataFrame:
     """
-    Generate activity attribute data based on the activities and attribute definitions.
+    Resolve attributes that take the value of another attribute of the same entity ('as_attribute').
+
+    Generated values are indexed by (entity ID, attribute name) once and all aliases are looked up in a single
+    join. Aliases of aliases are resolved in further rounds against the aliases resolved before.
 
     Args:
-        attribute_definitions (pd.DataFrame): DataFrame representing attribute definitions.
-        activities (pd.DataFrame): DataFrame representing activities.
+        attribute_df (pd.DataFrame): The generated attribute rows, with 'attribute_name' and 'attribute_value'.
+        alias_df (pd.DataFrame): The alias rows, with the columns of attribute_df plus 'process_id' and
+            'as_attribute', the name of the attribute whose value they take.
+        entity_column (str): The column identifying the entity, e.g. 'case_id'.
+        definitions (pd.DataFrame): The attribute definitions the aliases refer to.
 
     Returns:
-        pd.DataFrame: DataFrame representing activity attribute data.
+        pd.DataFrame: attribute_df with the resolved alias rows appended.
     """
+    if alias_df.empty:
+        return attribute_df
+
+    defined = pd.MultiIndex.from_arrays([definitions['process_id'], definitions['attribute_name']])
+    undefined = ~pd.MultiIndex.from_arrays([alias_df['process_id'], alias_df['as_attribute']]).isin(defined)
+    if undefined.any():
+        alias = alias_df[undefined].iloc[0]
+        raise ValueError(f"Attribute '{alias['as_attribute']}' not found in attribute definitions for process ID "
+                         f"{alias['process_id']}.")
+
+    entity_label = entity_column[:-len('_id')].replace('_', ' ') if entity_column.endswith('_id') else entity_column
+    resolved = []
+    sources = attribute_df
+    pending = alias_df
+    while not pending.empty:
+        # The first value of every (entity, attribute name) is the one an alias takes
+        index = sources.drop_duplicates([entity_column, 'attribute_name'])
+        positions = pd.MultiIndex.from_arrays([index[entity_column], index['attribute_name']]).get_indexer(
+            pd.MultiIndex.from_arrays([pending[entity_column], pending['as_attribute']]))
+        found = positions >= 0
+        if not found.any():
+            alias = pending.iloc[0]
+            raise ValueError(f"Attribute '{alias['as_attribute']}' value not found for {entity_label} ID "
+                             f"{alias[entity_column]}.")
+        sources = pending[found].assign(attribute_value=index['attribute_value'].to_numpy()[positions[found]])
+        resolved.append(sources[attribute_df.columns])
+        pending = pending[~found]
+    return pd.concat([attribute_df, *resolved], ignore_index=True)
+
+
+ATTRIBUTE_STREAMS = {'case': STREAM_CASE_ATTRIBUTES, 'event': STREAM_EVENT_ATTRIBUTES,
+                     'activity': STREAM_ACTIVITY_ATTRIBUTES, 'object': STREAM_OBJECT_ATTRIBUTES}
+
+
+def generate_attribute_data(attribute_definitions: pd.DataFrame, entities: pd.DataFrame, attribute_type: str,
+                            entity_columns: List[str], seed: Optional[int] = None,
+                            counter_ids: Optional[np.ndarray] = None,
+                            counter_draws: Optional[np.ndarray] = None) -> pd.DataFrame:
+    """
+    Generate the attribute values of many entities (cases, events, activities or objects) column-wise.
 
-    activity_attribute_rows = []
-    activity_definitions = attribute_definitions[attribute_definitions['attribute_type'] == 'activity']
-    attribute_values_cache = defaultdict(list)
-    as_attribute_mapping = {}
-
-    for activity in activities.itertuples():
-        process_id = activity.process_id
-        for attribute in activity_definitions[activity_definitions['process_id'] == process_id].itertuples():
-            generation_level = attribute.generation_level
-            adjustment_type = attribute.adjustment_type
-            as_attribute = attribute.as_attribute
+    Entities are grouped by (process, definition, generation_level) and each group's values are drawn in one batch
+    and assigned by array slicing. With a seed, every entity draws from the keyed stream of its definition at its
+    own counter, so its values do not depend on the other entities generated with it.
 
-            if as_attribute:
-                if as_attribute not in as_attribute_mapping:
-                    as_attribute_mapping[as_attribute] = []
-                as_attribute_mapping[as_attribute].append((activity, attribute))
-                continue
+    Args:
+        attribute_definitions (pd.DataFrame): DataFrame representing attribute definitions.
+        entities (pd.DataFrame): The entities, with a 'process_id' column and the entity_columns.
+        attribute_type (str): The attribute type of the definitions to generate ('case', 'event', 'activity',
+            'object').
+        entity_columns (List[str]): The entity columns copied to every attribute row. The first one identifies the
+            entity for as_attribute resolution.
+        seed (int, optional): The seed of the whole log. The global random generators are used if not given.
+        counter_ids (np.ndarray, optional): The keyed stream counter of every entity, e.g. its case ID. Defaults to
+            the first entity column.
+        counter_draws (np.ndarray, optional): The position of every entity within its counter, e.g. the position
+            of an event within its case. Defaults to 0.
 
-            if generation_level == 'process':
-                key = process_id
-            elif generation_level == 'activity_instance':
-                key = activity.activity_id
-            else:
-                key = activity.activity_instance_id
-
-            if not attribute_values_cache[key]:
-                num_values = (
-                    len(activities[activities['process_id'] == process_id]) if generation_level == 'process' else
-                    len(activities[activities[
-                                       'activity_id'] == activity.activity_id]) if generation_level == 'activity_instance' else
-                    1
-                )
-                attribute_values_cache[key] = generate_attribute_values(
-                    attribute.attribute_value_type,
-                    attribute.distribution,
-                    attribute.categories,
-                    attribute.range[0],
-                    attribute.range[1],
-                    num_values=num_values
-                )
-
-            value = attribute_values_cache[key].pop(0)
-            value = adjust_attribute_value(value, adjustment_type, attribute.range[0], attribute.range[1],
-                                           attribute.categories)
-
-            activity_attribute_rows.append({
-                'attribute_definition_id': attribute.attribute_id,
-                'activity_attribute_id': attribute.attribute_id,
-                'activity_id': activity.activity_id,
-                'process_id': process_id,
-                'generation_level': generation_level,
-                'attribute_name': attribute.attribute_name,
-                'attribute_value': value
-            })
+    Returns:
+        pd.DataFrame: The attribute rows, ordered by entity and definition, followed by the as_attribute rows.
+    """
+    definitions = attribute_definitions[attribute_definitions['attribute_type'] == attribute_type]
+    id_column = f"{attribute_type}_attribute_id"
+    columns = ['attribute_definition_id', id_column, *entity_columns, 'generation_level', 'attribute_name',
+               'attribute_value']
+
+    process_ids = entities['process_id'].to_numpy()
+    counter_ids = entities[entity_columns[0]].to_numpy() if counter_ids is None else np.asarray(counter_ids)
+    counter_draws = np.zeros(len(entities), dtype=np.int64) if counter_draws is None else np.asarray(counter_draws)
+    process_rows = pd.RangeIndex(len(entities)).groupby(pd.Index(process_ids)) if len(entities) else {}
+
+    value_rows, value_definitions, values = [], [], []
+    alias_rows, alias_definitions = [], []
+    for definition_index, attribute in enumerate(definitions.itertuples()):
+        rows = np.asarray(process_rows.get(attribute.process_id, []), dtype=np.int64)
+        if len(rows) == 0:
+            continue
+        if attribute.as_attribute:
+            alias_rows.append(rows)
+            alias_definitions.append(np.full(len(rows), definition_index))
+            continue
+
+        rng = case_random(seed, ATTRIBUTE_STREAMS[attribute_type], process_ids[rows], counter_ids[rows],
+                          counter_draws[rows], attribute.attribute_definition_id)
+        group_values = generate_attribute_values(
+            attribute.attribute_value_type,
+            attribute.distribution if attribute.distribution else 'normal',
+            attribute.categories,
+            attribute.range[0],
+            attribute.range[1],
+            num_values=len(rows),
+            resource_type=attribute.resource_type,
+            resource_count=attribute.resource_count,
+            rng=rng,
+            datetime_range=attribute.datetime_range
+        )
+        group_values = adjust_attribute_values(group_values, attribute.adjustment_type, attribute.range[0],
+                                               attribute.range[1], attribute.categories, rng)
+        value_rows.append(rows)
+        value_definitions.append(np.full(len(rows), definition_index))
+        values.extend(group_values)
+
+    def attribute_frame(row_parts, definition_parts, frame_values=None):
+        rows = np.concatenate(row_parts) if row_parts else np.empty(0, dtype=np.int64)
+        definition_index = np.concatenate(definition_parts) if definition_parts else np.empty(0, dtype=np.int64)
+        order = np.lexsort((definition_index, rows))
+        rows, definition_index = rows[order], definition_index[order]
+        frame = {
+            'attribute_definition_id': definitions['attribute_definition_id'].to_numpy()[definition_index],
+            id_column: definitions['attribute_id'].to_numpy()[definition_index],
+            **{column: entities[column].to_numpy()[rows] for column in entity_columns},
+            'generation_level': definitions['generation_level'].to_numpy()[definition_index],
+            'attribute_name': definitions['attribute_name'].to_numpy()[definition_index],
+        }
+        if frame_values is not None:
+            frame['attribute_value'] = pd.Series(np.array(frame_values + [None], dtype=object)[:-1][order],
+                                                 dtype=object)
+        else:
+            frame['process_id'] = process_ids[rows]
+            frame['as_attribute'] = definitions['as_attribute'].to_numpy()[definition_index]
+        return pd.DataFrame(frame)
 
+    attribute_df = attribute_frame(value_rows, value_definitions, values).reindex(columns=columns)
     # Process as_attribute at the end
-    for attr_name, attr_list in as_attribute_mapping.items():
-        for activity, attribute in attr_list:
-            process_id = activity.process_id
-            matched_attr = next((attr for attr in activity_definitions.itertuples() if
-                                 attr.attribute_name == attr_name and attr.process_id == process_id), None)
-            if matched_attr:
-                value = next((row['attribute_value'] for row in activity_attribute_rows if
-                              row['attribute_name'] == attr_name and row['activity_id'] == activity.activity_id), None)
-                if value is not None:
-                    activity_attribute_rows.append({
-                        'attribute_definition_id': attribute.attribute_id,
-                        'activity_attribute_id': attribute.attribute_id,
-                        'activity_id': activity.activity_id,
-                        'process_id': process_id,
-                        'generation_level': attribute.generation_level,
-                        'attribute_name': attribute.attribute_name,
-                        'attribute_value': value
-                    })
-                else:
-                    raise ValueError(f"Attribute '{attr_name}' value not found for activity ID {activity.activity_id}.")
-            else:
-                raise ValueError(
-                    f"Attribute '{attr_name}' not found in attribute definitions for process ID {process_id}.")
+    if alias_rows:
+        attribute_df = resolve_as_attributes(attribute_df, attribute_frame(alias_rows, alias_definitions),
+                                             entity_columns[0], definitions)
+    return attribute_df
 
-    activity_attribute_df = pd.DataFrame(activity_attribute_rows,
-                                         columns=['attribute_definition_id', 'activity_attribute_id', 'activity_id',
-                                                  'process_id', 'generation_level', 'attribute_name',
-                                                  'attribute_value'])
 
-    return activity_attribute_df
-
-
-def generate_event_attribute_data(attribute_definitions: pd.DataFrame, events: pd.DataFrame) -> pd.DataFrame:
+def generate_activity_attribute_data(attribute_definitions: pd.DataFrame, activities: pd.DataFrame,
+                                     seed: Optional[int] = None) -> pd.DataFrame:
     """
-    Generate event attribute data based on the events and attribute definitions.
+    Generate activity attribute data based on the activities and attribute definitions.
 
     Args:
         attribute_definitions (pd.DataFrame): DataFrame representing attribute definitions.
-        events (pd.DataFrame): DataFrame representing events.
+        activities (pd.DataFrame): DataFrame representing activities.
+        seed (int, optional): The seed of the whole log.
 
     Returns:
-        pd.DataFrame: DataFrame representing event attribute data.
+        pd.DataFrame: DataFrame representing activity attribute data.
     """
+    return generate_attribute_data(attribute_definitions, activities, 'activity', ['activity_id', 'process_id'],
+                                   seed)
 
-    event_attribute_rows = []
-    event_definitions = attribute_definitions[attribute_definitions['attribute_type'] == 'event']
-    attribute_values_cache = defaultdict(list)
-    as_attribute_mapping = {}
-
-    for event in events.itertuples():
-        process_id = event.process_id
-        for attribute in event_definitions[event_definitions['process_id'] == process_id].itertuples():
-            generation_level = attribute.generation_level
-            adjustment_type = attribute.adjustment_type
-            as_attribute = attribute.as_attribute
 
-            if as_attribute:
-                if as_attribute not in as_attribute_mapping:
-                    as_attribute_mapping[as_attribute] = []
-                as_attribute_mapping[as_attribute].append((event, attribute))
-                continue
+def generate_event_attribute_data(attribute_definitions: pd.DataFrame, events: pd.DataFrame,
+                                  cases: Optional[pd.DataFrame] = None, seed: Optional[int] = None) -> pd.DataFrame:
+    """
+    Generate event attribute data based on the events and attribute definitions.
 
-            if generation_level == 'process':
-                key = process_id
-            elif generation_level == 'case':
-                key = event.case_id
-            else:
-                key = (event.activity_instance_id, attribute.attribute_id)
-
-            if not attribute_values_cache[key]:
-                num_values = (
-                    len(events[events['process_id'] == process_id]) if generation_level == 'process' else
-                    len(events[events['case_id'] == event.case_id]) if generation_level == 'case' else
-                    1
-                )
-                attribute_values_cache[key] = [generate_attribute_value(
-                    attribute.attribute_value_type,
-                    attribute.distribution,
-                    attribute.categories,
-                    attribute.range[0],
-                    attribute.range[1]
-                ) for _ in range(num_values)]
-
-            value = attribute_values_cache[key].pop(0)
-            value = adjust_attribute_value(value, adjustment_type, attribute.range[0], attribute.range[1],
-                                           attribute.categories)
-
-            event_attribute_rows.append({
-                'attribute_definition_id': attribute.attribute_id,
-                'event_attribute_id': attribute.attribute_id,
-                'event_id': event.event_id,
-                'activity_instance_id': event.activity_instance_id,
-                'generation_level': generation_level,
-                'attribute_name': attribute.attribute_name,
-                'attribute_value': value
-            })
+    Every event draws at the counter of its case, numbered by its position within the case, so the values of a
+    case do not depend on the other cases.
 
-    # Process as_attribute at the end
-    for attr_name, attr_list in as_attribute_mapping.items():
-        for event, attribute in attr_list:
-            process_id = event.process_id
-            matched_attr = next((attr for attr in event_definitions.itertuples() if
-                                 attr.attribute_name == attr_name and attr.process_id == process_id), None)
-            if matched_attr:
-                value = next((row['attribute_value'] for row in event_attribute_rows if
-                              row['attribute_name'] == attr_name and row['event_id'] == event.event_id), None)
-                if value is not None:
-                    event_attribute_rows.append({
-                        'attribute_definition_id': attribute.attribute_id,
-                        'event_attribute_id': attribute.attribute_id,
-                        'event_id': event.event_id,
-                        'activity_instance_id': event.activity_instance_id,
-                        'generation_level': attribute.generation_level,
-                        'attribute_name': attribute.attribute_name,
-                        'attribute_value': value
-                    })
-                else:
-                    raise ValueError(f"Attribute '{attr_name}' value not found for event ID {event.event_id}.")
-            else:
-                raise ValueError(
-                    f"Attribute '{attr_name}' not found in attribute definitions for process ID {process_id}.")
+    Args:
+        attribute_definitions (pd.DataFrame): DataFrame representing attribute definitions.
+        events (pd.DataFrame): DataFrame representing events.
+        cases (pd.DataFrame, optional): DataFrame representing cases, used to join in the process ID of events
+            without a 'process_id' column.
+        seed (int, optional): The seed of the whole log.
 
-    event_attribute_df = pd.DataFrame(event_attribute_rows,
-                                      columns=['attribute_definition_id', 'event_attribute_id', 'event_id',
-                                               'activity_instance_id', 'generation_level', 'attribute_name',
-                                               'attribute_value'])
+    Returns:
+        pd.DataFrame: DataFrame representing event attribute data.
+    """
+    if 'process_id' not in events:
+        if cases is None:
+            raise ValueError("Events without a 'process_id' column require the cases to join it from.")
+        case_process_ids = pd.Series(cases['process_id'].to_numpy(), index=cases['case_id'])
+        events = events.assign(process_id=events['case_id'].map(case_process_ids).to_numpy())
 
-    return event_attribute_df
+    case_ids = events['case_id'].to_numpy()
+    positions = events.groupby('case_id', sort=False).cumcount().to_numpy()
+    return generate_attribute_data(attribute_definitions, events, 'event', ['event_id', 'activity_instance_id'],
+                                   seed, case_ids, positions)
 
 
-def generate_case_attribute_data(attribute_definitions: pd.DataFrame, cases: pd.DataFrame) -> pd.DataFrame:
+def generate_case_attribute_data(attribute_definitions: pd.DataFrame, cases: pd.DataFrame,
+                                 seed: Optional[int] = None) -> pd.DataFrame:
     """
     Generate case attribute data based on the cases and attribute definitions.
 
  Args:
         attribute_definitions (pd.DataFrame): DataFrame representing attribute definitions.
         cases (pd.DataFrame): DataFrame representing cases.
+        seed (int, optional): The seed of the whole log.
 
  Returns:
         pd.DataFrame: DataFrame representing case attribute data.
     """
-
-    case_attribute_rows = []
-    case_definitions = attribute_definitions[attribute_definitions['attribute_type'] == 'case']
-    attribute_values_cache = defaultdict(list)
-    as_attribute_mapping = {}
-
-    for case in cases.itertuples():
-        process_id = case.process_id
-        for attribute in case_definitions[case_definitions['process_id'] == process_id].itertuples():
-            generation_level = attribute.generation_level
-            adjustment_type = attribute.adjustment_type
-            as_attribute = attribute.as_attribute
-
-            if as_attribute:
-                if as_attribute not in as_attribute_mapping:
-                    as_attribute_mapping[as_attribute] = []
-                as_attribute_mapping[as_attribute].append((case, attribute))
-                continue
-
-            if generation_level == 'process':
-                key = process_id
-            else:
-                key = case.case_id
-
-            if not attribute_values_cache[key]:
-                num_values = (
-                    len(cases[cases['process_id'] == process_id]) if generation_level == 'process' else
-                    1
-                )
-                attribute_values_cache[key] = generate_attribute_values(
-                    attribute.attribute_value_type,
-                    attribute.distribution,
-                    attribute.categories,
-                    attribute.range[0],
-                    attribute.range[1],
-                    num_values=num_values
-                )
-            value = attribute_values_cache[key].pop(0)
-            value = adjust_attribute_value(value, adjustment_type, attribute.range[0], attribute.range[1],
-                                           attribute.categories)
-
-            case_attribute_rows.append({
-                'attribute_definition_id': attribute.attribute_id,
-                'case_attribute_id': attribute.attribute_id,
-                'case_id': case.case_id,
-                'process_id': process_id,
-                'generation_level': generation_level,
-                'attribute_name': attribute.attribute_name,
-                'attribute_value': value
-            })
-
-
-    # Process as_attribute at the end
-    for attr_name, attr_list in as_attribute_mapping.items():
-        for case, attribute in attr_list:
-            process_id = case.process_id
-            matched_attr = next((attr for attr in case_definitions.itertuples() if
-                                 attr.attribute_name == attr_name and attr.process_id == process_id), None)
-            if matched_attr:
-                value = next((row['attribute_value'] for row in case_attribute_rows if
-                              row['attribute_name'] == attr_name and row['case_id'] == case.case_id), None)
-                if value is not None:
-                    case_attribute_rows.append({
-                        'attribute_definition_id': attribute.attribute_id,
-                        'case_attribute_id': attribute.attribute_id,
-                        'case_id': case.case_id,
-                        'process_id': process_id,
-                        'generation_level': attribute.generation_level,
-                        'attribute_name': attribute.attribute_name,
-                        'attribute_value': value
-                    })
-                else:
-                    raise ValueError(f"Attribute '{attr_name}' value not found for case ID {case.case_id}.")
-            else:
-                raise ValueError(
-                    f"Attribute '{attr_name}' not found in attribute definitions for process ID {process_id}.")
-
-    case_attribute_df = pd.DataFrame(case_attribute_rows,
-                                     columns=['attribute_definition_id', 'case_attribute_id', 'case_id', 'process_id',
-                                              'generation_level',
-                                              'attribute_name', 'attribute_value'])
-
-    return case_attribute_df
+    return generate_attribute_data(attribute_definitions, cases, 'case', ['case_id', 'process_id'], seed)
 
 
-def generate_object_attribute_data(attribute_definitions: pd.DataFrame, objects: pd.DataFrame) -> pd.DataFrame:
+def generate_object_attribute_data(attribute_definitions: pd.DataFrame, objects: pd.DataFrame,
+                                   seed: Optional[int] = None) -> pd.DataFrame:
     """
     Generate object attribute data based on the objects and attribute definitions.
 
     Args:
         attribute_definitions (pd.DataFrame): DataFrame representing attribute definitions.
         objects (pd.DataFrame): DataFrame representing objects.
+        seed (int, optional): The seed of the whole log.
 
     Returns:
         pd.DataFrame: DataFrame representing object attribute data.
     """
-    object_attributes = []
-    object_definitions = attribute_definitions[attribute_definitions['attribute_type'] == 'object']
-    attribute_values_cache = defaultdict(dict)
-
-    for obj in objects.itertuples():
-        process_id = obj.process_id
-
-        for attribute in object_definitions[object_definitions['process_id'] == process_id].itertuples():
-            generation_level = attribute.generation_level
-            adjustment_type = attribute.adjustment_type
-            as_attribute = attribute.as_attribute
-
-            if generation_level == 'process':
-                key = process_id
-            else:
-                key = obj.object_id
-
-            if as_attribute and as_attribute in attribute_values_cache[key]:
-                attribute_value = attribute_values_cache[key][as_attribute]
-            else:
-                if key not in attribute_values_cache or attribute.attribute_name not in attribute_values_cache[key]:
-                    num_values = (
-                        len(objects[objects['process_id'] == process_id]) if generation_level == 'process' else
-                        1
-                    )
-                    attribute_values_cache[key][attribute.attribute_name] = generate_attribute_values(
-                        attribute.attribute_value_type,
-                        attribute.distribution if attribute.distribution else 'normal',
-                        attribute.categories,
-                        attribute.range[0],
-                        attribute.range[1],
-                        num_values=num_values
-                    )
-
-                attribute_value = attribute_values_cache[key][attribute.attribute_name].pop(0)
-
-            value = attribute_value
-            if adjustment_type == 'slight change':
-                value = random.uniform(attribute_value * 0.95, attribute_value * 1.05)
-            elif adjustment_type == 'moderate change':
-                value = random.uniform(attribute_value * 0.9, attribute_value * 1.1)
-            elif adjustment_type == 'significant change':
-                value = random.uniform(attribute.range[0], attribute.range[1])
-
-            object_attributes.append({
-                'attribute_definition_id': attribute.attribute_id,
-                'object_attribute_id': attribute.attribute_id,
-                'process_id': process_id,
-                'generation_level': generation_level,
-                'attribute_name': attribute.attribute_name,
-                'attribute_value': value
-            })
-
-    return pd.DataFrame(object_attributes)
+    return generate_attribute_data(attribute_definitions, objects, 'object', ['object_id', 'process_id'], seed)
 
 
 def generate_object_type_data(process_config_data: Dict) -> pd.DataFrame:
@@ -1182,22 +1522,27 @@ def generate_object_type_data(process_config_data: Dict) -> pd.DataFrame:
     """
     try:
         object_type_data = []
-        object_type_id = 1
+        object_type_id = process_config_data.get('object_type_id', 1)
 
-        for process_id, process in enumerate(process_config_data['processes'], start=1):
-            for object_type in process['object_types']:
+        for process in process_config_data['processes'].values():
+            if not (isinstance(process, dict) and 'process_id' in process):
+                continue
+            for object_type in process.get('object_types', []):
                 data = {
-                    'process_id': process_id,
+                    'process_id': process['process_id'],
                     'object_type_id': object_type_id,
                     'object_type': object_type['name'],
-                    'object_qualifiers': object_type['object_qualifiers'],
-                    'activity_qualifiers': object_type['activity_qualifiers'],
+                    'object_qualifiers': object_type.get('object_qualifiers', []),
+                    'activity_qualifiers': object_type.get('activity_qualifiers', []),
                     'range': object_type['range'],
+                    'objects_per_event': object_type.get('objects_per_event', 1),
                 }
                 object_type_data.append(data)
                 object_type_id += 1
 
-        df = pd.DataFrame(object_type_data)
+        df = pd.DataFrame(object_type_data, columns=['process_id', 'object_type_id', 'object_type',
+                                                     'object_qualifiers', 'activity_qualifiers', 'range',
+                                                     'objects_per_event'])
         logging.info("Object type data generated successfully.")
         return df
     except KeyError as e:
@@ -1244,36 +1589,114 @@ def generate_objects_data(object_types_df: pd.DataFrame) -> pd.DataFrame:
         raise e
 
 
+def index_objects_by_type(objects_df: pd.DataFrame) -> Tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Index the objects of every object type as a contiguous pool.
+
+    Args:
+        objects_df (pd.DataFrame): DataFrame representing objects.
+
+    Returns:
+        Tuple[pd.Index, np.ndarray, np.ndarray, np.ndarray]: The object type IDs, the start and size of each type's
+        pool, and the object IDs ordered by type.
+    """
+    object_type_ids = objects_df['object_type_id'].to_numpy()
+    order = np.argsort(object_type_ids, kind='stable')
+    types, pool_starts, pool_sizes = np.unique(object_type_ids[order], return_index=True, return_counts=True)
+    return pd.Index(types), pool_starts, pool_sizes, objects_df['object_id'].to_numpy()[order]
+
+
 def generate_event_object_data(object_types_df: pd.DataFrame, objects_df: pd.DataFrame,
-                               events_df: pd.DataFrame) -> pd.DataFrame:
+                               events_df: pd.DataFrame, activities_df: Optional[pd.DataFrame] = None,
+                               objects_per_event: Optional[int] = None, seed: Optional[int] = None) -> pd.DataFrame:
     """
     Create a DataFrame of event to object relationships and set qualifier name for such relationships.
 
+    The activity qualifiers of the object types are compiled into a dict from (process, activity name) to the
+    qualified object types. Events are joined to it on their activity and every link draws its objects from the
+    pool of its object type in one vectorized draw, so the cost grows with the number of links instead of
+    events times objects.
+
     Args:
         object_types_df (pd.DataFrame): DataFrame representing object types.
         objects_df (pd.DataFrame): DataFrame representing objects.
         events_df (pd.DataFrame): DataFrame representing events.
+        activities_df (pd.DataFrame, optional): DataFrame representing activities, used to look up the activity
+            name and process of events without 'activity_name' and 'process_id' columns.
+        objects_per_event (int, optional): Number of objects drawn per event and qualified object type. Defaults
+            to the 'objects_per_event' of each object type.
+        seed (int, optional): The seed of the whole log. The global random generators are used if not given.
 
     Returns:
         pd.DataFrame: DataFrame representing event_to_object relationships.
     """
+    columns = ['event_id', 'object_id', 'qualifier']
     try:
-        event_object_data = []
-
-        for _, event in events_df.iterrows():
-            to_activity = event['to_activity']
-            for _, obj in objects_df.iterrows():
-                if obj['object_type'] == to_activity:
-                    qualifier = object_types_df[object_types_df['object_type_id'] == obj['object_type_id']].iloc[0].get(
-                        'activity_qualifiers', '')
-                    data = {
-                        'event_id': event['id'],
-                        'object_id': obj['object_id'],
-                        'qualifier': qualifier
-                    }
-                    event_object_data.append(data)
-
-        df = pd.DataFrame(event_object_data)
+        if {'activity_name', 'process_id'}.issubset(events_df.columns):
+            activity_names = events_df['activity_name'].to_numpy()
+            process_ids = events_df['process_id'].to_numpy()
+        else:
+            if activities_df is None:
+                raise ValueError("Events without activity names require activities_df to look them up.")
+            activity_rows = pd.Index(activities_df['activity_id']).get_indexer(events_df['activity_id'])
+            if (activity_rows < 0).any():
+                raise ValueError("Events reference activities that are not in activities_df.")
+            activity_names = activities_df['activity_name'].to_numpy()[activity_rows]
+            process_ids = activities_df['process_id'].to_numpy()[activity_rows]
+
+        # Qualified object types per (process, activity name)
+        qualifiers = defaultdict(list)
+        for object_type in object_types_df.itertuples():
+            count = objects_per_event if objects_per_event is not None else getattr(object_type,
+                                                                                     'objects_per_event', 1)
+            for activity_qualifier in object_type.activity_qualifiers or []:
+                qualifiers[(object_type.process_id, activity_qualifier['to_activity'])].append(
+                    (object_type.object_type_id, activity_qualifier['name'], int(count)))
+
+        # Join every event to the qualified object types of its activity
+        process_codes, process_values = pd.factorize(process_ids)
+        name_codes, name_values = pd.factorize(activity_names)
+        key_codes, combined_keys = pd.factorize(process_codes.astype(np.int64) * len(name_values) + name_codes)
+        key_links = [qualifiers.get((process_values[key // len(name_values)], name_values[key % len(name_values)]),
+                                    []) for key in combined_keys]
+        flat_links = [link for links in key_links for link in links]
+        key_lengths = np.array([len(links) for links in key_links], dtype=np.int64)
+        key_starts = np.cumsum(key_lengths) - key_lengths
+        link_counts = key_lengths[key_codes]
+        event_index = np.repeat(np.arange(len(events_df)), link_counts)
+        link_positions = np.arange(len(event_index)) - np.repeat(np.cumsum(link_counts) - link_counts, link_counts)
+        link_index = key_starts[key_codes][event_index] + link_positions
+        if len(link_index) == 0:
+            return pd.DataFrame(columns=columns)
+
+        link_types = np.array([link[0] for link in flat_links])[link_index]
+        link_qualifiers = np.array([link[1] for link in flat_links], dtype=object)[link_index]
+        link_sizes = np.array([link[2] for link in flat_links], dtype=np.int64)[link_index]
+
+        # Draw objects_per_event objects from the pool of every link's object type
+        types, pool_starts, pool_sizes, pooled_object_ids = index_objects_by_type(objects_df)
+        type_codes = types.get_indexer(link_types)
+        link_sizes[type_codes < 0] = 0
+        draw_index = np.repeat(np.arange(len(link_index)), link_sizes)
+        draw_events = event_index[draw_index]
+        event_draws = np.arange(len(draw_index)) - np.searchsorted(draw_events, draw_events)
+        event_ids = events_df['event_id'].to_numpy()[draw_events]
+        rng = case_random(seed, STREAM_EVENT_OBJECTS, process_ids[draw_events], event_ids, event_draws)
+        codes = type_codes[draw_index]
+        picks = rng.randint(0, pool_sizes[codes], size=len(draw_index))
+        df = pd.DataFrame({
+            'event_id': event_ids,
+            'object_id': pooled_object_ids[pool_starts[codes] + picks],
+            'qualifier': link_qualifiers[draw_index]
+        }, columns=columns)
+
+        # Links drawing several objects may draw the same object twice, keep it once
+        multiple = link_sizes[draw_index] > 1
+        if multiple.any():
+            duplicated = np.zeros(len(df), dtype=bool)
+            duplicated[multiple] = pd.DataFrame({'link': draw_index[multiple],
+                                                 'pick': picks[multiple]}).duplicated().to_numpy()
+            df = df[~duplicated].reset_index(drop=True)
         logging.info("Event to object data generated successfully.")
         return df
     except KeyError as e:
@@ -1281,35 +1704,85 @@ def generate_event_object_data(object_types_df: pd.DataFrame, objects_df: pd.Dat
         raise e
 
 
-def generate_object_to_object_data(object_types_df: pd.DataFrame, objects_df: pd.DataFrame) -> pd.DataFrame:
+def generate_object_to_object_data(object_types_df: pd.DataFrame, objects_df: pd.DataFrame,
+                                   seed: Optional[int] = None) -> pd.DataFrame:
     """
     Create a DataFrame of object to object relationships and set qualifier name for such relationships.
 
+    Every object qualifier of an object type relates each object of the type to objects of its 'to_object' type
+    in the same process. The number of related objects per object is drawn from 'degree_distribution' within
+    'degree_range', bounded by the number of objects of the related type, and the related objects are drawn from
+    that type's pool in one vectorized draw per qualifier. Time and memory therefore grow with the number of
+    relationships instead of the square of the number of objects. An object is never related to itself and a
+    related object drawn twice is kept once.
+
     Args:
         object_types_df (pd.DataFrame): DataFrame representing object types.
         objects_df (pd.DataFrame): DataFrame representing objects.
+        seed (int, optional): The seed of the whole log. The global random generators are used if not given.
 
     Returns:
         pd.DataFrame: DataFrame representing object_to_object relationships.
     """
+    columns = ['object_id', 'object_id_code', 'related_object_id', 'qualifier']
     try:
-        object_to_object_data = []
-
-        for _, obj in objects_df.iterrows():
-            object_id_code = obj['object_id_code']
-            for _, related_obj in objects_df.iterrows():
-                if obj['object_type'] == related_obj['object_type'] and obj['object_id'] != related_obj['object_id']:
-                    qualifier = object_types_df[object_types_df['object_type_id'] == obj['object_type_id']].iloc[0].get(
-                        'object_qualifiers', '')
-                    data = {
-                        'object_id': obj['object_id'],
-                        'object_id_code': object_id_code,
-                        'related_object_id': related_obj['object_id'],
-                        'qualifier': qualifier
-                    }
-                    object_to_object_data.append(data)
-
-        df = pd.DataFrame(object_to_object_data)
+        types, pool_starts, pool_sizes, pooled_object_ids = index_objects_by_type(objects_df)
+        object_codes = objects_df['object_id_code'].to_numpy()
+        object_rows = pd.Index(objects_df['object_id'])
+        type_ids = {(object_type.process_id, object_type.object_type): object_type.object_type_id
+                    for object_type in object_types_df.itertuples()}
+
+        frames = []
+        for object_type in object_types_df.itertuples():
+            for qualifier_index, qualifier in enumerate(object_type.object_qualifiers or []):
+                target_type_id = type_ids.get((object_type.process_id, qualifier['to_object']))
+                if target_type_id is None:
+                    logging.warning(f"Object qualifier '{qualifier['name']}' of {object_type.object_type} refers to "
+                                    f"unknown object type {qualifier['to_object']}.")
+                    continue
+                source_code, target_code = types.get_indexer([object_type.object_type_id, target_type_id])
+                if source_code < 0 or target_code < 0:
+                    continue
+                source_start, num_sources = pool_starts[source_code], pool_sizes[source_code]
+                target_start, num_targets = pool_starts[target_code], pool_sizes[target_code]
+                source_ids = pooled_object_ids[source_start:source_start + num_sources]
+                same_type = source_code == target_code
+                available = num_targets - 1 if same_type else num_targets
+
+                # Number of related objects per source object, bounded by the objects available
+                degree_min, degree_max = qualifier.get('degree_range', [1, 1])
+                degree_max = min(int(degree_max), available)
+                degree_min = min(int(degree_min), degree_max)
+                if degree_max > degree_min:
+                    rng = case_random(seed, STREAM_OBJECT_RELATIONS, object_type.process_id, source_ids, 0,
+                                      qualifier_index)
+                    degrees = np.floor(sample_truncated(qualifier.get('degree_distribution', 'uniform'), degree_min,
+                                                        degree_max + 1, num_sources, rng=rng)).astype(np.int64)
+                    degrees = np.minimum(degrees, degree_max)
+                else:
+                    degrees = np.full(num_sources, degree_max, dtype=np.int64)
+                if degrees.sum() == 0:
+                    continue
+
+                # Draw the related objects, skipping the source object itself within its own type
+                source_index = np.repeat(np.arange(num_sources), degrees)
+                draws = 1 + np.arange(len(source_index)) - np.repeat(np.cumsum(degrees) - degrees, degrees)
+                rng = case_random(seed, STREAM_OBJECT_RELATIONS, object_type.process_id, source_ids[source_index],
+                                  draws, qualifier_index)
+                picks = rng.randint(0, available, size=len(source_index))
+                if same_type:
+                    picks += picks >= source_index
+                edges = pd.DataFrame({'source': source_index, 'pick': picks})
+                edges = edges[~edges.duplicated()]
+                object_ids = source_ids[edges['source'].to_numpy()]
+                frames.append(pd.DataFrame({
+                    'object_id': object_ids,
+                    'object_id_code': object_codes[object_rows.get_indexer(object_ids)],
+                    'related_object_id': pooled_object_ids[target_start + edges['pick'].to_numpy()],
+                    'qualifier': qualifier['name']
+                }, columns=columns))
+
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
         logging.info("Object to object data generated successfully.")
         return df
     except KeyError as e:
@@ -1317,8 +1790,391 @@ def generate_object_to_object_data(object_types_df: pd.DataFrame, objects_df: pd
         raise e
 
 
+def count_case_variants(trace_counts: Dict[str, int], case_variants: np.ndarray) -> Dict[str, int]:
+    """
+    Count the cases of every trace pattern among the given case variants.
+
+    Args:
+        trace_counts (dict): Number of cases per trace pattern, whose order defines the variant IDs.
+        case_variants (np.ndarray): The variant ID of every case, see assign_case_variants.
+
+    Returns:
+        dict: Number of the given cases per trace pattern, in the order of trace_counts.
+    """
+    counts = np.bincount(case_variants, minlength=len(trace_counts) + 1)[1:]
+    return dict(zip(trace_counts.keys(), counts.tolist()))
+
+
+def count_trace_items(activities_df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+    """
+    Count the activity instances and events a single occurrence of every trace expands to.
+
+    Args:
+        activities_df (pd.DataFrame): DataFrame representing activities.
+
+    Returns:
+        Tuple[pd.Series, pd.Series]: Activity instance and event counts indexed by (process_id, trace).
+    """
+    transaction_types = compile_transaction_types(activities_df)
+    keys = [activities_df['process_id'].to_numpy(), activities_df['trace'].to_numpy()]
+    activity_counts = activities_df.groupby(['process_id', 'trace'], sort=False).size()
+    event_counts = pd.Series(np.maximum(transaction_types['tt_count'], 1)).groupby(keys, sort=False).sum()
+    return activity_counts, event_counts
+
+
+def count_trace_pattern_ids(process_id: int, trace_counts: Dict[str, int], activity_counts: pd.Series,
+                            event_counts: pd.Series) -> Tuple[int, int]:
+    """
+    Count the activity instance and event IDs used by the cases of the given trace counts.
+
+    Args:
+        process_id (int): The process of the cases.
+        trace_counts (dict): Number of cases per trace pattern.
+        activity_counts (pd.Series): Activity instances per (process_id, trace), see count_trace_items.
+        event_counts (pd.Series): Events per (process_id, trace), see count_trace_items.
+
+    Returns:
+        Tuple[int, int]: The number of activity instance IDs and event IDs.
+    """
+    activity_instances, events = 0, 0
+    for pattern, count in trace_counts.items():
+        traces = pattern.split(',')
+        activity_instances += count * sum(activity_counts.get((process_id, trace), 0) for trace in traces)
+        events += count * sum(event_counts.get((process_id, trace), 0) for trace in traces)
+    return int(activity_instances), int(events)
+
+
+def plan_event_log_shards(process_config_data: Dict[str, Any], activities_df: pd.DataFrame,
+                          shard_size: Optional[int] = None, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Split the cases of every process into shards with precomputed ID ranges and random seeds.
+
+    The variants of all cases of a process are assigned up front and sliced into shards. The number of activity
+    instances and events of a case only depends on its variant, so the first case, activity instance and event ID
+    of every shard are known before anything is generated. Each shard is seeded from (seed, process_id, shard
+    index), which makes the generated log independent of how shards are scheduled.
+    Dates and durations are drawn per case from keyed streams and do not depend on the shards.
+
+    Args:
+        process_config_data (dict): Dictionary containing process configuration.
+        activities_df (pd.DataFrame): DataFrame representing activities.
+        shard_size (int, optional): Maximum number of cases per shard. One shard per process if not given.
+        seed (int, optional): The seed of the whole log.
+
+    Returns:
+        list: Shards, each with the 'config' to generate and the 'seed' key of its random generators.
+    """
+    activity_counts, event_counts = count_trace_items(activities_df)
+    case_id = process_config_data['case_id']
+    activity_instance_id = process_config_data['activity_instance_id']
+    event_id = process_config_data['event_id']
+    shards = []
+    for process_key, process in process_config_data['processes'].items():
+        if not (isinstance(process, dict) and 'process_id' in process):
+            continue
+        process_id = process['process_id']
+        case_variants = assign_case_variants(process, seed)
+        step = shard_size or max(len(case_variants), 1)
+        for shard_index, shard_start in enumerate(range(0, len(case_variants), step)):
+            shard_variants = case_variants[shard_start:shard_start + step]
+            num_cases = len(shard_variants)
+            trace_counts = count_case_variants(process['trace_counts'], shard_variants)
+            shard_process = dict(process, num_cases=num_cases, trace_counts=trace_counts,
+                                 case_variants=shard_variants)
+            shard_config = dict(process_config_data, processes={process_key: shard_process},
+                                case_id=case_id, activity_instance_id=activity_instance_id, event_id=event_id,
+                                seed=seed)
+            shards.append({'config': shard_config, 'seed': [seed, process_id, shard_index]})
+
+            activity_instances, events = count_trace_pattern_ids(process_id, trace_counts, activity_counts,
+                                                                 event_counts)
+            case_id += num_cases
+            activity_instance_id += activity_instances
+            event_id += events
+    return shards
+
+
+def seed_random_generators(seed_key: List[int]):
+    """
+    Seed the random and NumPy generators used by the generation functions. Value pools seed their own Faker
+    instances.
+
+    Args:
+        seed_key (list): Integers identifying the random stream, e.g. [seed, process_id, shard index].
+    """
+    state = np.random.SeedSequence(seed_key).generate_state(4)
+    np.random.seed(state)
+    random.seed(int(state[0]) << 32 | int(state[1]))
+
+
+def generate_event_log_shard(shard: Dict[str, Any], activities_df: pd.DataFrame,
+                             attribute_definitions_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Generate the cases, activity instances, events and attributes of one shard.
+
+    Args:
+        shard (dict): A shard created by plan_event_log_shards.
+        activities_df (pd.DataFrame): DataFrame representing activities.
+        attribute_definitions_df (pd.DataFrame): DataFrame representing attribute definitions.
+
+    Returns:
+        dict: The 'cases', 'activity_instances', 'events', 'case_attributes' and 'event_attributes' DataFrames of
+        the shard.
+    """
+    seed_random_generators(shard['seed'])
+    shard_config = shard['config']
+    configure_value_pools(shard_config.get('locale'), shard_config.get('value_pool_size'),
+                          shard_config.get('value_pool_cache_dir'))
+    cases_df = generate_case_data(shard_config)
+    activity_instances_df = generate_activity_instance_data(shard_config, cases_df, activities_df)
+    events_df = generate_event_data(shard_config, activity_instances_df, activities_df)
+
+    case_attributes_df = generate_case_attribute_data(attribute_definitions_df, cases_df, shard_config.get('seed'))
+    event_attributes_df = generate_event_attribute_data(attribute_definitions_df, events_df, cases_df,
+                                                        shard_config.get('seed'))
+
+    return {
+        'cases': cases_df,
+        'activity_instances': activity_instances_df,
+        'events': events_df,
+        'case_attributes': case_attributes_df,
+        'event_attributes': event_attributes_df
+    }
+
+
+def generate_single_case(process_config_data: Dict[str, Any], activities_df: pd.DataFrame,
+                         attribute_definitions_df: pd.DataFrame, case_id: int,
+                         seed: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Regenerate one case of the event log without generating the cases before it.
+
+    The case gets the variant and the activity instance and event IDs it has in the full log, and its dates,
+    durations and attribute values are drawn from the same keyed streams.
+
+    Args:
+        process_config_data (dict): Dictionary containing process configuration.
+        activities_df (pd.DataFrame): DataFrame representing activities.
+        attribute_definitions_df (pd.DataFrame): DataFrame representing attribute definitions.
+        case_id (int): The ID of the case to generate.
+        seed (int, optional): The seed of the whole log. Defaults to the 'seed' of the configuration.
+
+    Returns:
+        dict: The 'cases', 'activity_instances', 'events', 'case_attributes' and 'event_attributes' DataFrames of
+        the case.
+    """
+    seed = seed if seed is not None else process_config_data.get('seed')
+    if seed is None:
+        raise ValueError("A seed is required to regenerate a single case.")
+
+    activity_counts, event_counts = count_trace_items(activities_df)
+    first_case_id = process_config_data['case_id']
+    activity_instance_id = process_config_data['activity_instance_id']
+    event_id = process_config_data['event_id']
+    for process_key, process in process_config_data['processes'].items():
+        if not (isinstance(process, dict) and 'process_id' in process):
+            continue
+        process_id = process['process_id']
+        case_variants = assign_case_variants(process, seed)
+        num_cases = len(case_variants)
+        offset = case_id - first_case_id
+        if 0 <= offset < num_cases:
+            # Skip the IDs of the cases before this one
+            prefix_counts = count_case_variants(process['trace_counts'], case_variants[:offset])
+            activity_instances, events = count_trace_pattern_ids(process_id, prefix_counts, activity_counts,
+                                                                 event_counts)
+            case_process = dict(process, num_cases=1, case_variants=case_variants[offset:offset + 1],
+                                trace_counts=count_case_variants(process['trace_counts'],
+                                                                 case_variants[offset:offset + 1]))
+            case_config = dict(process_config_data, processes={process_key: case_process},
+                               case_id=case_id, activity_instance_id=activity_instance_id + activity_instances,
+                               event_id=event_id + events, seed=seed)
+            return generate_event_log_shard({'config': case_config, 'seed': [seed, process_id, case_id]},
+                                            activities_df, attribute_definitions_df)
+
+        activity_instances, events = count_trace_pattern_ids(process_id,
+                                                             count_case_variants(process['trace_counts'],
+                                                                                 case_variants),
+                                                             activity_counts, event_counts)
+        first_case_id += num_cases
+        activity_instance_id += activity_instances
+        event_id += events
+    raise ValueError(f"Case {case_id} is not part of the configured processes.")
+
+
+def iter_event_log_chunks(process_config_data: Dict[str, Any], activities_df: pd.DataFrame,
+                          attribute_definitions_df: pd.DataFrame, chunk_size: Optional[int] = None,
+                          workers: int = 1, seed: Optional[int] = None) -> Iterator[Dict[str, pd.DataFrame]]:
+    """
+    Generate the event log as a stream of chunks with bounded memory.
+
+    Each chunk of cases flows through activity instances, events and attributes before it is yielded. With more
+    than one worker, chunks are generated in a process pool and yielded in their planned order. As every chunk has
+    its own ID ranges and random seed, the log is identical regardless of the number of workers.
+
+    Args:
+        process_config_data (dict): Dictionary containing process configuration.
+        activities_df (pd.DataFrame): DataFrame representing activities.
+        attribute_definitions_df (pd.DataFrame): DataFrame representing attribute definitions.
+        chunk_size (int, optional): Maximum number of cases per chunk. One chunk per process if not given.
+        workers (int): Number of worker processes.
+        seed (int, optional): The seed of the whole log. A random seed is drawn and logged if not given.
+
+    Yields:
+        dict: The 'cases', 'activity_instances', 'events', 'case_attributes' and 'event_attributes' DataFrames of
+        one chunk.
+    """
+    if seed is None:
+        seed = int(np.random.SeedSequence().entropy % 2 ** 63)
+        logging.info(f"Generating event log with random seed {seed}")
+    shards = plan_event_log_shards(process_config_data, activities_df, chunk_size, seed)
+
+    if workers <= 1:
+        for shard in shards:
+            yield generate_event_log_shard(shard, activities_df, attribute_definitions_df)
+        return
+
+    # Keep a bounded number of shards in flight so finished chunks do not pile up in memory
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = collections.deque()
+        for shard in shards:
+            pending.append(executor.submit(generate_event_log_shard, shard, activities_df, attribute_definitions_df))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def iter_event_log_tables(process_config_data: Dict[str, Any], chunk_size: Optional[int] = None, workers: int = 1,
+                          seed: Optional[int] = None) -> Iterator[Dict[str, pd.DataFrame]]:
+    """
+    Generate all tables of the event log chunk by chunk.
+
+    The processes, activities and attribute definitions are generated once and added to the first chunk, the case
+    tables stream from iter_event_log_chunks.
+
+    Args:
+        process_config_data (dict): Dictionary containing process configuration.
+        chunk_size (int, optional): Maximum number of cases per chunk. One chunk per process if not given.
+        workers (int): Number of worker processes.
+        seed (int, optional): The seed of the whole log. A random seed is drawn and logged if not given.
+
+    Yields:
+        dict: The tables of one chunk, keyed as the table arguments of the writers, e.g. 'cases' or 'events'.
+    """
+    processes_df = generate_process_data(process_config_data)
+    logging.info("Process data generated")
+    activities_df = generate_activity_data(process_config_data)
+    logging.info("Activity data generated")
+    attribute_definitions_df = create_attribute_definitions(process_config_data)
+    logging.info("Attribute definitions generated")
+
+    chunks = iter_event_log_chunks(process_config_data, activities_df, attribute_definitions_df, chunk_size, workers,
+                                   seed)
+    for chunk_number, chunk in enumerate(chunks):
+        if chunk_number == 0:
+            chunk.update(processes=processes_df, activities=activities_df,
+                         attribute_definitions=attribute_definitions_df)
+        yield chunk
+
+
+def event_log_record_batch_reader(process_config_data: Dict[str, Any], table: str = 'events',
+                                  chunk_size: Optional[int] = None, workers: int = 1,
+                                  seed: Optional[int] = None) -> Any:
+    """
+    Stream one table of the event log as Arrow record batches.
+
+    The log is generated while the reader is consumed, so tools such as DuckDB or Polars can query it without
+    holding the whole log in memory or going through files, e.g. duckdb.sql("SELECT ... FROM reader").
+
+    Args:
+        process_config_data (dict): Dictionary containing process configuration.
+        table (str): The table to stream, e.g. 'cases', 'events' or 'event_attributes'.
+        chunk_size (int, optional): Maximum number of cases per chunk and record batch.
+        workers (int): Number of worker processes.
+        seed (int, optional): The seed of the whole log. Defaults to the seed of the configuration.
+
+    Returns:
+        pa.RecordBatchReader: A reader of the table's record batches.
+    """
+    if seed is None:
+        seed = process_config_data.get('seed')
+    from arrow_output import to_record_batches
+
+    return to_record_batches(iter_event_log_tables(process_config_data, chunk_size, workers, seed), table)
+
+
+def write_event_log_chunk(output_type: str, output_file: str, tables: Dict[str, pd.DataFrame], mode: str = 'w'):
+    """
+    Write the tables of one event log chunk with the writer of the given output type.
+
+    Args:
+        output_type (str): The output type ('csv', 'combined_csv' or 'sql').
+        output_file (str): The output directory, file prefix or file name, depending on the output type.
+        tables (dict): DataFrames keyed by the table arguments of the writers, e.g. 'cases' or 'events'.
+        mode (str): 'w' to start a new output, 'a' to append to the output of earlier chunks.
+    """
+    writers = {
+        'csv': write_data_to_csv,
+        'combined_csv': write_data_to_combined_csv,
+        'sql': write_data_to_sql
+    }
+    if output_type not in writers:
+        raise ValueError(f"Unknown output type: {output_type}")
+    writers[output_type](output_file, mode=mode, **{'processes': None, **tables})
+
+
+# Writers that keep their output open across chunks, created with the output file and closed at the end. Given as
+# (module, class) and imported on use, so that starting the generator does not load pyarrow or the database drivers.
+STREAMING_WRITERS = {
+    'parquet': ('arrow_output', 'ParquetLogWriter'),
+    'arrow': ('arrow_output', 'ArrowIpcLogWriter'),
+    'duckdb': ('database_output', 'DuckDBLogWriter'),
+    'sqlite': ('database_output', 'SQLiteLogWriter'),
+    'postgres_copy': ('database_output', 'PostgresCopyWriter')
+}
+
+
+@contextlib.contextmanager
+def open_event_log_output(output_type: str, output_file: str) -> Iterator[Any]:
+    """
+    Open the output of an event log and yield a function writing one chunk of tables after the other.
+
+    Streaming writers, e.g. Parquet, Arrow IPC or DuckDB, stay open until all chunks are written. The other
+    writers start a new output with the first chunk and append the later ones.
+
+    Args:
+        output_type (str): The output type, 'csv', 'combined_csv', 'sql' or one of STREAMING_WRITERS.
+        output_file (str): The output directory, file prefix or file name, depending on the output type.
+
+    Yields:
+        Callable: A function taking the tables of one chunk.
+    """
+    if output_type in STREAMING_WRITERS:
+        module_name, class_name = STREAMING_WRITERS[output_type]
+        writer = getattr(importlib.import_module(module_name), class_name)(output_file)
+        try:
+            yield writer.write
+        finally:
+            writer.close()
+        return
+
+    chunks_written = 0
+
+    def write_chunk(tables: Dict[str, pd.DataFrame]):
+        nonlocal chunks_written
+        write_event_log_chunk(output_type, output_file, tables, mode='w' if chunks_written == 0 else 'a')
+        chunks_written += 1
+
+    yield write_chunk
+
+
+# Timestamp format of the CSV writers. Fixed, as pandas drops the microseconds of a chunk whose timestamps all have
+# none, which would make the output depend on the chunk boundaries.
+CSV_DATE_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+
 def write_data_to_csv(directory, processes, cases=None, attribute_definitions=None, case_attributes=None,
-                      activities=None, activity_instances=None, events=None, event_attributes=None):
+                      activities=None, activity_instances=None, events=None, event_attributes=None, mode='w'):
     """
     Writes the provided process data to CSV files.
 
@@ -1332,6 +2188,7 @@ def write_data_to_csv(directory, processes, cases=None, attribute_definitions=No
         activity_instances (pd.DataFrame): DataFrame representing activity instances.
         events (pd.DataFrame): DataFrame representing events.
         event_attributes (pd.DataFrame): DataFrame representing event attributes.
+        mode (str): 'w' to overwrite the files, 'a' to append rows to them without repeating the header.
     """
     table_mappings = {
         'attribute_definitions': 'AttributeDefinitions.csv',
@@ -1352,17 +2209,21 @@ def write_data_to_csv(directory, processes, cases=None, attribute_definitions=No
             if df is not None:
                 filepath = f"{directory}/{table_mappings[key]}"
                 try:
-                    df.to_csv(filepath, index=False)
+                    df.to_csv(filepath, index=False, mode=mode, date_format=CSV_DATE_FORMAT,
+                              header=mode == 'w' or not os.path.exists(filepath))
                     logging.info(f"Successfully wrote {key} data to {filepath}")
                 except Exception as e:
                     logging.error(f"Error writing {key} data to {filepath}: {e}")
+                    raise
 
     except Exception as e:
         logging.critical(f"Failed to write CSV files to directory {directory}: {e}")
+        raise
 
 
 def write_data_to_combined_csv(filename, processes, cases=None, attribute_definitions=None, case_attributes=None,
-                               activities=None, activity_instances=None, events=None, event_attributes=None):
+                               activities=None, activity_instances=None, events=None, event_attributes=None,
+                               mode='w'):
     """
     Write data to a combined CSV file.
 
@@ -1376,66 +2237,61 @@ def write_data_to_combined_csv(filename, processes, cases=None, attribute_defini
         activity_instances (pd.DataFrame): DataFrame representing activity instances.
         events (pd.DataFrame): DataFrame representing events.
         event_attributes (pd.DataFrame): DataFrame representing event attributes.
+        mode (str): 'w' to overwrite the file, 'a' to append rows to it without repeating the header.
     """
+    output_file = f"combined_{filename}.csv"
     try:
-        # Merge cases with case attributes
-        if cases is not None and case_attributes is not None:
-            case_attributes_merged = case_attributes.pivot(index='case_id', columns='case_attribute_name',
-                                                           values='case_attribute_value')
-            cases = cases.merge(case_attributes_merged, on='case_id', how='left')
-
-        # Merge events with event attributes
-        if events is not None and event_attributes is not None:
-            event_attributes_merged = event_attributes.pivot(index='event_id', columns='event_attribute_name',
-                                                             values='event_attribute_value')
-            events = events.merge(event_attributes_merged, on='event_id', how='left')
-
-        # Merge events with activity instances
-        if events is not None and activity_instances is not None:
-            events = events.merge(activity_instances, on='activity_instance_id', how='left',
-                                  suffixes=('', '_activity_instance'))
-
-        # Merge events with activities
-        if events is not None and activities is not None:
-            events = events.merge(activities, on='activity_id', how='left', suffixes=('', '_activity'))
-
-        # Merge events with cases
-        if events is not None and cases is not None:
-            events = events.merge(cases, on='case_id', how='left', suffixes=('', '_case'))
-
-        # Merge events with processes
-        if events is not None and processes is not None:
-            events = events.merge(processes, on='process_id', how='left', suffixes=('', '_process'))
-
-        # Flatten the data to the required columns
-        if events is not None:
-            combined_data = events[['process_id', 'case_id', 'event_id', 'transaction_type', 'position_in_trace',
-                                    'start_time_case', 'end_time_case', 'timestamp', 'end_time',
-                                    'activity_name', 'activity_id']]
-
-            # Add case attribute columns
-            if case_attributes is not None:
-                case_attribute_columns = case_attributes['case_attribute_name'].unique()
-                for col in case_attribute_columns:
-                    combined_data[col] = events[col]
+        if events is None:
+            return
+        if cases is not None:
+            cases = cases[['case_id', 'process_id', 'start_date', 'end_date']]
+
+        # One column per attribute, prefixed by its level, as cases and events may have attributes of the same name
+        attribute_columns = []
+        for level, attributes, entity_column in [('case', case_attributes, 'case_id'),
+                                                 ('event', event_attributes, 'event_id')]:
+            if attributes is None or attributes.empty or (level == 'case' and cases is None):
+                continue
+            attributes = attributes.drop_duplicates([entity_column, 'attribute_name'])
+            pivoted = attributes.pivot(index=entity_column, columns='attribute_name', values='attribute_value')
+            pivoted.columns = [f"{level}_{name}" for name in pivoted.columns]
+            attribute_columns.extend(pivoted.columns)
+            if level == 'case':
+                cases = cases.merge(pivoted, left_on='case_id', right_index=True, how='left')
+            else:
+                events = events.merge(pivoted, left_on='event_id', right_index=True, how='left')
 
-            # Add event attribute columns
-            if event_attributes is not None:
-                event_attribute_columns = event_attributes['event_attribute_name'].unique()
-                for col in event_attribute_columns:
-                    combined_data[col] = events[col]
+        # Take the position and name of the activity from the activity instances, the process from the cases
+        if activity_instances is not None:
+            events = events.merge(activity_instances[['activity_instance_id', 'activity_name', 'position_in_trace']],
+                                  on='activity_instance_id', how='left')
+        if cases is not None:
+            events = events.merge(cases, on='case_id', how='left', suffixes=('', '_case'))
 
-            output_file = f"combined_{filename}.csv"
-            combined_data.to_csv(output_file, index=False)
-            logging.info(f"Successfully wrote combined CSV data to {output_file}")
+        # The attribute columns of the whole log are known from the definitions of the first chunk, later chunks are
+        # aligned to the header already written
+        if attribute_definitions is not None:
+            for level in ['case', 'event']:
+                names = attribute_definitions.loc[attribute_definitions['attribute_type'] == level, 'attribute_name']
+                attribute_columns.extend(f"{level}_{name}" for name in names.drop_duplicates())
+        columns = ['process_id', 'case_id', 'event_id', 'transaction_name', 'position_in_trace', 'start_date_case',
+                   'end_date_case', 'start_date', 'end_date', 'activity_name', 'activity_id',
+                   *dict.fromkeys(attribute_columns)]
+        append = mode == 'a' and os.path.exists(output_file)
+        if append:
+            columns = pd.read_csv(output_file, nrows=0).columns
+        combined_data = events.reindex(columns=columns)
+        combined_data.to_csv(output_file, index=False, mode=mode, date_format=CSV_DATE_FORMAT, header=not append)
+        logging.info(f"Successfully wrote combined CSV data to {output_file}")
 
     except Exception as e:
-        logging.critical(f"Failed to write combined CSV file: {e}")
+        logging.critical(f"Failed to write combined CSV file {output_file}: {e}")
+        raise
 
 
 def write_data_to_sql(filename, processes, cases=None, attribute_definitions=None, case_attributes=None,
                       activities=None,
-                      activity_instances=None, events=None, event_attributes=None):
+                      activity_instances=None, events=None, event_attributes=None, mode='w'):
     """
     Writes the provided process data to an SQL file with INSERT INTO statements.
 
@@ -1449,109 +2305,75 @@ def write_data_to_sql(filename, processes, cases=None, attribute_definitions=Non
         activity_instances (pd.DataFrame): DataFrame representing activity instances.
         events (pd.DataFrame): DataFrame representing events.
         event_attributes (pd.DataFrame): DataFrame representing event attributes.
+        mode (str): 'w' to overwrite the file, 'a' to append statements to it.
     """
-    table_mappings = {
-        'processes': {
-            'table_name': 'Process',
-            'columns': ['process_id', 'process_name', 'description']
-        },
-        'cases': {
-            'table_name': 'Cases',
-            'columns': ['case_id', 'process_id', 'timestamp', 'end_time']
-        },
-        'activities': {
-            'table_name': 'Activity',
-            'columns': ['activity_id', 'activity_name', 'process_id']
-        },
-        'activity_instances': {
-            'table_name': 'ActivityInstance',
-            'columns': ['activity_instance_id', 'activity_id', 'case_id']
-        },
-        'events': {
-            'table_name': 'Event',
-            'columns': ['event_id', 'case_id', 'activity_instance_id', 'timestamp', 'end_time', 'position_in_trace',
-                        'transaction_type']
-        },
-        'attribute_definitions': {
-            'table_name': 'AttributeDefinition',
-            'columns': ['attribute_id', 'attribute_name', 'attribute_type', 'attribute_value_type']
-        }
-    }
+    from database_output import iter_table_frames, load_table_schema, sql_literal, to_rows
 
-    processed_ids = defaultdict(set)
+    schema = load_table_schema()
+    # The attribute tables are numbered across chunks, which this writer does not track, see SQLiteLogWriter
+    tables = {'processes': processes, 'cases': cases, 'activities': activities,
+              'activity_instances': activity_instances, 'events': events,
+              'attribute_definitions': attribute_definitions}
 
     try:
-        with open(filename, 'w') as f:
-            for df, key in [(processes, 'processes'), (cases, 'cases'), (activities, 'activities'),
-                            (activity_instances, 'activity_instances'), (events, 'events'),
-                            (attribute_definitions, 'attribute_definitions')]:
-                if df is not None:
-                    table_info = table_mappings[key]
-                    table_name = table_info['table_name']
-                    columns = table_info['columns']
-
-                    for record in df.itertuples(index=False):
-                        primary_key = columns[0]
-                        primary_key_value = getattr(record, primary_key)
-
-                        if primary_key_value not in processed_ids[table_name]:
-                            processed_ids[table_name].add(primary_key_value)
-                            values = ', '.join(f"'{str(getattr(record, col))}'" for col in columns)
-                            try:
-                                f.write(f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({values});\n")
-                                logging.info(
-                                    f"Successfully wrote record to {table_name} with {primary_key}={primary_key_value}")
-                            except Exception as e:
-                                logging.error(
-                                    f"Error writing record to {table_name} with {primary_key}={primary_key_value}: {e}")
+        with open(filename, mode) as f:
+            for table_name, frame in iter_table_frames(tables, schema, {}):
+                columns = ', '.join(frame.columns)
+                f.writelines(f"INSERT INTO {table_name} ({columns}) VALUES "
+                             f"({', '.join(sql_literal(value) for value in row)});\n"
+                             for row in to_rows(frame))
+                logging.info(f"Successfully wrote {len(frame)} records to {table_name}")
     except Exception as e:
         logging.critical(f"Failed to write to file {filename}: {e}")
+        raise
+
 
+def main(config_file, defaults_file, output_type, output_file, logging_file, chunk_size=None, workers=1,
+         seed=None, plan_cache_dir=None) -> int:
+    """
+    Generate an event log and write it to the given output.
 
-def main(config_file, defaults_file, output_type, output_file, logging_file):
+    Returns:
+        int: The exit status, 0 on success and 1 if the configuration, the generation or a writer failed.
+    """
     global process_data
     logging.basicConfig(filename=logging_file, level=logging.INFO,
                         format='%(asctime)s - %(levelname)s - %(message)s')
     try:
-        process_data = config_init.initialize_configuration(config_file, defaults_file)
+        process_data = config_init.initialize_configuration(config_file, defaults_file, seed, plan_cache_dir)
         logging.info("Configuration initialized and saved to 'merged_config.yaml'.")
-        processes_df = generate_process_data(process_data)
-        logging.info("Process data generated")
-        activities_df = generate_activity_data(process_data)
-        logging.info("Activity data generated")
-        attribute_definitions_df = create_attribute_definitions(process_data)
-        logging.info("Attribute definitions generated")
-        cases_df = generate_case_data(process_data)
-        logging.info("Case data generated")
-        activity_instances_df = generate_activity_instance_data(process_data, cases_df, activities_df)
-        logging.info("Activity instance data generated")
-        events_df = generate_event_data(process_data, activity_instances_df, activities_df)
-        logging.info("Event data generated")
-        case_attributes = generate_case_attribute_data(attribute_definitions_df, cases_df)
-        # event_attributes = generate_event_attribute_data(attribute_definitions_df, events_df, activities_df)
-
-        # if output_type == 'csv':
-        #     write_data_to_csv(output_file, attribute_definitions_df, processes_df, cases_df, case_attributes,
-        #                       activities_df,
-        #                       activity_instances_df, events_df,
-        #                       event_attributes)
-        # elif output_type == 'combined_csv':
-        #     write_data_to_combined_csv(output_file, processes_df, cases_df, case_attributes, activities_df,
-        #                                activity_instances_df,
-        #                                events_df, event_attributes)
-        # elif output_type == 'sql':
-        #     write_data_to_sql(output_file, processes_df, cases_df, attribute_definitions_df, case_attributes,
-        #                       activities_df,
-        #                       activity_instances_df, events_df,
-        #                       event_attributes)
+        # Stream the log chunk by chunk so memory stays bounded by the chunk size
+        chunks = iter_event_log_tables(process_data, chunk_size, workers, process_data.get('seed'))
+        with open_event_log_output(output_type, output_file) as write_chunk:
+            for chunk_number, chunk in enumerate(chunks):
+                write_chunk(chunk)
+                logging.info(f"Chunk {chunk_number + 1} with {len(chunk['cases'])} cases and "
+                             f"{len(chunk['events'])} events written")
     except Exception as e:
-        logging.error(f"Failed to initialize configuration: {str(e)}")
+        logging.error(f"Failed to generate the event log: {str(e)}")
+        return 1
+    return 0
 
 
 if __name__ == "__main__":
-    logging_file = F"Output/Log Files/EventLogGeneration_{int(dt.datetime.now().timestamp() * 1000)}.log"
-    config_file = "Config/processes.yaml"
-    defaults_file = "Config/defaults.yaml"
-    output_type = "sql"  # Choose between 'csv', 'combined_csv', 'sql'
-    output_file = "Output/output.sql"
-    main(config_file, defaults_file, output_type, output_file, logging_file)
+    parser = argparse.ArgumentParser(description="Generate event logs from a process configuration.")
+    parser.add_argument('--config', default="Config/processes.yaml", help="Process configuration YAML file.")
+    parser.add_argument('--defaults', default="Config/defaults.yaml", help="Defaults YAML file.")
+    parser.add_argument('--output-type', default="sql",
+                        choices=['csv', 'combined_csv', 'sql', 'parquet', 'arrow', 'duckdb', 'sqlite', 'postgres_copy'],
+                        help="Output format.")
+    parser.add_argument('--output-file', default="Output/output.sql",
+                        help="Output file, file prefix or directory, depending on the output type.")
+    parser.add_argument('--log-file',
+                        default=F"Output/Log Files/EventLogGeneration_{int(dt.datetime.now().timestamp() * 1000)}.log",
+                        help="Log file.")
+    parser.add_argument('--chunk-size', type=int, default=10000,
+                        help="Number of cases generated and written at a time.")
+    parser.add_argument('--workers', type=int, default=1, help="Number of worker processes.")
+    parser.add_argument('--seed', type=int, default=None, help="Seed of the generated log.")
+    parser.add_argument('--plan-cache-dir', default="Output/Cache",
+                        help="Directory of the compiled configuration cache, empty disables the cache. Only "
+                             "seeded runs (--seed or 'seed' in the configuration) are cached.")
+    args = parser.parse_args()
+    sys.exit(main(args.config, args.defaults, args.output_type, args.output_file, args.log_file, args.chunk_size,
+                  args.workers, args.seed, args.plan_cache_dir or None))
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import logging
+import os
+import shutil
+from typing import Any, Dict, Iterator, Optional
+
+import numpy as np
+
+from lazy_modules import import_optional, lazy_import
+
+pd = lazy_import('pandas')
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# Output name of every table of an event log chunk
+TABLE_NAMES = {
+    'processes': 'Processes',
+    'attribute_definitions': 'AttributeDefinitions',
+    'activities': 'Activities',
+    'cases': 'Cases',
+    'case_attributes': 'CaseAttributes',
+    'activity_instances': 'ActivityInstances',
+    'events': 'Events',
+    'event_attributes': 'EventAttributes'
+}
+
+
+def format_value(value: Any) -> Optional[str]:
+    """Format a value of a mixed or nested column as a string, lists and dicts as JSON."""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, (list, tuple, dict)):
+        return json.dumps(value, default=str)
+    if isinstance(value, (dt.date, dt.datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def to_arrow_array(column: pd.Series, arrow_type: Any = None, dictionary: Optional[Dict[str, int]] = None) -> Any:
+    """
+    Convert a DataFrame column to an Arrow array with a native type.
+
+    Numeric, boolean and timestamp columns keep their type, as do object columns of dates or datetimes. Other
+    object columns, e.g. names, attribute values or working hours, become dictionary-encoded strings. With
+    arrow_type the column is converted to that type, so every chunk of a table has the schema of its first chunk.
+
+    Args:
+        column (pd.Series): The column.
+        arrow_type (pa.DataType, optional): The type to convert to. Inferred from the values if not given.
+        dictionary (dict, optional): Code of every string encoded so far. New strings are appended, so the
+            dictionaries of consecutive chunks extend each other and can be written as dictionary deltas.
+
+    Returns:
+        pa.Array: The converted column.
+    """
+    pa = import_optional('pyarrow', 'Arrow output')
+    if arrow_type is None:
+        if pd.api.types.is_datetime64_any_dtype(column) or pd.api.types.is_bool_dtype(column) or \
+                pd.api.types.is_numeric_dtype(column):
+            return pa.array(column)
+        # Object columns may hold numbers in one chunk and strings in the next, only dates are kept native
+        kind = pd.api.types.infer_dtype(column, skipna=True)
+        if kind in ('datetime', 'datetime64'):
+            return pa.array(column)
+        if kind == 'date':
+            return pa.array(column, type=pa.date32())
+        arrow_type = pa.dictionary(pa.int32(), pa.string())
+
+    if not (pa.types.is_dictionary(arrow_type) or pa.types.is_string(arrow_type)):
+        return pa.array(column, type=arrow_type, from_pandas=True)
+    values = [format_value(value) for value in column]
+    if pa.types.is_string(arrow_type):
+        return pa.array(values, type=pa.string())
+    if dictionary is None:
+        return pa.array(values, type=pa.string()).dictionary_encode()
+    codes = [None if value is None else dictionary.setdefault(value, len(dictionary)) for value in values]
+    return pa.DictionaryArray.from_arrays(pa.array(codes, type=pa.int32()),
+                                          pa.array(list(dictionary), type=pa.string()))
+
+
+def to_arrow_table(df: pd.DataFrame, schema: Any = None,
+                   dictionaries: Optional[Dict[str, Dict[str, int]]] = None) -> Any:
+    """
+    Convert a DataFrame to an Arrow table column by column, see to_arrow_array.
+
+    Args:
+        df (pd.DataFrame): The table.
+        schema (pa.Schema, optional): The schema to convert to, e.g. the schema of an earlier chunk.
+        dictionaries (dict, optional): The string codes of every dictionary column, extended by this table.
+
+    Returns:
+        pa.Table: The converted table.
+    """
+    pa = import_optional('pyarrow', 'Arrow output')
+    dictionaries = {} if dictionaries is None else dictionaries
+    if schema is None:
+        return pa.table({name: to_arrow_array(df[name], dictionary=dictionaries.setdefault(name, {}))
+                         for name in df.columns})
+    return pa.table({field.name: to_arrow_array(df[field.name], field.type, dictionaries.setdefault(field.name, {}))
+                     for field in schema}, schema=schema)
+
+
+def to_record_batches(chunks: Iterator[Dict[str, pd.DataFrame]], key: str) -> Any:
+    """
+    Stream one table of an event log as Arrow record batches.
+
+    The chunks are pulled lazily, so the log is generated while the reader is consumed. Dictionary columns share
+    one growing dictionary across batches.
+
+    Args:
+        chunks (Iterator[dict]): The tables of every chunk, e.g. from iter_event_log_chunks.
+        key (str): The table to stream, see TABLE_NAMES.
+
+    Returns:
+        pa.RecordBatchReader: A reader of the table's record batches, one or more per chunk.
+    """
+    pa = import_optional('pyarrow', 'Arrow output')
+    if key not in TABLE_NAMES:
+        raise ValueError(f"Unknown table: {key}")
+    chunks = iter(chunks)
+    dictionaries = {}
+    first_table = None
+    for tables in chunks:
+        if tables.get(key) is not None and not tables[key].empty:
+            first_table = to_arrow_table(tables[key], dictionaries=dictionaries)
+            break
+    if first_table is None:
+        return pa.RecordBatchReader.from_batches(pa.schema([]), [])
+
+    def batches():
+        yield from first_table.to_batches()
+        for tables in chunks:
+            df = tables.get(key)
+            if df is not None and not df.empty:
+                yield from to_arrow_table(df, first_table.schema, dictionaries).to_batches()
+
+    return pa.RecordBatchReader.from_batches(first_table.schema, batches())
+
+
+def get_process_ids(key: str, df: pd.DataFrame, tables: Dict[str, pd.DataFrame]) -> np.ndarray:
+    """
+    Return the process of every row of a table, looking it up through the cases or events of the chunk.
+
+    Args:
+        key (str): The table key, see TABLE_NAMES.
+        df (pd.DataFrame): The table.
+        tables (dict): All tables of the chunk.
+
+    Returns:
+        np.ndarray: The process ID of every row.
+    """
+    if 'process_id' in df:
+        return df['process_id'].to_numpy()
+    cases = tables['cases']
+    case_processes = pd.Series(cases['process_id'].to_numpy(), index=cases['case_id'].to_numpy())
+    if 'case_id' in df:
+        return case_processes.reindex(df['case_id'].to_numpy()).to_numpy()
+    if 'event_id' in df:
+        events = tables['events']
+        event_cases = pd.Series(events['case_id'].to_numpy(), index=events['event_id'].to_numpy())
+        return case_processes.reindex(event_cases.reindex(df['event_id'].to_numpy()).to_numpy()).to_numpy()
+    raise ValueError(f"Cannot determine the process of the rows of {key}.")
+
+
+class ParquetLogWriter:
+    """
+    Write the chunks of an event log to Parquet files, one row group per chunk.
+
+    Every table is written to <directory>/<Table>/process_id=<id>/part-0.parquet, a Hive-partitioned dataset
+    that readers such as pyarrow.dataset, DuckDB or Spark can prune by process. Strings are dictionary-encoded and
+    timestamps keep their native type. The Parquet writers stay open between chunks, so a table grows by one row
+    group per chunk and partition instead of being rewritten.
+    """
+
+    def __init__(self, directory: str, compression: str = 'snappy'):
+        self.pq = import_optional('pyarrow.parquet', 'Parquet output')
+        self.directory = directory
+        self.compression = compression
+        self.schemas = {}
+        self.writers = {}
+        for name in TABLE_NAMES.values():
+            shutil.rmtree(os.path.join(directory, name), ignore_errors=True)
+
+    def write(self, tables: Dict[str, pd.DataFrame]):
+        """
+        Write the tables of one chunk.
+
+        Args:
+            tables (dict): DataFrames keyed by the names of TABLE_NAMES, e.g. 'cases' or 'events'.
+        """
+        for key, name in TABLE_NAMES.items():
+            df = tables.get(key)
+            if df is None or df.empty:
+                continue
+            # The process is encoded in the partition directory instead of a column
+            process_ids = get_process_ids(key, df, tables)
+            table = to_arrow_table(df.drop(columns='process_id', errors='ignore'), self.schemas.get(key))
+            self.schemas.setdefault(key, table.schema)
+
+            order = np.argsort(process_ids, kind='stable')
+            partitions, starts = np.unique(process_ids[order], return_index=True)
+            for process_id, rows in zip(partitions, np.split(order, starts[1:])):
+                writer = self.writers.get((key, process_id))
+                if writer is None:
+                    path = os.path.join(self.directory, name, f"process_id={process_id}", 'part-0.parquet')
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    writer = self.pq.ParquetWriter(path, self.schemas[key], compression=self.compression)
+                    self.writers[(key, process_id)] = writer
+                writer.write_table(table.take(rows))
+            logger.info(f"Successfully wrote {key} data to {os.path.join(self.directory, name)}")
+
+    def close(self):
+        """Finish all Parquet files."""
+        for writer in self.writers.values():
+            writer.close()
+        self.writers = {}
+
+
+class ArrowIpcLogWriter:
+    """
+    Write the chunks of an event log to Arrow IPC files, the format of Feather version 2.
+
+    Every table is written to <directory>/<Table>.arrow as one record batch per chunk. Dictionary columns keep one
+    growing dictionary per table and column, written as dictionary deltas, so the files can be memory-mapped and
+    read without copies by pyarrow.ipc.open_file, pyarrow.feather.read_table, DuckDB or Polars.
+    """
+
+    def __init__(self, directory: str, compression: Optional[str] = None):
+        self.pa = import_optional('pyarrow', 'Arrow IPC output')
+        self.directory = directory
+        self.options = self.pa.ipc.IpcWriteOptions(compression=compression, emit_dictionary_deltas=True)
+        self.schemas = {}
+        self.dictionaries = {}
+        self.writers = {}
+        os.makedirs(directory, exist_ok=True)
+        for name in TABLE_NAMES.values():
+            path = os.path.join(directory, f"{name}.arrow")
+            if os.path.exists(path):
+                os.remove(path)
+
+    def write(self, tables: Dict[str, pd.DataFrame]):
+        """
+        Write the tables of one chunk.
+
+        Args:
+            tables (dict): DataFrames keyed by the names of TABLE_NAMES, e.g. 'cases' or 'events'.
+        """
+        for key, name in TABLE_NAMES.items():
+            df = tables.get(key)
+            if df is None or df.empty:
+                continue
+            table = to_arrow_table(df, self.schemas.get(key), self.dictionaries.setdefault(key, {}))
+            if key not in self.writers:
+                self.schemas[key] = table.schema
+                path = os.path.join(self.directory, f"{name}.arrow")
+                self.writers[key] = self.pa.ipc.new_file(path, table.schema, options=self.options)
+            self.writers[key].write_table(table)
+            logger.info(f"Successfully wrote {key} data to {os.path.join(self.directory, name)}.arrow")
+
+    def close(self):
+        """Finish all Arrow IPC files."""
+        for writer in self.writers.values():
+            writer.close()
+        self.writers = {}
@@ -0,0 +1,34 @@
+import contextlib
+import os
+import tempfile
+from typing import IO, Iterator
+
+
+@contextlib.contextmanager
+def atomic_write(path: str, mode: str = 'w', **kwargs) -> Iterator[IO]:
+    """
+    Open a temporary file next to a cache file and move it onto the cache file once it is completely written.
+
+    Readers, e.g. other worker processes sharing the cache directory, therefore see either no file or a complete
+    one, never a half-written file. If writing fails, the temporary file is removed and the cache file is left as
+    it was.
+
+    Args:
+        path (str): The cache file.
+        mode (str): The file mode, 'w' for text or 'wb' for binary files.
+        **kwargs: Further arguments of open, e.g. encoding.
+
+    Yields:
+        IO: The open temporary file.
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    descriptor, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with open(descriptor, mode, **kwargs) as file:
+            yield file
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
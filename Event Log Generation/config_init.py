@@ -1,13 +1,74 @@
 import datetime
+import hashlib
+import json
+import os
 import random
 import yaml
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 import logging
 
+from cache_files import atomic_write
+from date_parsing import parse_date
+
 # Set up logger
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# The libyaml based loader is much faster, fall back to the pure Python one where it is not built
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+# Increment when the compiled plan changes, so stale plan caches are not reused
+PLAN_FORMAT_VERSION = 3
+# Bounds of DateTime attribute values for defaults files that do not set them
+DEFAULT_DATETIME_RANGE = ['1970-01-01', '2024-12-31']
+# Attribute value types by their lower case name, so configurations can write e.g. "Datetime" or "numeric"
+ATTRIBUTE_TYPES = {attribute_type.lower(): attribute_type for attribute_type in [
+    'Numeric', 'Categorical', 'Resource', 'Character', 'Company', 'PhoneNumber', 'Email', 'Address', 'Geo', 'UUID',
+    'DateTime']}
+
+
+def encode_plan_value(value: Any) -> Dict[str, str]:
+    """Encode the dates and datetimes of a compiled plan for JSON, tagged so they are decoded back to dates."""
+    if isinstance(value, datetime.datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {'__date__': value.isoformat()}
+    raise TypeError(f"Cannot cache plan value of type {type(value).__name__}")
+
+
+def decode_plan_value(value: Dict[str, Any]) -> Any:
+    """Decode a JSON object of a cached plan, turning tagged dates back into dates and datetimes."""
+    if value.keys() == {'__datetime__'}:
+        return datetime.datetime.fromisoformat(value['__datetime__'])
+    if value.keys() == {'__date__'}:
+        return datetime.date.fromisoformat(value['__date__'])
+    return value
+
+
+def load_yaml(text: Union[str, bytes]) -> Any:
+    """Parse YAML text with the fastest available safe loader."""
+    return yaml.load(text, Loader=YAML_LOADER)
+
+
+def parse_range(value: Any) -> Any:
+    """
+    Normalise a range written as a string, e.g. "1..50" or [1..4], into a [min, max] list.
+
+    Args:
+        value (Any): The range as given in the configuration.
+
+    Returns:
+        Any: A [min, max] list of ints or floats, or the value itself if it is not a range string.
+    """
+    if isinstance(value, list) and len(value) == 1 and isinstance(value[0], str):
+        value = value[0]
+    if isinstance(value, str) and '..' in value:
+        bounds = [bound.strip() for bound in value.split('..', 1)]
+        try:
+            return [int(bound) for bound in bounds]
+        except ValueError:
+            return [float(bound) for bound in bounds]
+    return value
+
 def generate_trace_label(index: int, alphabet_size: int = 26, alphabet_start: str = 'a') -> str:
     """
     Generate a trace label given an index.
@@ -40,13 +101,14 @@ def initialize_activity_defaults(activity: Dict[str, Any], index: int, activity_
     activity.setdefault('trace', generate_trace_label(index))
     activity.setdefault('min_weight', activity_defaults['min_weight'])
     activity.setdefault('max_weight', activity_defaults['max_weight'])
-    activity.setdefault('duration_range', activity_defaults['duration_range'])
+    activity['duration_range'] = parse_range(activity.get('duration_range', activity_defaults['duration_range']))
     activity.setdefault('duration_uom', activity_defaults['duration_uom'])
     activity.setdefault('transaction_types', activity_defaults['transaction_types'])
     activity.setdefault('activity_attributes', activity_defaults['activity_attributes'])
     for transaction_type in activity['transaction_types']:
         transaction_type.setdefault('order', index + 1)
-        transaction_type.setdefault('duration_range', activity_defaults['transaction_duration_range'])
+        transaction_type['duration_range'] = parse_range(
+            transaction_type.get('duration_range', activity_defaults['transaction_duration_range']))
         transaction_type.setdefault('duration_uom', activity_defaults['transaction_duration_uom'])
         transaction_type.setdefault('working_days', activity['working_days'])
         transaction_type.setdefault('working_hours', activity['working_hours'])
@@ -64,15 +126,22 @@ def initialize_attribute_defaults(attribute: Dict[str, Any], attribute_defaults:
     Returns:
         Dict[str, Any]: The attribute dictionary with defaults applied where necessary.
     """
-    attribute.setdefault('range', attribute_defaults['range'])
+    attribute['range'] = parse_range(attribute.get('range', attribute_defaults['range']))
     attribute.setdefault('distribution', attribute_defaults['distribution'])
     attribute.setdefault('type', attribute_defaults['type'])
+    attribute['type'] = ATTRIBUTE_TYPES.get(str(attribute['type']).lower(), attribute['type'])
+    if attribute['type'] == 'Boolean':
+        # Booleans are drawn as the categories true and false
+        attribute['type'] = 'Categorical'
+        attribute.setdefault('categories', [True, False])
     attribute.setdefault('as_attribute', attribute_defaults['as_attribute'])
     attribute.setdefault('adjustment_type', attribute_defaults['adjustment_type'])
     attribute.setdefault('generation_level', attribute_defaults['generation_level'])
     attribute.setdefault('categories', attribute_defaults['categories'])
     attribute.setdefault('resource_type', attribute_defaults['resource_type'])
     attribute.setdefault('resource_count', attribute_defaults['resource_count'])
+    attribute['datetime_range'] = [parse_date(value) for value in attribute.get(
+        'datetime_range', attribute_defaults.get('datetime_range', DEFAULT_DATETIME_RANGE))]
 
     return attribute
 
@@ -91,6 +160,9 @@ List[str]:
         List[str]: A list of generated trace patterns.
     """
     activity_traces = [activity['trace'] for activity in activities]
+    trace_orders = {}
+    for activity in activities:
+        trace_orders.setdefault(activity['trace'], activity['order'])
     trace_patterns = {}
 
     # Get ranges from defaults
@@ -109,8 +181,7 @@ List[str]:
     for _ in range(num_additional_patterns):
         random_pattern = random.choices(activity_traces,
                                         k=random.randint(traces_in_pattern_range[0], traces_in_pattern_range[1]))
-        random_pattern_sorted = sorted(random_pattern, key=lambda trace: next(
-            activity['order'] for activity in activities if activity['trace'] == trace))
+        random_pattern_sorted = sorted(random_pattern, key=trace_orders.__getitem__)
         random_pattern_str = ','.join(random_pattern_sorted)
         random_replays = random.randint(replays_range[0], replays_range[1])
 
@@ -125,127 +196,217 @@ List[str]:
     return trace_patterns_list
 
 
-def initialize_configuration(config_file: str, defaults_file: str) -> Dict[str, Any]:
+def compile_configuration(config: Dict[str, Any], defaults: Dict[str, Any], seed: Optional[int] = None) -> Dict[
+    str, Any]:
+    """
+    Compile a parsed configuration and its defaults into the normalised plan the generator runs on.
+
+    Defaults are applied, ranges like "1..50" become [min, max] lists, dates are parsed and the trace patterns
+    are generated where needed and counted into 'trace_counts'.
+
+    Args:
+        config (Dict[str, Any]): The parsed configuration, modified in place.
+        defaults (Dict[str, Any]): The parsed defaults, modified in place.
+        seed (int, optional): Seed of the generated log, overrides the seed of the configuration file.
+
+    Returns:
+        Dict[str, Any]: The initialized configuration dictionary.
+    """
+    # A single process may be given under 'process' instead of 'processes'
+    if 'processes' not in config and isinstance(config.get('process'), dict):
+        process = config.pop('process')
+        config['processes'] = {process.get('process_name', 'process'): process}
+
+    general_defaults = defaults['general_defaults']
+    process_defaults = defaults['process_defaults']
+    activity_defaults = defaults['activity_defaults']
+    attribute_defaults = defaults['attribute_defaults']
+    object_type_defaults = defaults['object_type_defaults']
+    trace_gen_defaults = defaults['trace_generation_defaults']
+
+    today = datetime.date.today()
+    default_start_date = today.isoformat()
+    default_end_date = (today + datetime.timedelta(days=30)).isoformat()
+
+    general_defaults.setdefault('start_date', default_start_date)
+    general_defaults.setdefault('end_date', default_start_date)
+    general_defaults['start_date'] = parse_date(general_defaults['start_date'])
+    general_defaults['end_date'] = parse_date(general_defaults['end_date'])
+
+    config.setdefault('process_id', general_defaults['process_id_start'])
+    config.setdefault('case_id', general_defaults['case_id_start'])
+    config.setdefault('attribute_definition_id', general_defaults['attribute_definition_id_start'])
+    config.setdefault('case_attribute_id', general_defaults['case_attribute_id_start'])
+    config.setdefault('activity_id', general_defaults['activity_id_start'])
+    config.setdefault('activity_instance_id', general_defaults['activity_instance_id_start'])
+    config.setdefault('event_id', general_defaults['event_id_start'])
+    config.setdefault('event_attribute_id', general_defaults['event_attribute_id_start'])
+    config.setdefault('object_id', general_defaults['object_id'])
+    config.setdefault('object_type_id', general_defaults['object_type_id'])
+    config.setdefault('object_attribute_id', general_defaults['object_attribute_id'])
+    config.setdefault('calendar_cache_dir', general_defaults.get('calendar_cache_dir'))
+    config.setdefault('locale', general_defaults.get('locale'))
+    config.setdefault('value_pool_size', general_defaults.get('value_pool_size'))
+    config.setdefault('value_pool_cache_dir', general_defaults.get('value_pool_cache_dir'))
+    if seed is not None:
+        config['seed'] = seed
+    config.setdefault('seed', general_defaults.get('seed'))
+    if config['seed'] is not None:
+        # Trace patterns are drawn at random, so the seed has to cover them as well
+        random.seed(config['seed'])
+
+    process_id = config['process_id']
+
+    for process_key, process in config['processes'].items():
+        process.setdefault('start_date', general_defaults['start_date'])
+        process.setdefault('end_date', general_defaults['end_date'])
+        process['process_id'] = process.get('process_id', process_id)
+        process_id += 1
+
+        process.setdefault('num_cases', process_defaults['num_cases'])
+        process.setdefault('case_attributes', process_defaults['case_attributes'])
+        process.setdefault('event_attributes', process_defaults['event_attributes'])
+        process.setdefault('object_types', process_defaults['object_types'])
+        process.setdefault('description', process_defaults['description'])
+        process.setdefault('working_days', process_defaults['working_days'])
+        process.setdefault('working_hours', process_defaults['working_hours'])
+        process.setdefault('holidays', process_defaults.get('holidays', []))
+        process.setdefault('timezone', process_defaults.get('timezone', 'UTC'))
+
+        # Parse the dates once, so generation never sees date strings
+        process['start_date'] = parse_date(process['start_date'])
+        process['end_date'] = parse_date(process['end_date'])
+        process['holidays'] = [parse_date(holiday) for holiday in process['holidays'] or []]
+
+        # Ensure activities are initialized with defaults
+        for index, activity in enumerate(process.get('activities', [])):
+            activity.setdefault('working_days', process['working_days'])
+            activity.setdefault('working_hours', process['working_hours'])
+            process['activities'][index] = initialize_activity_defaults(activity, index, activity_defaults)
+
+            for attr_index, attr in enumerate(activity.get('activity_attributes', [])):
+                activity['activity_attributes'][attr_index] = initialize_attribute_defaults(attr,
+                                                                                            attribute_defaults)
+
+        for attr_index, attr in enumerate(process.get('case_attributes', [])):
+            process['case_attributes'][attr_index] = initialize_attribute_defaults(attr, attribute_defaults)
+
+        for attr_index, attr in enumerate(process.get('event_attributes', [])):
+            process['event_attributes'][attr_index] = initialize_attribute_defaults(attr, attribute_defaults)
+
+        for obj_index, object_type in enumerate(process.get('object_types', [])):
+            object_type.setdefault('order', obj_index + 1)
+            object_type['range'] = parse_range(object_type.get('range', object_type_defaults['range']))
+            object_type.setdefault('object_attributes', object_type_defaults['object_attributes'])
+            object_type.setdefault('activity_qualifiers', object_type_defaults['activity_qualifiers'])
+            object_type.setdefault('object_qualifiers', object_type_defaults.get('object_qualifiers', []))
+            object_type.setdefault('objects_per_event', object_type_defaults.get('objects_per_event', 1))
+            for qualifier in object_type['object_qualifiers']:
+                qualifier['degree_range'] = parse_range(qualifier.get(
+                    'degree_range', object_type_defaults.get('object_qualifier_degree_range', [1, 1])))
+                qualifier.setdefault('degree_distribution',
+                                     object_type_defaults.get('object_qualifier_degree_distribution', 'uniform'))
+            for attr_index, attr in enumerate(object_type.get('object_attributes', [])):
+                object_type['object_attributes'][attr_index] = initialize_attribute_defaults(attr,
+                                                                                             attribute_defaults)
+
+        # Generate or use provided trace patterns
+        trace_patterns = process.get('traces', [])
+        if not process.get('traces') or len(process.get('traces')) == 0:
+            trace_patterns = generate_trace_patterns(process['activities'], process['num_cases'], trace_gen_defaults)
+            process['traces'] = trace_patterns
+
+        # Calculate trace counts based on patterns
+        trace_counts = {}
+        total_traces = 0
+        for pattern in trace_patterns:
+            if '^' in pattern:
+                pattern_cases = int(pattern.split('^')[1])
+                pattern = pattern.split('^')[0].replace('(', '').replace(')', '')
+            else:
+                pattern_cases = 1  # Default if no ^ is provided
+                pattern = pattern.replace('(', '').replace(')', '')
+            trace_counts[pattern] = pattern_cases
+            total_traces += pattern_cases
+
+        # Scale trace patterns to match num_cases
+        if total_traces > process['num_cases']:
+            process['num_cases'] = total_traces
+
+        scale_factor = process['num_cases'] / total_traces
+        scaled_trace_counts = {k: int(v * scale_factor) for k, v in trace_counts.items()}
+
+        # Ensure the total number of cases matches num_cases
+        remaining_cases = process['num_cases'] - sum(scaled_trace_counts.values())
+        if remaining_cases > 0:
+            for k in list(scaled_trace_counts.keys()):
+                if remaining_cases == 0:
+                    break
+                scaled_trace_counts[k] += 1
+                remaining_cases -= 1
+
+        process['trace_counts'] = scaled_trace_counts
+        config['processes'][process_key] = process
+
+    return config
+
+
+def initialize_configuration(config_file: str, defaults_file: str, seed: Optional[int] = None,
+                             cache_dir: Optional[str] = None) -> Dict[str, Any]:
     """
     Initialize the configuration by reading from YAML files and setting default values.
 
+    The compiled plan is cached as JSON under a hash of both files and the seed, so re-running an unchanged
+    configuration loads the plan instead of compiling it again. Plans with random trace patterns (no seed) are not
+    cached, and plans that default their dates to today are only reused on the same day.
+
     Args:
         config_file (str): Path to the configuration YAML file.
         defaults_file (str): Path to the defaults YAML file.
+        seed (int, optional): Seed of the generated log, overrides the seed of the configuration file.
+        cache_dir (str, optional): Directory of the plan cache. Caching is disabled if not given.
 
     Returns:
         Dict[str, Any]: The initialized configuration dictionary.
     """
     try:
-        with open(config_file, 'r') as cfg_file:
-            config = yaml.safe_load(cfg_file)
-        with open(defaults_file, 'r') as dft_file:
-            defaults = yaml.safe_load(dft_file)
-
-        general_defaults = defaults['general_defaults']
-        process_defaults = defaults['process_defaults']
-        activity_defaults = defaults['activity_defaults']
-        attribute_defaults = defaults['attribute_defaults']
-        object_type_defaults = defaults['object_type_defaults']
-        trace_gen_defaults = defaults['trace_generation_defaults']
-
-        today = datetime.date.today()
-        default_start_date = today.isoformat()
-        default_end_date = (today + datetime.timedelta(days=30)).isoformat()
-
-        general_defaults.setdefault('start_date', default_start_date)
-        general_defaults.setdefault('end_date', default_start_date)
-
-        config.setdefault('process_id', general_defaults['process_id_start'])
-        config.setdefault('case_id', general_defaults['case_id_start'])
-        config.setdefault('attribute_definition_id', general_defaults['attribute_definition_id_start'])
-        config.setdefault('case_attribute_id', general_defaults['case_attribute_id_start'])
-        config.setdefault('activity_id', general_defaults['activity_id_start'])
-        config.setdefault('activity_instance_id', general_defaults['activity_instance_id_start'])
-        config.setdefault('event_id', general_defaults['event_id_start'])
-        config.setdefault('event_attribute_id', general_defaults['event_attribute_id_start'])
-        config.setdefault('object_id', general_defaults['object_id'])
-        config.setdefault('object_type_id', general_defaults['object_type_id'])
-        config.setdefault('object_attribute_id', general_defaults['object_attribute_id'])
-
-        process_id = config['process_id']
-
-        for process_key, process in config['processes'].items():
-            process.setdefault('start_date', general_defaults['start_date'])
-            process.setdefault('end_date', general_defaults['end_date'])
-            process['process_id'] = process.get('process_id', process_id)
-            process_id += 1
-
-            process.setdefault('num_cases', process_defaults['num_cases'])
-            process.setdefault('case_attributes', process_defaults['case_attributes'])
-            process.setdefault('event_attributes', process_defaults['event_attributes'])
-            process.setdefault('object_types', process_defaults['object_types'])
-            process.setdefault('description', process_defaults['description'])
-            process.setdefault('working_days', process_defaults['working_days'])
-            process.setdefault('working_hours', process_defaults['working_hours'])
-
-            # Ensure activities are initialized with defaults
-            for index, activity in enumerate(process.get('activities', [])):
-                activity.setdefault('working_days', process['working_days'])
-                activity.setdefault('working_hours', process['working_hours'])
-                process['activities'][index] = initialize_activity_defaults(activity, index, activity_defaults)
-
-                for attr_index, attr in enumerate(activity.get('activity_attributes', [])):
-                    activity['activity_attributes'][attr_index] = initialize_attribute_defaults(attr,
-                                                                                                attribute_defaults)
-
-            for attr_index, attr in enumerate(process.get('case_attributes', [])):
-                process['case_attributes'][attr_index] = initialize_attribute_defaults(attr, attribute_defaults)
-
-            for attr_index, attr in enumerate(process.get('event_attributes', [])):
-                process['event_attributes'][attr_index] = initialize_attribute_defaults(attr, attribute_defaults)
-
-            for obj_index, object_type in enumerate(process.get('object_types', [])):
-                object_type.setdefault('order', obj_index + 1)
-                object_type.setdefault('object_attributes', object_type_defaults['object_attributes'])
-                object_type.setdefault('activity_qualifiers', object_type_defaults['activity_qualifiers'])
-                for attr_index, attr in enumerate(object_type.get('object_attributes', [])):
-                    object_type['object_attributes'][attr_index] = initialize_attribute_defaults(attr,
-                                                                                                 attribute_defaults)
-
-            # Generate or use provided trace patterns
-            trace_patterns = process.get('traces', [])
-            if not process.get('traces') or len(process.get('traces')) == 0:
-                trace_patterns = generate_trace_patterns(process['activities'], process['num_cases'], trace_gen_defaults)
-                process['traces'] = trace_patterns
-
-            # Calculate trace counts based on patterns
-            trace_counts = {}
-            total_traces = 0
-            for pattern in trace_patterns:
-                if '^' in pattern:
-                    pattern_cases = int(pattern.split('^')[1])
-                    pattern = pattern.split('^')[0].replace('(', '').replace(')', '')
-                else:
-                    pattern_cases = 1  # Default if no ^ is provided
-                    pattern = pattern.replace('(', '').replace(')', '')
-                trace_counts[pattern] = pattern_cases
-                total_traces += pattern_cases
-
-            # Scale trace patterns to match num_cases
-            if total_traces > process['num_cases']:
-                process['num_cases'] = total_traces
-
-            scale_factor = process['num_cases'] / total_traces
-            scaled_trace_counts = {k: int(v * scale_factor) for k, v in trace_counts.items()}
-
-            # Ensure the total number of cases matches num_cases
-            remaining_cases = process['num_cases'] - sum(scaled_trace_counts.values())
-            if remaining_cases > 0:
-                for k in list(scaled_trace_counts.keys()):
-                    if remaining_cases == 0:
-                        break
-                    scaled_trace_counts[k] += 1
-                    remaining_cases -= 1
-
-            process['trace_counts'] = scaled_trace_counts
-            config['processes'][process_key] = process
-
+        with open(config_file, 'rb') as cfg_file:
+            config_text = cfg_file.read()
+        with open(defaults_file, 'rb') as dft_file:
+            defaults_text = dft_file.read()
+
+        cache_file = None
+        if cache_dir:
+            key = hashlib.sha256(json.dumps([PLAN_FORMAT_VERSION, seed]).encode())
+            key.update(hashlib.sha256(config_text).digest())
+            key.update(hashlib.sha256(defaults_text).digest())
+            cache_file = os.path.join(cache_dir, f"plan_{key.hexdigest()[:24]}.json")
+            if os.path.exists(cache_file):
+                try:
+                    with open(cache_file, 'r', encoding='utf-8') as file:
+                        cached = json.load(file, object_hook=decode_plan_value)
+                    if cached['valid_on'] in (None, datetime.date.today().isoformat()):
+                        config = cached['config']
+                        if config['seed'] is not None:
+                            random.seed(config['seed'])
+                        return config
+                except (OSError, KeyError, TypeError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable plan cache file {cache_file}: {e}")
+
+        config = load_yaml(config_text)
+        defaults = load_yaml(defaults_text)
+        uses_today = not {'start_date', 'end_date'} <= defaults['general_defaults'].keys()
+        config = compile_configuration(config, defaults, seed)
+
+        if cache_file and config['seed'] is None:
+            logger.info("Not caching the compiled plan, as its random trace patterns need a seed to be reproducible")
+        elif cache_file:
+            try:
+                with atomic_write(cache_file, 'w', encoding='utf-8') as file:
+                    json.dump({'valid_on': datetime.date.today().isoformat() if uses_today else None,
+                               'config': config}, file, default=encode_plan_value)
+            except (OSError, TypeError) as e:
+                logger.warning(f"Could not write plan cache file {cache_file}: {e}")
         return config
 
     except yaml.YAMLError as e:
@@ -0,0 +1,510 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import sqlite3
+from typing import Any, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from arrow_output import format_value, to_arrow_table
+from lazy_modules import import_optional, lazy_import
+
+pd = lazy_import('pandas')
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# The relational schema of the event log
+INITIAL_TABLES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Config', 'Initial_tables.sql')
+
+# Table of every DataFrame of an event log chunk and the DataFrame column of every table column. Table columns
+# missing here, e.g. the resource of an event, are left empty. The attribute DataFrames have no row ID, their rows
+# are numbered in output order in the 'row_number' column.
+TABLE_MAPPINGS = {
+    'processes': {
+        'table_name': 'Process',
+        'columns': {'process_id': 'process_id', 'process_name': 'process_name', 'description': 'process_description'}
+    },
+    'cases': {
+        'table_name': 'Cases',
+        'columns': {'case_id': 'case_id', 'process_id': 'process_id', 'start_time': 'start_date',
+                    'end_time': 'end_date'}
+    },
+    'activities': {
+        'table_name': 'Activity',
+        'columns': {'activity_id': 'activity_id', 'name': 'activity_name', 'process_id': 'process_id'}
+    },
+    'activity_instances': {
+        'table_name': 'ActivityInstance',
+        'columns': {'activity_instance_id': 'activity_instance_id', 'activity_id': 'activity_id', 'case_id': 'case_id'}
+    },
+    'events': {
+        'table_name': 'Event',
+        'columns': {'event_id': 'event_id', 'case_id': 'case_id', 'activity_instance_id': 'activity_instance_id',
+                    'start_time': 'start_date', 'end_time': 'end_date', 'transaction_type': 'transaction_name'}
+    },
+    'attribute_definitions': {
+        'table_name': 'AttributeDefinition',
+        'columns': {'attribute_id': 'attribute_definition_id', 'attribute_name': 'attribute_name',
+                    'attribute_type': 'attribute_type', 'attribute_value_type': 'attribute_value_type'}
+    },
+    'case_attributes': {
+        'table_name': 'CaseAttribute',
+        'columns': {'case_id': 'case_id', 'attribute_id': 'attribute_definition_id',
+                    'attribute_value': 'attribute_value'},
+        'row_number': 'case_attribute_id'
+    },
+    'event_attributes': {
+        'table_name': 'EventAttribute',
+        'columns': {'event_id': 'event_id', 'attribute_id': 'attribute_definition_id',
+                    'attribute_value': 'attribute_value'},
+        'row_number': 'event_attribute_id'
+    }
+}
+
+# Column types of the schema file replaced per database, IDs are 64 bit as the generator assigns them by shard
+COLUMN_TYPES = {
+    'duckdb': {'INT': 'BIGINT', 'VARCHAR': 'VARCHAR', 'TIMESTAMP': 'TIMESTAMP'},
+    'sqlite': {'INT': 'INTEGER', 'VARCHAR': 'TEXT', 'TIMESTAMP': 'TEXT'},
+    'postgresql': {'INT': 'BIGINT'}
+}
+
+# Escapes of the PostgreSQL COPY text format, NULL is written as \N
+COPY_ESCAPES = {'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'}
+COPY_UNESCAPES = {'\\': '\\', 't': '\t', 'n': '\n', 'r': '\r'}
+
+CREATE_TABLE_PATTERN = re.compile(r"CREATE\s+TABLE\s+(\w+)\s*\((.*?)\)\s*;", re.IGNORECASE | re.DOTALL)
+FOREIGN_KEY_PATTERN = re.compile(r"FOREIGN\s+KEY\s*\(([^)]*)\)\s*REFERENCES\s+(\w+)\s*\(([^)]*)\)\s*(.*)",
+                                 re.IGNORECASE | re.DOTALL)
+PRIMARY_KEY_PATTERN = re.compile(r"PRIMARY\s+KEY\s*\(([^)]*)\)", re.IGNORECASE)
+
+
+def split_names(text: str) -> List[str]:
+    """Split a comma-separated list of column names."""
+    return [name.strip() for name in text.split(',') if name.strip()]
+
+
+def parse_table_schema(sql: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Parse the CREATE TABLE statements of a schema file.
+
+    Args:
+        sql (str): The SQL statements, e.g. the contents of Config/Initial_tables.sql.
+
+    Returns:
+        dict: Every table by name in the order of the file, each with its 'columns' (name, type and not_null),
+        'primary_key' columns and 'foreign_keys' (columns, referenced table, referenced columns and options).
+    """
+    sql = re.sub(r"--[^\n]*", '', sql)
+    tables = {}
+    for match in CREATE_TABLE_PATTERN.finditer(sql):
+        table = {'name': match.group(1), 'columns': [], 'primary_key': [], 'foreign_keys': []}
+        for definition in (part.strip() for part in re.split(r",(?![^()]*\))", match.group(2))):
+            foreign_key = FOREIGN_KEY_PATTERN.match(definition)
+            primary_key = PRIMARY_KEY_PATTERN.match(definition)
+            if foreign_key:
+                table['foreign_keys'].append({
+                    'columns': split_names(foreign_key.group(1)),
+                    'references': foreign_key.group(2),
+                    'referenced_columns': split_names(foreign_key.group(3)),
+                    'options': ' '.join(foreign_key.group(4).split())
+                })
+            elif primary_key:
+                table['primary_key'] = split_names(primary_key.group(1))
+            elif definition:
+                name, column_type, *constraints = definition.split(None, 2)
+                constraints = ' '.join(constraints).upper()
+                table['columns'].append({'name': name, 'type': column_type.upper(),
+                                         'not_null': 'NOT NULL' in constraints or 'PRIMARY KEY' in constraints})
+                if 'PRIMARY KEY' in constraints:
+                    table['primary_key'] = [name]
+        tables[table['name']] = table
+    return tables
+
+
+def load_table_schema(schema_file: str = INITIAL_TABLES_FILE) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the tables of a schema file, see parse_table_schema.
+
+    Args:
+        schema_file (str): The schema file. Defaults to Config/Initial_tables.sql.
+
+    Returns:
+        dict: Every table by name.
+    """
+    with open(schema_file, 'r') as file:
+        return parse_table_schema(file.read())
+
+
+def column_type(sql_type: str, dialect: str) -> str:
+    """
+    Translate a column type of the schema file to the type used by a database.
+
+    Args:
+        sql_type (str): The type, e.g. 'INT' or 'VARCHAR(255)'.
+        dialect (str): The database, a key of COLUMN_TYPES.
+
+    Returns:
+        str: The translated type, the type itself if the database has no replacement for it.
+    """
+    return COLUMN_TYPES[dialect].get(sql_type.split('(')[0].upper(), sql_type)
+
+
+def create_table_statement(table: Dict[str, Any], dialect: str, constraints: bool = True) -> str:
+    """
+    Render the CREATE TABLE statement of a table for a database.
+
+    Args:
+        table (dict): The table, see parse_table_schema.
+        dialect (str): The database, a key of COLUMN_TYPES.
+        constraints (bool): Whether to declare the primary and foreign keys. Without them loading is faster, the
+            keys can be added once the data is in.
+
+    Returns:
+        str: The statement.
+    """
+    definitions = [f"{column['name']} {column_type(column['type'], dialect)}"
+                   f"{' NOT NULL' if column['not_null'] else ''}" for column in table['columns']]
+    if constraints:
+        if table['primary_key']:
+            definitions.append(f"PRIMARY KEY ({', '.join(table['primary_key'])})")
+        for foreign_key in table['foreign_keys']:
+            definitions.append(f"FOREIGN KEY ({', '.join(foreign_key['columns'])}) REFERENCES "
+                               f"{foreign_key['references']}({', '.join(foreign_key['referenced_columns'])})"
+                               f"{' ' + foreign_key['options'] if foreign_key['options'] else ''}")
+    return f"CREATE TABLE {table['name']} (\n    " + ",\n    ".join(definitions) + "\n);"
+
+
+def index_statements(table: Dict[str, Any], primary_key: bool = False) -> List[str]:
+    """
+    Render the CREATE INDEX statements of a table, one per foreign key.
+
+    Args:
+        table (dict): The table, see parse_table_schema.
+        primary_key (bool): Whether to add a unique index on the primary key, for tables created without it.
+
+    Returns:
+        List[str]: The statements.
+    """
+    statements = []
+    if primary_key and table['primary_key']:
+        statements.append(f"CREATE UNIQUE INDEX {table['name']}_pkey ON {table['name']} "
+                          f"({', '.join(table['primary_key'])});")
+    for foreign_key in table['foreign_keys']:
+        statements.append(f"CREATE INDEX {table['name']}_{'_'.join(foreign_key['columns'])}_idx ON {table['name']} "
+                          f"({', '.join(foreign_key['columns'])});")
+    return statements
+
+
+def to_table_frame(key: str, df: pd.DataFrame, table: Dict[str, Any], first_row_number: int = 1) -> pd.DataFrame:
+    """
+    Select and rename the columns of a DataFrame to the columns of its table.
+
+    Args:
+        key (str): The DataFrame key, see TABLE_MAPPINGS.
+        df (pd.DataFrame): The DataFrame.
+        table (dict): The table, see parse_table_schema.
+        first_row_number (int): The number of the first row, for tables numbered in output order.
+
+    Returns:
+        pd.DataFrame: The rows of the table with its columns in schema order. Unmapped columns are empty, text
+        columns that must not be empty hold '' instead, mixed values are formatted as strings.
+    """
+    columns = TABLE_MAPPINGS[key]['columns']
+    frame = {}
+    for column in table['columns']:
+        source = columns.get(column['name'])
+        if column['name'] == TABLE_MAPPINGS[key].get('row_number'):
+            frame[column['name']] = np.arange(first_row_number, first_row_number + len(df), dtype=np.int64)
+            continue
+        values = df[source] if source in df else pd.Series([None] * len(df), index=df.index, dtype=object)
+        if column['type'].startswith('VARCHAR') and values.dtype == object:
+            values = values.map(format_value)
+        if column['not_null'] and column['type'].startswith('VARCHAR'):
+            values = values.where(values.notna(), '')
+        frame[column['name']] = values.to_numpy()
+    return pd.DataFrame(frame)
+
+
+def iter_table_frames(tables: Dict[str, pd.DataFrame], schema: Dict[str, Dict[str, Any]],
+                      row_counts: Dict[str, int]) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """
+    Convert the DataFrames of one chunk to the tables of a schema, see to_table_frame.
+
+    Args:
+        tables (dict): DataFrames keyed by the names of TABLE_MAPPINGS, e.g. 'cases' or 'events'.
+        schema (dict): The tables, see parse_table_schema. DataFrames of other tables are skipped.
+        row_counts (dict): The number of rows written to every table so far, updated with the rows of this chunk.
+
+    Yields:
+        Tuple[str, pd.DataFrame]: The name and rows of every table with rows in this chunk, parents before children.
+    """
+    for key, mapping in TABLE_MAPPINGS.items():
+        df = tables.get(key)
+        table_name = mapping['table_name']
+        if df is None or df.empty or table_name not in schema:
+            continue
+        frame = to_table_frame(key, df, schema[table_name], row_counts.get(table_name, 0) + 1)
+        row_counts[table_name] = row_counts.get(table_name, 0) + len(frame)
+        yield table_name, frame
+
+
+def to_rows(frame: pd.DataFrame) -> List[Tuple[Any, ...]]:
+    """
+    Convert the rows of a table to tuples of Python values.
+
+    Args:
+        frame (pd.DataFrame): The rows, see to_table_frame.
+
+    Returns:
+        List[Tuple]: One tuple per row, with None for missing values and timestamps as ISO strings.
+    """
+    columns = []
+    for name in frame.columns:
+        values = frame[name]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            text = np.datetime_as_string(values.to_numpy().astype('datetime64[us]'), unit='us')
+            values = pd.Series(np.where(values.isna().to_numpy(), None, np.char.replace(text, 'T', ' ')),
+                               dtype=object)
+        columns.append(values.astype(object).where(values.notna(), None).tolist())
+    return list(zip(*columns))
+
+
+def sql_literal(value: Any) -> str:
+    """
+    Render a value as an SQL literal, NULL for missing values and strings quoted with embedded quotes doubled.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        str: The literal.
+    """
+    if value is None or value is pd.NaT or (isinstance(value, float) and np.isnan(value)):
+        return 'NULL'
+    if isinstance(value, (bool, np.bool_)):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return str(value)
+    text = format_value(value)
+    return "'" + text.replace("'", "''") + "'"
+
+
+def copy_value(value: Any) -> str:
+    """Render a value in the PostgreSQL COPY text format."""
+    if value is None:
+        return '\\N'
+    text = format_value(value)
+    for character, escape in COPY_ESCAPES.items():
+        text = text.replace(character, escape)
+    return text
+
+
+def read_copy_file(filename: str, columns: List[str]) -> pd.DataFrame:
+    """
+    Read a file in the PostgreSQL COPY text format, e.g. to check an export without a database.
+
+    Args:
+        filename (str): The file.
+        columns (List[str]): The column names.
+
+    Returns:
+        pd.DataFrame: The values as strings, None for NULL.
+    """
+    escape_pattern = re.compile(r"\\(.)")
+    rows = []
+    with open(filename, 'r', encoding='utf-8', newline='\n') as file:
+        for line in file:
+            rows.append([None if value == '\\N' else
+                         escape_pattern.sub(lambda match: COPY_UNESCAPES.get(match.group(1), match.group(1)), value)
+                         for value in line.rstrip('\n').split('\t')])
+    return pd.DataFrame(rows, columns=columns, dtype=object)
+
+
+def remove_database_files(filename: str, suffixes: Tuple[str, ...]):
+    """Create the directory of a database file and remove the file and its journals, e.g. '-wal', if present."""
+    if os.path.dirname(filename):
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+    for suffix in ('', *suffixes):
+        if os.path.exists(filename + suffix):
+            os.remove(filename + suffix)
+
+
+class DuckDBLogWriter:
+    """
+    Load the chunks of an event log into a DuckDB database file.
+
+    The tables of Config/Initial_tables.sql are created without keys and every chunk is appended as Arrow tables,
+    so no row is rendered as text. The primary key and foreign key indexes are built once all chunks are in, which
+    is much faster than maintaining them during the load. The file can be queried right after generation.
+    """
+
+    def __init__(self, filename: str, schema_file: str = INITIAL_TABLES_FILE):
+        self.duckdb = import_optional('duckdb', 'DuckDB output')
+        self.pa = import_optional('pyarrow', 'DuckDB output')
+        self.filename = filename
+        self.tables = load_table_schema(schema_file)
+        remove_database_files(filename, ('.wal',))
+        self.connection = self.duckdb.connect(filename)
+        for table in self.tables.values():
+            self.connection.execute(create_table_statement(table, 'duckdb', constraints=False))
+        self.schemas = {name: self.arrow_schema(table) for name, table in self.tables.items()}
+        self.row_counts = {}
+
+    def arrow_schema(self, table: Dict[str, Any]) -> Any:
+        """Return the Arrow schema matching the DuckDB columns of a table."""
+        types = {'BIGINT': self.pa.int64(), 'VARCHAR': self.pa.string(), 'TIMESTAMP': self.pa.timestamp('us')}
+        return self.pa.schema([(column['name'], types[column_type(column['type'], 'duckdb')])
+                               for column in table['columns']])
+
+    def write(self, tables: Dict[str, pd.DataFrame]):
+        """
+        Append the tables of one chunk.
+
+        Args:
+            tables (dict): DataFrames keyed by the names of TABLE_MAPPINGS, e.g. 'cases' or 'events'.
+        """
+        for table_name, frame in iter_table_frames(tables, self.tables, self.row_counts):
+            chunk = to_arrow_table(frame, self.schemas[table_name])
+            self.connection.register('event_log_chunk', chunk)
+            self.connection.execute(f"INSERT INTO {table_name} SELECT * FROM event_log_chunk")
+            self.connection.unregister('event_log_chunk')
+            logger.info(f"Successfully loaded {len(frame)} rows into {table_name}")
+
+    def close(self):
+        """Build the indexes and close the database."""
+        for table in self.tables.values():
+            for statement in index_statements(table, primary_key=True):
+                self.connection.execute(statement)
+        self.connection.execute("CHECKPOINT")
+        self.connection.close()
+        logger.info(f"Successfully wrote the event log to {self.filename}")
+
+
+class SQLiteLogWriter:
+    """
+    Load the chunks of an event log into an SQLite database file.
+
+    All tables of Config/Initial_tables.sql are created with their keys, the integer primary keys become row IDs.
+    Every chunk is inserted in one explicit transaction with executemany batches, while write-ahead logging and
+    synchronous=OFF keep the load from waiting on the disk. The foreign key indexes are built once all chunks are in
+    and the journal settings are restored, so the file can be shipped on its own.
+    """
+
+    def __init__(self, filename: str, schema_file: str = INITIAL_TABLES_FILE, batch_size: int = 50000):
+        self.filename = filename
+        self.batch_size = batch_size
+        self.tables = load_table_schema(schema_file)
+        remove_database_files(filename, ('-wal', '-shm', '-journal'))
+        self.connection = sqlite3.connect(filename, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=OFF")
+        self.connection.execute("PRAGMA cache_size=-262144")
+        for table in self.tables.values():
+            self.connection.execute(create_table_statement(table, 'sqlite'))
+        self.row_counts = {}
+
+    def write(self, tables: Dict[str, pd.DataFrame]):
+        """
+        Insert the tables of one chunk in one transaction.
+
+        Args:
+            tables (dict): DataFrames keyed by the names of TABLE_MAPPINGS, e.g. 'cases' or 'events'.
+        """
+        self.connection.execute("BEGIN")
+        try:
+            for table_name, frame in iter_table_frames(tables, self.tables, self.row_counts):
+                statement = (f"INSERT INTO {table_name} ({', '.join(frame.columns)}) "
+                             f"VALUES ({', '.join('?' * len(frame.columns))})")
+                rows = to_rows(frame)
+                for start in range(0, len(rows), self.batch_size):
+                    self.connection.executemany(statement, rows[start:start + self.batch_size])
+                logger.info(f"Successfully loaded {len(rows)} rows into {table_name}")
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+
+    def close(self):
+        """Build the indexes, restore the journal settings and close the database."""
+        self.connection.execute("BEGIN")
+        for table in self.tables.values():
+            for statement in index_statements(table):
+                self.connection.execute(statement)
+        self.connection.execute("COMMIT")
+        self.connection.execute("ANALYZE")
+        self.connection.execute("PRAGMA journal_mode=DELETE")
+        self.connection.execute("PRAGMA synchronous=FULL")
+        self.connection.close()
+        logger.info(f"Successfully wrote the event log to {self.filename}")
+
+
+class PostgresCopyWriter:
+    """
+    Export the chunks of an event log as PostgreSQL COPY files with a load script.
+
+    Every table of Config/Initial_tables.sql is written to <directory>/<Table>.tsv in the COPY text format, with
+    tabs, newlines and backslashes escaped and NULL as \\N, so values such as addresses or names with quotes load
+    unchanged. <directory>/load.sql creates the tables without keys, loads the files with \\copy and then adds the
+    primary keys, foreign keys and indexes, which is much faster than checking them row by row. Run it with psql
+    from the directory, e.g. 'psql -d eventlog -f load.sql'.
+    """
+
+    def __init__(self, directory: str, schema_file: str = INITIAL_TABLES_FILE):
+        self.directory = directory
+        self.tables = load_table_schema(schema_file)
+        self.row_counts = {}
+        os.makedirs(directory, exist_ok=True)
+        for table_name in self.tables:
+            open(self.table_file(table_name), 'w', encoding='utf-8').close()
+
+    def table_file(self, table_name: str) -> str:
+        """Return the COPY file of a table."""
+        return os.path.join(self.directory, f"{table_name}.tsv")
+
+    def write(self, tables: Dict[str, pd.DataFrame]):
+        """
+        Append the tables of one chunk to their COPY files.
+
+        Args:
+            tables (dict): DataFrames keyed by the names of TABLE_MAPPINGS, e.g. 'cases' or 'events'.
+        """
+        for table_name, frame in iter_table_frames(tables, self.tables, self.row_counts):
+            with open(self.table_file(table_name), 'a', encoding='utf-8', newline='\n') as file:
+                file.writelines('\t'.join(copy_value(value) for value in row) + '\n' for row in to_rows(frame))
+            logger.info(f"Successfully wrote {len(frame)} rows to {self.table_file(table_name)}")
+
+    def load_script(self) -> str:
+        """Return the psql script creating the tables, loading the COPY files and adding the keys and indexes."""
+        lines = ["-- Load the event log with 'psql -d <database> -f load.sql' from this directory",
+                 "\\set ON_ERROR_STOP on", "BEGIN;", ""]
+        for table_name in reversed(self.tables):
+            lines.append(f"DROP TABLE IF EXISTS {table_name} CASCADE;")
+        for table in self.tables.values():
+            lines.append(create_table_statement(table, 'postgresql', constraints=False))
+        lines.append("")
+        # FREEZE skips the visibility bookkeeping of rows loaded into tables created in the same transaction
+        for table in self.tables.values():
+            columns = ', '.join(column['name'] for column in table['columns'])
+            lines.append(f"\\copy {table['name']} ({columns}) FROM '{table['name']}.tsv' WITH (FORMAT text, FREEZE)")
+        lines.append("")
+        for table in self.tables.values():
+            if table['primary_key']:
+                lines.append(f"ALTER TABLE {table['name']} ADD PRIMARY KEY ({', '.join(table['primary_key'])});")
+        for table in self.tables.values():
+            for foreign_key in table['foreign_keys']:
+                lines.append(f"ALTER TABLE {table['name']} ADD FOREIGN KEY ({', '.join(foreign_key['columns'])}) "
+                             f"REFERENCES {foreign_key['references']}({', '.join(foreign_key['referenced_columns'])})"
+                             f"{' ' + foreign_key['options'] if foreign_key['options'] else ''};")
+        for table in self.tables.values():
+            lines.extend(index_statements(table))
+        lines.extend(["COMMIT;", "", "ANALYZE;", ""])
+        return "\n".join(lines)
+
+    def close(self):
+        """Write the load script."""
+        with open(os.path.join(self.directory, 'load.sql'), 'w', encoding='utf-8') as file:
+            file.write(self.load_script())
+        logger.info(f"Successfully wrote the PostgreSQL load script to {os.path.join(self.directory, 'load.sql')}")
@@ -0,0 +1,61 @@
+import datetime as dt
+import functools
+from typing import Any, Union
+
+import numpy as np
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_date_string(value: str) -> Union[dt.date, dt.datetime]:
+    """
+    Parse a date string, trying the fast ISO formats before falling back to dateparser.
+
+    ISO dates and datetimes are parsed with fromisoformat, other formats NumPy understands, e.g. '2024-01', with
+    datetime64. Only free-form input such as '1 March 2024' reaches dateparser, which is imported on first use.
+    Results are memoized, so repeated strings are parsed once.
+
+    Args:
+        value (str): The date string.
+
+    Returns:
+        Union[dt.date, dt.datetime]: A date for strings without a time, a datetime otherwise.
+    """
+    text = value.strip()
+    try:
+        return dt.date.fromisoformat(text)
+    except ValueError:
+        pass
+    try:
+        return dt.datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    try:
+        parsed = np.datetime64(text)
+        if np.isnat(parsed):
+            raise ValueError(f"Unable to parse date: {value}")
+        if np.datetime_data(parsed.dtype)[0] in ('Y', 'M', 'W', 'D'):
+            return parsed.astype('datetime64[D]').item()
+        return parsed.astype('datetime64[us]').item()
+    except ValueError:
+        pass
+
+    import dateparser
+    parsed = dateparser.parse(text)
+    if parsed is None:
+        raise ValueError(f"Unable to parse date: {value}")
+    return parsed
+
+
+def parse_date(value: Any) -> Any:
+    """
+    Parse a date given as a string, leaving dates, datetimes and other values unchanged.
+
+    Args:
+        value (Any): The value to parse.
+
+    Returns:
+        Any: The parsed date or datetime, or the value itself if it is not a string.
+    """
+    if isinstance(value, str):
+        return parse_date_string(value)
+    return value
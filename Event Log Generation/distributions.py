@@ -0,0 +1,151 @@
+import math
+from typing import Any, Optional
+
+import numpy as np
+
+# Rational approximation of the inverse standard normal CDF (P. J. Acklam), relative error below 1.2e-9
+ACKLAM_A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02, 1.383577518672690e+02,
+            -3.066479806614716e+01, 2.506628277459239e+00)
+ACKLAM_B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02, 6.680131188771972e+01,
+            -1.328068155288572e+01)
+ACKLAM_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00, -2.549732539343734e+00,
+            4.374664141464968e+00, 2.938163982698783e+00)
+ACKLAM_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00, 3.754408661907416e+00)
+ACKLAM_LOW = 0.02425
+
+# Shape of the distributions on the unit interval, matching the parameters of the scalar generators:
+# normal around the middle with six sigmas across the range, exponential with half the range as scale and
+# Lomax (Pareto II) with a quarter of the range as scale
+NORMAL_SIGMAS = 3.0
+EXPONENTIAL_SCALE = 0.5
+PARETO_SHAPE = 2.62
+PARETO_SCALE = 0.25
+
+
+def polynomial(coefficients: tuple, x: np.ndarray) -> np.ndarray:
+    """Evaluate a polynomial with the highest order coefficient first (Horner's scheme)."""
+    result = np.full_like(x, coefficients[0])
+    for coefficient in coefficients[1:]:
+        result = result * x + coefficient
+    return result
+
+
+def normal_cdf(x: float) -> float:
+    """Return the standard normal CDF of a scalar."""
+    return 0.5 * math.erfc(-x / math.sqrt(2.0))
+
+
+def normal_ppf(p: np.ndarray) -> np.ndarray:
+    """
+    Return the inverse standard normal CDF of many probabilities.
+
+    Args:
+        p (np.ndarray): Probabilities in (0, 1).
+
+    Returns:
+        np.ndarray: The standard normal quantiles.
+    """
+    p = np.asarray(p, dtype=np.float64)
+    result = np.empty_like(p)
+
+    low = p < ACKLAM_LOW
+    high = p > 1.0 - ACKLAM_LOW
+    central = ~(low | high)
+
+    q = p[central] - 0.5
+    r = q * q
+    result[central] = polynomial(ACKLAM_A, r) * q / (polynomial(ACKLAM_B, r) * r + 1.0)
+
+    tails = low | high
+    q = np.sqrt(-2.0 * np.log(np.where(low, p, 1.0 - p)[tails]))
+    tail_values = polynomial(ACKLAM_C, q) / (polynomial(ACKLAM_D, q) * q + 1.0)
+    result[tails] = np.where(low[tails], tail_values, -tail_values)
+    return result
+
+
+def sample_unit_fractions(distribution: str, num_values: int, rng: Any = None) -> np.ndarray:
+    """
+    Draw values on [0, 1] from a distribution truncated to the unit interval by inverse-CDF sampling.
+
+    Every draw maps one uniform value through the truncated inverse CDF, so no value is rejected or clipped and
+    a range [a, b] is covered by a + fraction * (b - a).
+
+    Args:
+        distribution (str): The distribution type ('uniform', 'normal', 'exponential', 'pareto').
+        num_values (int): Number of values to draw.
+        rng (Any, optional): Random source with the np.random interface. Defaults to np.random.
+
+    Returns:
+        np.ndarray: The drawn fractions.
+    """
+    rng = np.random if rng is None else rng
+    u = rng.uniform(0.0, 1.0, num_values)
+    if distribution == 'uniform':
+        return u
+    elif distribution == 'normal':
+        lower, upper = normal_cdf(-NORMAL_SIGMAS), normal_cdf(NORMAL_SIGMAS)
+        z = normal_ppf(np.clip(lower + u * (upper - lower), 1e-300, 1.0 - 1e-16))
+        return np.clip(0.5 + z / (2.0 * NORMAL_SIGMAS), 0.0, 1.0)
+    elif distribution == 'exponential':
+        mass = -math.expm1(-1.0 / EXPONENTIAL_SCALE)
+        return np.clip(-EXPONENTIAL_SCALE * np.log1p(-u * mass), 0.0, 1.0)
+    elif distribution == 'pareto':
+        mass = 1.0 - (1.0 + 1.0 / PARETO_SCALE) ** -PARETO_SHAPE
+        return np.clip(PARETO_SCALE * np.expm1(-np.log1p(-u * mass) / PARETO_SHAPE), 0.0, 1.0)
+    else:
+        raise ValueError(f"Unknown distribution: {distribution}")
+
+
+def sample_truncated(distribution: str, range_min: float, range_max: float, num_values: int,
+                     prev_value: Optional[float] = None, monotone: bool = False, rng: Any = None) -> np.ndarray:
+    """
+    Draw numeric values within [range_min, range_max] from a truncated distribution.
+
+    With prev_value, values are drawn within [prev_value, range_max]. A monotone sequence draws every value within
+    [previous value, range_max]; as the distributions only scale with the remaining range, the remaining gap of
+    value i is the first gap times the cumulative product of (1 - fraction), which chains the whole sequence at once.
+
+    Args:
+        distribution (str): The distribution type ('uniform', 'normal', 'exponential', 'pareto').
+        range_min (float): Minimum value.
+        range_max (float): Maximum value.
+        num_values (int): Number of values to draw.
+        prev_value (float, optional): The previous value the drawn values start from.
+        monotone (bool): Whether every value is chained on the one before it.
+        rng (Any, optional): Random source with the np.random interface. Defaults to np.random.
+
+    Returns:
+        np.ndarray: The drawn values.
+    """
+    lower = float(range_min) if prev_value is None else min(max(float(prev_value), float(range_min)),
+                                                            float(range_max))
+    upper = float(range_max)
+    fractions = sample_unit_fractions(distribution, num_values, rng)
+    if not monotone:
+        return lower + fractions * (upper - lower)
+    return upper - (upper - lower) * np.cumprod(1.0 - fractions)
+
+
+def sample_categories(categories: Any, num_values: int, weights: Optional[Any] = None, rng: Any = None) -> np.ndarray:
+    """
+    Draw categories, optionally weighted, by inverting the cumulative weights.
+
+    Args:
+        categories (Any): The categories to draw from.
+        num_values (int): Number of values to draw.
+        weights (Any, optional): Relative weight of every category. Categories are equally likely if not given.
+        rng (Any, optional): Random source with the np.random interface. Defaults to np.random.
+
+    Returns:
+        np.ndarray: An object array of the drawn categories.
+    """
+    categories = np.array(list(categories) + [None], dtype=object)[:-1]
+    rng = np.random if rng is None else rng
+    if weights is None:
+        return categories[rng.randint(0, len(categories), size=num_values)]
+    weights = np.asarray(weights, dtype=np.float64)
+    if len(weights) != len(categories) or (weights < 0).any() or weights.sum() <= 0:
+        raise ValueError("Weights must be non-negative, not all zero and given for every category.")
+    cumulative = np.cumsum(weights / weights.sum())
+    codes = np.searchsorted(cumulative, rng.uniform(0.0, 1.0, num_values), side='right')
+    return categories[np.minimum(codes, len(categories) - 1)]
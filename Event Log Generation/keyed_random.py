@@ -0,0 +1,157 @@
+import functools
+from typing import Any, Optional
+
+import numpy as np
+
+# Philox4x32-10 multipliers and Weyl key increments (Salmon et al., "Parallel random numbers: as easy as 1, 2, 3")
+PHILOX_M0 = np.uint64(0xD2511F53)
+PHILOX_M1 = np.uint64(0xCD9E8D57)
+PHILOX_W0 = np.uint64(0x9E3779B9)
+PHILOX_W1 = np.uint64(0xBB67AE85)
+PHILOX_ROUNDS = 10
+MASK_32 = np.uint64(0xFFFFFFFF)
+
+# Independent random streams of a case, each stream draws from its own key
+STREAM_CASE_DATES = 1
+STREAM_ACTIVITY_DURATIONS = 2
+STREAM_EVENT_DURATIONS = 3
+STREAM_CASE_ATTRIBUTES = 4
+STREAM_EVENT_ATTRIBUTES = 5
+STREAM_ACTIVITY_ATTRIBUTES = 6
+STREAM_OBJECT_ATTRIBUTES = 7
+STREAM_EVENT_OBJECTS = 8
+STREAM_OBJECT_RELATIONS = 9
+STREAM_CASE_VARIANTS = 10
+
+
+def philox4x32(counters: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    """
+    Apply the Philox4x32-10 bijection to many counters at once.
+
+    Args:
+        counters (np.ndarray): An (n, 4) array of 32-bit counter words.
+        keys (np.ndarray): An (n, 2) or (2,) array of 32-bit key words.
+
+    Returns:
+        np.ndarray: An (n, 4) uint32 array of random words.
+    """
+    counters = np.asarray(counters, dtype=np.uint64)
+    keys = np.broadcast_to(np.asarray(keys, dtype=np.uint64), (len(counters), 2))
+    c0, c1, c2, c3 = (counters[:, i].copy() for i in range(4))
+    k0, k1 = keys[:, 0].copy(), keys[:, 1].copy()
+    for round_number in range(PHILOX_ROUNDS):
+        if round_number:
+            k0 = (k0 + PHILOX_W0) & MASK_32
+            k1 = (k1 + PHILOX_W1) & MASK_32
+        product0 = PHILOX_M0 * c0
+        product1 = PHILOX_M1 * c2
+        c0, c1, c2, c3 = ((product1 >> np.uint64(32)) ^ c1 ^ k0, product1 & MASK_32,
+                          (product0 >> np.uint64(32)) ^ c3 ^ k1, product0 & MASK_32)
+    return np.stack([c0, c1, c2, c3], axis=1).astype(np.uint32)
+
+
+@functools.lru_cache(maxsize=None)
+def stream_key(seed: int, process_id: int, stream: int, substream: int = 0) -> np.ndarray:
+    """
+    Derive the Philox key of one random stream of a process.
+
+    Args:
+        seed (int): The seed of the whole log.
+        process_id (int): The process the stream belongs to.
+        stream (int): The stream, one of the STREAM_* constants.
+        substream (int): Splits a stream further, e.g. by attribute definition.
+
+    Returns:
+        np.ndarray: Two 32-bit key words.
+    """
+    entropy = [int(seed), int(process_id), int(stream), int(substream)]
+    key = np.random.SeedSequence(entropy).generate_state(2, dtype=np.uint32)
+    key.flags.writeable = False
+    return key
+
+
+class CaseRandom:
+    """
+    Counter-based random draws for many rows of different cases.
+
+    Row i draws from the key of (seed, process_ids[i], stream, substream) at the counter (case_ids[i], draws[i],
+    call), where call counts the draws made through this object. A row's values therefore only depend on its own
+    identifiers and any case can be regenerated alone. The methods mirror the np.random functions used by the generators, so an
+    instance can be passed wherever np.random is used otherwise.
+    """
+
+    def __init__(self, seed: int, stream: int, process_ids: Any, case_ids: Any, draws: Any = 0, substream: int = 0):
+        case_ids = np.asarray(case_ids, dtype=np.int64)
+        process_ids, draws = np.broadcast_arrays(np.asarray(process_ids, dtype=np.int64), np.asarray(draws),
+                                                 case_ids)[:2]
+        self.size = len(case_ids)
+        unique_process_ids, process_index = np.unique(process_ids, return_inverse=True)
+        keys = np.array([stream_key(seed, process_id, stream, substream) for process_id in unique_process_ids],
+                        dtype=np.uint32).reshape(-1, 2)
+        self._keys = keys[process_index.reshape(-1)]
+        case_words = case_ids.astype(np.uint64)
+        self._counters = np.zeros((self.size, 4), dtype=np.uint64)
+        self._counters[:, 0] = case_words & MASK_32
+        self._counters[:, 1] = case_words >> np.uint64(32)
+        self._counters[:, 2] = np.asarray(draws, dtype=np.uint64) & MASK_32
+        self._calls = 0
+
+    def _check_size(self, size: Optional[Any]):
+        if size is not None and np.prod(size) != self.size:
+            raise ValueError(f"Keyed draws have one value per row, expected size {self.size}, got {size}.")
+
+    def _uniform_pair(self):
+        """Draw two independent uniform values in [0, 1) per row."""
+        self._counters[:, 3] = self._calls
+        self._calls += 1
+        words = philox4x32(self._counters, self._keys).astype(np.uint64)
+        scale = 1.0 / 9007199254740992.0  # 2 ** -53
+        first = ((words[:, 0] >> np.uint64(5)) * np.uint64(67108864) + (words[:, 1] >> np.uint64(6))) * scale
+        second = ((words[:, 2] >> np.uint64(5)) * np.uint64(67108864) + (words[:, 3] >> np.uint64(6))) * scale
+        return first, second
+
+    def random(self, size: Optional[Any] = None) -> np.ndarray:
+        self._check_size(size)
+        return self._uniform_pair()[0]
+
+    def uniform(self, low: Any = 0.0, high: Any = 1.0, size: Optional[Any] = None) -> np.ndarray:
+        return low + (np.asarray(high) - low) * self.random(size)
+
+    def randint(self, low: Any, high: Any = None, size: Optional[Any] = None) -> np.ndarray:
+        if high is None:
+            low, high = 0, low
+        low = np.asarray(low, dtype=np.int64)
+        span = (np.asarray(high, dtype=np.int64) - low).astype(np.float64)
+        return low + np.minimum(np.floor(self.random(size) * span), span - 1).astype(np.int64)
+
+    def normal(self, loc: Any = 0.0, scale: Any = 1.0, size: Optional[Any] = None) -> np.ndarray:
+        self._check_size(size)
+        first, second = self._uniform_pair()
+        return loc + np.asarray(scale) * np.sqrt(-2.0 * np.log1p(-first)) * np.cos(2.0 * np.pi * second)
+
+    def exponential(self, scale: Any = 1.0, size: Optional[Any] = None) -> np.ndarray:
+        return -np.asarray(scale) * np.log1p(-self.random(size))
+
+    def pareto(self, a: Any, size: Optional[Any] = None) -> np.ndarray:
+        return np.expm1(-np.log1p(-self.random(size)) / np.asarray(a))
+
+
+def case_random(seed: Optional[int], stream: int, process_ids: Any, case_ids: Any, draws: Any = 0,
+                substream: int = 0) -> Any:
+    """
+    Get the random source for rows of many cases.
+
+    Args:
+        seed (int, optional): The seed of the whole log.
+        stream (int): The stream, one of the STREAM_* constants.
+        process_ids (Any): The process ID of each row.
+        case_ids (Any): The case ID of each row.
+        draws (Any): The position of each row's draw within its case, e.g. the step of an activity instance.
+        substream (int): Splits the stream further, e.g. by attribute definition.
+
+    Returns:
+        Any: A CaseRandom, or the global np.random state if no seed is set.
+    """
+    if seed is None:
+        return np.random
+    return CaseRandom(seed, stream, process_ids, case_ids, draws, substream)
@@ -0,0 +1,48 @@
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module on first attribute access instead of right away.
+
+    Heavy dependencies such as pandas are only needed by the generation stages, so deferring them keeps the
+    startup of the command line and of worker processes short. A module that is already imported is returned as is.
+
+    Args:
+        name (str): The name of the module, e.g. 'pandas'.
+
+    Returns:
+        ModuleType: The module, loaded when one of its attributes is first used.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def import_optional(name: str, purpose: str) -> ModuleType:
+    """
+    Import an optional dependency, explaining which feature needs it if it is not installed.
+
+    Args:
+        name (str): The name of the module, e.g. 'pyarrow'.
+        purpose (str): The feature that needs the module, e.g. 'Parquet output'.
+
+    Returns:
+        ModuleType: The imported module.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise ImportError(f"{purpose} requires the optional package '{name}', install it with "
+                          f"'pip install {name}'.") from e
@@ -0,0 +1,47 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+# Directory of the generator modules, imported as top-level modules like the command line does
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Seconds importing Event_Log_Generation may take, without the interpreter startup
+IMPORT_TIME_BUDGET = 0.5
+
+# Dependencies that must only be loaded once a generation stage or an output needs them
+DEFERRED_MODULES = ['pandas', 'pyarrow', 'faker', 'dateparser']
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import Event_Log_Generation
+seconds = time.perf_counter() - start
+loaded = [name for name in {modules!r}
+          if name in sys.modules and type(sys.modules[name]).__name__ != '_LazyModule']
+print(json.dumps({{'seconds': seconds, 'loaded': loaded}}))
+"""
+
+
+def import_generator() -> dict:
+    """Import Event_Log_Generation in a fresh interpreter and report the import time and loaded dependencies."""
+    result = subprocess.run([sys.executable, '-c', IMPORT_SCRIPT.format(modules=DEFERRED_MODULES)],
+                            cwd=PACKAGE_DIR, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class ImportTimeTest(unittest.TestCase):
+
+    def test_heavy_dependencies_are_deferred(self):
+        self.assertEqual(import_generator()['loaded'], [])
+
+    def test_import_time_budget(self):
+        # The fastest of a few runs, so a busy machine does not fail the budget
+        seconds = min(import_generator()['seconds'] for _ in range(3))
+        self.assertLess(seconds, IMPORT_TIME_BUDGET,
+                        f"Importing Event_Log_Generation took {seconds:.2f} s, the budget is {IMPORT_TIME_BUDGET} s")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+import functools
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Optional
+
+import numpy as np
+
+from cache_files import atomic_write
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# Faker provider of every pooled attribute type
+POOL_PROVIDERS = {
+    'Character': 'word',
+    'Company': 'company',
+    'PhoneNumber': 'phone_number',
+    'Email': 'email',
+    'Address': 'address',
+    'Geo': 'latlng',
+}
+RESOURCE_PROVIDERS = {
+    'human': ('name', {}),
+    'machine': ('bothify', {'text': 'Machine-####'}),
+}
+# Increment when the way pools are generated changes, so stale disk caches are not reused
+POOL_FORMAT_VERSION = 1
+
+value_pool_options = {'locale': 'en_US', 'pool_size': 1000, 'cache_dir': None}
+
+
+def configure_value_pools(locale: Optional[str] = None, pool_size: Optional[int] = None,
+                          cache_dir: Optional[str] = None):
+    """
+    Set the locale, size and disk cache directory of the value pools.
+
+    Args:
+        locale (str, optional): Faker locale of the pooled values.
+        pool_size (int, optional): Number of values per pool. Resource pools use their resource_count instead.
+        cache_dir (str, optional): Directory of the pool cache. Caching is disabled if not given.
+    """
+    if locale:
+        value_pool_options['locale'] = locale
+    if pool_size:
+        value_pool_options['pool_size'] = int(pool_size)
+    value_pool_options['cache_dir'] = cache_dir
+
+
+def format_pool_value(value: Any) -> str:
+    """Format a Faker value as the string stored in a pool, e.g. a (latitude, longitude) tuple."""
+    if isinstance(value, tuple):
+        return ', '.join(str(part) for part in value)
+    return str(value)
+
+
+def build_value_pool(provider: str, size: int, locale: str, unique: bool = False, **provider_args) -> np.ndarray:
+    """
+    Generate the values of a pool with Faker, seeded from the pool definition.
+
+    Args:
+        provider (str): Name of the Faker provider, e.g. 'company'.
+        size (int): Number of values.
+        locale (str): Faker locale.
+        unique (bool): Whether the values have to be distinct, e.g. the names of resources.
+        **provider_args: Arguments of the provider.
+
+    Returns:
+        np.ndarray: An object array of string values.
+    """
+    from faker import Faker
+
+    faker = Faker(locale)
+    definition = json.dumps([provider, size, locale, unique, provider_args], sort_keys=True)
+    faker.seed_instance(int(hashlib.sha256(definition.encode()).hexdigest()[:16], 16))
+    source = faker.unique if unique else faker
+    values = [format_pool_value(getattr(source, provider)(**provider_args)) for _ in range(size)]
+    return np.array(values, dtype=object)
+
+
+@functools.lru_cache(maxsize=None)
+def load_value_pool(provider: str, size: int, locale: str, unique: bool = False, cache_dir: Optional[str] = None,
+                    provider_args: str = '{}') -> np.ndarray:
+    """
+    Return a value pool, loading it from the disk cache when the same pool was generated before.
+
+    The cache key includes the Faker version, as another version may generate other values from the same seed.
+
+    Args:
+        provider (str): Name of the Faker provider, e.g. 'company'.
+        size (int): Number of values.
+        locale (str): Faker locale.
+        unique (bool): Whether the values have to be distinct.
+        cache_dir (str, optional): Directory of the pool cache. Caching is disabled if not given.
+        provider_args (str): Arguments of the provider as a JSON object.
+
+    Returns:
+        np.ndarray: An object array of string values.
+    """
+    args = json.loads(provider_args)
+    cache_file = None
+    if cache_dir:
+        from faker import VERSION as faker_version
+
+        key = json.dumps([POOL_FORMAT_VERSION, faker_version, provider, size, locale, unique, args], sort_keys=True)
+        cache_file = os.path.join(cache_dir, f"pool_{hashlib.sha256(key.encode()).hexdigest()[:24]}.json")
+        if os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as file:
+                    values = json.load(file)
+                if len(values) == size:
+                    return np.array(values, dtype=object)
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable value pool cache file {cache_file}: {e}")
+
+    values = build_value_pool(provider, size, locale, unique, **args)
+    if cache_file:
+        try:
+            with atomic_write(cache_file, 'w', encoding='utf-8') as file:
+                json.dump(values.tolist(), file)
+        except OSError as e:
+            logger.warning(f"Could not write value pool cache file {cache_file}: {e}")
+    return values
+
+
+def get_value_pool(attribute_type: str, resource_type: Optional[str] = None,
+                   resource_count: Optional[int] = None) -> np.ndarray:
+    """
+    Return the value pool of an attribute type with the configured locale, size and cache.
+
+    Args:
+        attribute_type (str): A pooled attribute type, see POOL_PROVIDERS, or 'Resource'.
+        resource_type (str, optional): The type of resource ('human', 'machine') of a 'Resource' attribute.
+        resource_count (int, optional): The number of distinct resources of a 'Resource' attribute.
+
+    Returns:
+        np.ndarray: An object array of string values.
+    """
+    locale, cache_dir = value_pool_options['locale'], value_pool_options['cache_dir']
+    if attribute_type == 'Resource':
+        if resource_type not in RESOURCE_PROVIDERS:
+            raise ValueError(f"Unknown resource type: {resource_type}")
+        provider, args = RESOURCE_PROVIDERS[resource_type]
+        return load_value_pool(provider, int(resource_count or 1), locale, True, cache_dir, json.dumps(args))
+    if attribute_type not in POOL_PROVIDERS:
+        raise ValueError(f"Attribute type {attribute_type} has no value pool")
+    return load_value_pool(POOL_PROVIDERS[attribute_type], value_pool_options['pool_size'], locale, False, cache_dir)
+
+
+def sample_value_pool(attribute_type: str, num_values: int, rng: Any = None, resource_type: Optional[str] = None,
+                      resource_count: Optional[int] = None) -> np.ndarray:
+    """
+    Draw values of an attribute type from its pool with a single index gather.
+
+    Args:
+        attribute_type (str): A pooled attribute type, see POOL_PROVIDERS, or 'Resource'.
+        num_values (int): Number of values to draw.
+        rng (Any, optional): Random source with the np.random interface. Defaults to np.random.
+        resource_type (str, optional): The type of resource of a 'Resource' attribute.
+        resource_count (int, optional): The number of distinct resources of a 'Resource' attribute.
+
+    Returns:
+        np.ndarray: An object array of the drawn values.
+    """
+    pool = get_value_pool(attribute_type, resource_type, resource_count)
+    rng = np.random if rng is None else rng
+    return pool[rng.randint(0, len(pool), size=num_values)]
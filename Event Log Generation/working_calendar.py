@@ -0,0 +1,450 @@
+import abc
+import functools
+import hashlib
+import json
+import logging
+import os
+import zipfile
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from cache_files import atomic_write
+from lazy_modules import lazy_import
+
+pd = lazy_import('pandas')
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+NS_PER_MILLISECOND = 1_000_000
+NS_PER_SECOND = 1000 * NS_PER_MILLISECOND
+NS_PER_MINUTE = 60 * NS_PER_SECOND
+NS_PER_HOUR = 60 * NS_PER_MINUTE
+NS_PER_DAY = 24 * NS_PER_HOUR
+NS_PER_WEEK = 7 * NS_PER_DAY
+# 1970-01-01 was a Thursday, shifting epoch timestamps by three days makes weeks start on Monday
+EPOCH_MONDAY_OFFSET = 3 * NS_PER_DAY
+
+DAYS_MAP = {
+    'Monday': 0, 'Tuesday': 1, 'Wednesday': 2, 'Thursday': 3, 'Friday': 4,
+    'Saturday': 5, 'Sunday': 6, 'workdays': [0, 1, 2, 3, 4], 'weekend': [5, 6],
+    'Mon': 0, 'Tue': 1, 'Wed': 2, 'Thu': 3, 'Fri': 4, 'Sat': 5, 'Sun': 6
+}
+
+
+def convert_working_schedule_days(days: List[str]) -> List[int]:
+    """
+    Convert a list of working days from string format to datetime weekday format.
+
+    Args:
+        days (list): List of working days in string format.
+
+    Returns:
+        list: List of working days in datetime weekday format.
+    """
+    if not days:
+        return []
+    if isinstance(days, (list, tuple)):
+        try:
+            converted_days = [DAYS_MAP[day] if isinstance(day, str) else day for day in days]
+            flattened_days = [item for sublist in converted_days for item in
+                              (sublist if isinstance(sublist, list) else [sublist])]
+            return sorted(set(flattened_days))  # Remove duplicates
+        except KeyError as e:
+            logger.error(f"Unrecognized day in working schedule: {e}")
+            return []
+    return []
+
+
+def normalize_working_shifts(working_hours: Sequence[Any]) -> Tuple[Tuple[float, float], ...]:
+    """
+    Normalize working hours to a sorted tuple of non-overlapping (start hour, end hour) shifts.
+
+    Args:
+        working_hours (Sequence[Any]): Either a single [start, end] range or a list of such ranges, one per shift.
+            A range with a single value means until the end of the day.
+
+    Returns:
+        Tuple[Tuple[float, float], ...]: The normalized shifts, empty if no valid shift is given.
+    """
+    if not working_hours:
+        return ()
+    shift_list = working_hours if isinstance(working_hours[0], (list, tuple)) else [working_hours]
+
+    shifts = []
+    for shift in shift_list:
+        shift = sorted(shift)  # Ensure working hours are in order
+        if len(shift) == 1:
+            shift = [shift[0], 24]  # Assume end of the day if only start is given
+        if shift[1] - shift[0] <= 0:
+            logger.error("Invalid working hours range")
+            continue
+        shifts.append((float(shift[0]), float(shift[1])))
+
+    merged = []
+    for start, end in sorted(shifts):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return tuple(merged)
+
+
+class WorkingCalendar(abc.ABC):
+    """
+    Base class for compiled working calendars.
+
+    Subclasses map timestamps to working time and back, adjusting whole arrays of start and end times at once.
+    """
+
+    @abc.abstractmethod
+    def next_working_time(self, timestamps: np.ndarray) -> np.ndarray:
+        """Move each timestamp forward to the next working instant, leaving working instants unchanged."""
+
+    @abc.abstractmethod
+    def add_working_time(self, timestamps: np.ndarray, durations: np.ndarray) -> np.ndarray:
+        """Return the timestamps after the given working durations in nanoseconds have passed."""
+
+    def adjust(self, start_dates: np.ndarray, end_dates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Adjust start and end times so that they fit within the working schedule.
+
+        The start moves to the next working instant and the end is placed so the working time between them equals
+        the original duration.
+
+        Args:
+            start_dates (np.ndarray): Original start times as datetime64[ns].
+            end_dates (np.ndarray): Original end times as datetime64[ns].
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Adjusted start and end times as datetime64[ns].
+        """
+        starts = np.asarray(start_dates, dtype='datetime64[ns]').astype(np.int64)
+        durations = np.asarray(end_dates, dtype='datetime64[ns]').astype(np.int64) - starts
+        starts = self.next_working_time(starts)
+        ends = self.add_working_time(starts, durations)
+        return starts.astype('datetime64[ns]'), ends.astype('datetime64[ns]')
+
+
+class WeeklyCalendar(WorkingCalendar):
+    """
+    A working calendar that repeats every week, compiled into a sorted table of working windows.
+
+    Working time is measured as the number of working nanoseconds since the Monday before the epoch. Converting
+    a timestamp to working time and back only needs a week division and a search in the window table, so adding a
+    working duration costs the same regardless of how many days or weeks it spans.
+    """
+
+    def __init__(self, windows: np.ndarray):
+        """
+        Args:
+            windows (np.ndarray): Sorted, non-overlapping (start, end) offsets in nanoseconds from Monday 00:00.
+        """
+        self.window_starts = windows[:, 0].astype(np.int64)
+        self.window_ends = windows[:, 1].astype(np.int64)
+        self.cumulative_after = np.cumsum(self.window_ends - self.window_starts)
+        self.cumulative_before = self.cumulative_after - (self.window_ends - self.window_starts)
+        self.week_total = int(self.cumulative_after[-1])
+        # Sentinel window after the end of the week so positions past the last window need no special case
+        self._padded_starts = np.append(self.window_starts, NS_PER_WEEK)
+        self._padded_before = np.append(self.cumulative_before, self.week_total)
+
+    def working_time_at(self, timestamps: np.ndarray) -> np.ndarray:
+        """
+        Convert timestamps to the amount of working time elapsed since the calendar origin.
+
+        Args:
+            timestamps (np.ndarray): Timestamps as int64 nanoseconds since the epoch.
+
+        Returns:
+            np.ndarray: Working nanoseconds elapsed up to each timestamp.
+        """
+        week, position = np.divmod(timestamps + EPOCH_MONDAY_OFFSET, NS_PER_WEEK)
+        index = np.searchsorted(self.window_ends, position, side='right')
+        lengths = np.append(self.window_ends - self.window_starts, 0)[index]
+        inside = np.clip(position - self._padded_starts[index], 0, lengths)
+        return week * self.week_total + self._padded_before[index] + inside
+
+    def timestamp_at(self, working_time: np.ndarray, snap_forward: bool = True) -> np.ndarray:
+        """
+        Convert working time back to timestamps.
+
+        Args:
+            working_time (np.ndarray): Working nanoseconds elapsed since the calendar origin.
+            snap_forward (bool): Whether a position on a window boundary maps to the start of the next window
+                (used for start times) instead of the end of the previous one (used for end times).
+
+        Returns:
+            np.ndarray: Timestamps as int64 nanoseconds since the epoch.
+        """
+        week, remainder = np.divmod(working_time, self.week_total)
+        if snap_forward:
+            index = np.searchsorted(self.cumulative_after, remainder, side='right')
+        else:
+            at_week_start = remainder == 0
+            week = np.where(at_week_start, week - 1, week)
+            remainder = np.where(at_week_start, self.week_total, remainder)
+            index = np.searchsorted(self.cumulative_after, remainder, side='left')
+        position = self.window_starts[index] + (remainder - self.cumulative_before[index])
+        return week * NS_PER_WEEK + position - EPOCH_MONDAY_OFFSET
+
+    def next_working_time(self, timestamps: np.ndarray) -> np.ndarray:
+        """
+        Move timestamps forward to the next instant inside a working window.
+
+        Args:
+            timestamps (np.ndarray): Timestamps as int64 nanoseconds since the epoch.
+
+        Returns:
+            np.ndarray: The adjusted timestamps.
+        """
+        return self.timestamp_at(self.working_time_at(timestamps), snap_forward=True)
+
+    def add_working_time(self, timestamps: np.ndarray, durations: np.ndarray) -> np.ndarray:
+        """
+        Add working durations to timestamps, skipping all non-working time.
+
+        Args:
+            timestamps (np.ndarray): Timestamps as int64 nanoseconds since the epoch.
+            durations (np.ndarray): Working durations in nanoseconds.
+
+        Returns:
+            np.ndarray: The timestamps after the given amount of working time has passed.
+        """
+        end = self.timestamp_at(self.working_time_at(timestamps) + np.maximum(durations, 0), snap_forward=False)
+        return np.maximum(end, timestamps)
+
+
+class IntervalCalendar(WorkingCalendar):
+    """
+    A working calendar precomputed over a date horizon into a sorted array of working intervals.
+
+    Unlike the weekly calendar it can skip holidays and place shifts in a local timezone, including daylight saving
+    changes. Timestamps are UTC and lookups are a single searchsorted over the interval ends or the cumulative
+    working time. Lookups past the horizon transparently use a calendar compiled over a longer horizon.
+    """
+
+    def __init__(self, definition: Tuple, interval_starts: np.ndarray, interval_ends: np.ndarray):
+        """
+        Args:
+            definition (Tuple): The arguments of compile_interval_calendar that produced the intervals.
+            interval_starts (np.ndarray): Sorted interval starts as int64 nanoseconds since the epoch.
+            interval_ends (np.ndarray): Matching interval ends as int64 nanoseconds since the epoch.
+        """
+        self.definition = definition
+        self.interval_starts = interval_starts
+        self.interval_ends = interval_ends
+        lengths = interval_ends - interval_starts
+        self.cumulative_after = np.cumsum(lengths)
+        self.cumulative_before = self.cumulative_after - lengths
+        self.total = int(self.cumulative_after[-1]) if len(lengths) else 0
+        self._lengths = np.append(lengths, 0)
+        self._padded_starts = np.append(interval_starts, np.iinfo(np.int64).max)
+        self._padded_before = np.append(self.cumulative_before, self.total)
+
+    def _extended(self) -> 'IntervalCalendar':
+        """
+        Return the same calendar compiled over a horizon twice as long.
+        """
+        working_days, shifts, holidays, timezone, horizon_start, horizon_end, cache_dir = self.definition
+        span = np.datetime64(horizon_end, 'D') - np.datetime64(horizon_start, 'D')
+        new_end = str(np.datetime64(horizon_end, 'D') + span)
+        logger.info(f"Extending working calendar horizon to {new_end}")
+        return compile_interval_calendar(working_days, shifts, holidays, timezone, horizon_start, new_end, cache_dir)
+
+    def working_time_at(self, timestamps: np.ndarray) -> np.ndarray:
+        """
+        Convert timestamps to the amount of working time elapsed since the start of the horizon.
+
+        Args:
+            timestamps (np.ndarray): Timestamps as int64 nanoseconds since the epoch.
+
+        Returns:
+            np.ndarray: Working nanoseconds elapsed up to each timestamp.
+        """
+        index = np.searchsorted(self.interval_ends, timestamps, side='right')
+        inside = np.clip(timestamps - self._padded_starts[index], 0, self._lengths[index])
+        return self._padded_before[index] + inside
+
+    def timestamp_at(self, working_time: np.ndarray, snap_forward: bool = True) -> np.ndarray:
+        """
+        Convert working time back to timestamps. The working time must lie within the horizon.
+
+        Args:
+            working_time (np.ndarray): Working nanoseconds elapsed since the start of the horizon.
+            snap_forward (bool): Whether a position on an interval boundary maps to the start of the next interval
+                (used for start times) instead of the end of the previous one (used for end times).
+
+        Returns:
+            np.ndarray: Timestamps as int64 nanoseconds since the epoch.
+        """
+        index = np.searchsorted(self.cumulative_after, working_time, side='right' if snap_forward else 'left')
+        return self.interval_starts[index] + (working_time - self.cumulative_before[index])
+
+    def next_working_time(self, timestamps: np.ndarray) -> np.ndarray:
+        """
+        Move timestamps forward to the next instant inside a working interval.
+
+        Args:
+            timestamps (np.ndarray): Timestamps as int64 nanoseconds since the epoch.
+
+        Returns:
+            np.ndarray: The adjusted timestamps.
+        """
+        working_time = self.working_time_at(timestamps)
+        if working_time.size and working_time.max() >= self.total:
+            return self._extended().next_working_time(timestamps)
+        return self.timestamp_at(working_time, snap_forward=True)
+
+    def add_working_time(self, timestamps: np.ndarray, durations: np.ndarray) -> np.ndarray:
+        """
+        Add working durations to timestamps, skipping all non-working time and holidays.
+
+        Args:
+            timestamps (np.ndarray): Timestamps as int64 nanoseconds since the epoch.
+            durations (np.ndarray): Working durations in nanoseconds.
+
+        Returns:
+            np.ndarray: The timestamps after the given amount of working time has passed.
+        """
+        working_time = self.working_time_at(timestamps) + np.maximum(durations, 0)
+        if working_time.size and working_time.max() > self.total:
+            return self._extended().add_working_time(timestamps, durations)
+        return np.maximum(self.timestamp_at(working_time, snap_forward=False), timestamps)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_weekly_calendar(working_days: Tuple[int, ...], shifts: Tuple[Tuple[float, float], ...]) -> WeeklyCalendar:
+    """
+    Compile a weekly calendar from weekday numbers and daily shifts.
+
+    Args:
+        working_days (Tuple[int, ...]): Working days in datetime weekday format.
+        shifts (Tuple[Tuple[float, float], ...]): Normalized (start hour, end hour) shifts.
+
+    Returns:
+        WeeklyCalendar: The compiled calendar.
+    """
+    windows = np.array([(day * NS_PER_DAY + int(start * NS_PER_HOUR), day * NS_PER_DAY + int(end * NS_PER_HOUR))
+                        for day in sorted(working_days) for start, end in shifts], dtype=np.int64)
+    return WeeklyCalendar(windows)
+
+
+def build_working_intervals(working_days: Tuple[int, ...], shifts: Tuple[Tuple[float, float], ...],
+                            holidays: Tuple[str, ...], timezone: str, horizon_start: str,
+                            horizon_end: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the sorted UTC working intervals of a schedule over a horizon of local dates.
+
+    Args:
+        working_days (Tuple[int, ...]): Working days in datetime weekday format.
+        shifts (Tuple[Tuple[float, float], ...]): Normalized (start hour, end hour) shifts in local time.
+        holidays (Tuple[str, ...]): ISO dates without working time.
+        timezone (str): IANA timezone name of the local working time.
+        horizon_start (str): First local date of the horizon (ISO format).
+        horizon_end (str): Last local date of the horizon (ISO format).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Interval starts and ends as int64 nanoseconds since the epoch.
+    """
+    dates = np.arange(np.datetime64(horizon_start, 'D'), np.datetime64(horizon_end, 'D') + 1)
+    weekdays = (dates.astype(np.int64) + 3) % 7
+    keep = np.isin(weekdays, working_days) & ~np.isin(dates, np.array(holidays, dtype='datetime64[D]'))
+    day_starts = dates[keep].astype('datetime64[ns]').astype(np.int64)
+
+    offsets = np.array([[int(start * NS_PER_HOUR), int(end * NS_PER_HOUR)] for start, end in shifts],
+                       dtype=np.int64)
+    local_starts = (day_starts[:, None] + offsets[None, :, 0]).ravel()
+    local_ends = (day_starts[:, None] + offsets[None, :, 1]).ravel()
+
+    if timezone and timezone != 'UTC':
+        local_starts, local_ends = (
+            pd.DatetimeIndex(values.astype('datetime64[ns]'))
+            .tz_localize(timezone, ambiguous=np.ones(len(values), dtype=bool), nonexistent='shift_forward')
+            .tz_convert('UTC').tz_localize(None).asi8
+            for values in (local_starts, local_ends)
+        )
+
+    valid = local_ends > local_starts
+    return local_starts[valid], local_ends[valid]
+
+
+@functools.lru_cache(maxsize=None)
+def compile_interval_calendar(working_days: Tuple[int, ...], shifts: Tuple[Tuple[float, float], ...],
+                              holidays: Tuple[str, ...], timezone: str, horizon_start: str, horizon_end: str,
+                              cache_dir: Optional[str] = None) -> IntervalCalendar:
+    """
+    Compile an interval calendar, loading it from the disk cache when the same definition was compiled before.
+
+    Args:
+        working_days (Tuple[int, ...]): Working days in datetime weekday format.
+        shifts (Tuple[Tuple[float, float], ...]): Normalized (start hour, end hour) shifts in local time.
+        holidays (Tuple[str, ...]): ISO dates without working time.
+        timezone (str): IANA timezone name of the local working time.
+        horizon_start (str): First local date of the horizon (ISO format).
+        horizon_end (str): Last local date of the horizon (ISO format).
+        cache_dir (str, optional): Directory of the compiled calendar cache. Caching is disabled if not given.
+
+    Returns:
+        IntervalCalendar: The compiled calendar.
+    """
+    definition = (working_days, shifts, holidays, timezone, horizon_start, horizon_end, cache_dir)
+    cache_file = None
+    if cache_dir:
+        key = json.dumps([list(working_days), [list(shift) for shift in shifts], list(holidays), timezone,
+                          horizon_start, horizon_end])
+        cache_file = os.path.join(cache_dir, f"calendar_{hashlib.sha256(key.encode()).hexdigest()[:24]}.npz")
+        if os.path.exists(cache_file):
+            try:
+                with np.load(cache_file) as cached:
+                    return IntervalCalendar(definition, cached['starts'], cached['ends'])
+            except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile) as e:
+                logger.warning(f"Ignoring unreadable calendar cache file {cache_file}, rebuilding it: {e}")
+
+    starts, ends = build_working_intervals(working_days, shifts, holidays, timezone, horizon_start, horizon_end)
+    if cache_file:
+        try:
+            # Written to a temporary file first, so concurrent readers never load a half-written calendar
+            with atomic_write(cache_file, 'wb') as file:
+                np.savez(file, starts=starts, ends=ends)
+        except OSError as e:
+            logger.warning(f"Could not write calendar cache file {cache_file}: {e}")
+    return IntervalCalendar(definition, starts, ends)
+
+
+def get_working_calendar(working_days: List[str], working_hours: List[Any], holidays: Optional[List[Any]] = None,
+                         timezone: Optional[str] = None, start_date: Any = None, end_date: Any = None,
+                         cache_dir: Optional[str] = None, padding_days: int = 366) -> Optional[WorkingCalendar]:
+    """
+    Return the compiled calendar for a working schedule, compiling it on first use.
+
+    Schedules without holidays in UTC repeat every week and use the closed-form weekly calendar. Otherwise the
+    schedule is precomputed over start_date..end_date, padded by padding_days, into an interval calendar.
+
+    Args:
+        working_days (list): List of working days in string format.
+        working_hours (list): Start and end working hours, or a list of such ranges for multiple shifts per day.
+        holidays (list, optional): Dates without working time.
+        timezone (str, optional): IANA timezone name of the working hours. Defaults to UTC.
+        start_date (Any, optional): First date of the horizon of the interval calendar.
+        end_date (Any, optional): Last date of the horizon of the interval calendar.
+        cache_dir (str, optional): Directory of the compiled calendar cache.
+        padding_days (int): Number of days the horizon extends past end_date.
+
+    Returns:
+        Optional[WorkingCalendar]: The compiled calendar, or None if the schedule does not restrict working time.
+    """
+    days = convert_working_schedule_days(working_days)
+    shifts = normalize_working_shifts(working_hours)
+    if not days or not shifts:
+        return None
+    if not holidays and (not timezone or timezone == 'UTC'):
+        return compile_weekly_calendar(tuple(days), shifts)
+
+    today = pd.Timestamp.today().normalize()
+    horizon_start = (pd.Timestamp(start_date) if start_date is not None else today) - pd.Timedelta(days=7)
+    horizon_end = (pd.Timestamp(end_date) if end_date is not None else today) + pd.Timedelta(days=padding_days)
+    holiday_dates = tuple(sorted({pd.Timestamp(holiday).date().isoformat() for holiday in holidays or []}))
+    return compile_interval_calendar(tuple(days), shifts, holiday_dates, timezone or 'UTC',
+                                     horizon_start.date().isoformat(), horizon_end.date().isoformat(), cache_dir)